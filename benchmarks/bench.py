@@ -0,0 +1,214 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+from panda3d.core import Point3
+
+from ..clock import ManualClock
+from ..ease import Ease
+from ..tween import Tween
+
+
+# In the upper directory of pytweener, run the benchmarks with the following command.
+# python -m pytweener.benchmarks.bench --output result.json
+# To check for regressions against a stored result, add --compare baseline.json.
+
+
+EASE_FUNCTIONS = [name for name, attr in vars(Ease).items() if isinstance(attr, staticmethod)]
+
+ENDPOINTS = {
+    'float': lambda: (0.0, 100.0),
+    'ndarray': lambda: (np.zeros(3), np.full(3, 100.0)),
+    'Point3': lambda: (Point3(0, 0, 0), Point3(100, 100, 100)),
+}
+
+TWEEN_COUNTS = [1, 1000, 100000]
+
+
+def best_time(stmt, number, repeat, namespace):
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=repeat, number=number))
+
+
+def bench_ease(samples=1000, number=20, repeat=5):
+    """Return ns per call of each function in the Ease class.
+    """
+    xs = np.linspace(0, 1, samples).tolist()
+    results = {}
+
+    for name in EASE_FUNCTIONS:
+        namespace = {'func': getattr(Ease, name), 'xs': xs}
+        elapsed = best_time('for x in xs: func(x)', number, repeat, namespace)
+        results[f'ease.{name}'] = dict(value=elapsed / (number * samples) * 1e9, unit='ns/call')
+
+    return results
+
+
+def bench_tween(kind, count, frames, repeat=3):
+    """Return the number of Tween.update calls per second.
+    """
+    clock = ManualClock(step=1 / 60)
+    tweens = []
+
+    for _ in range(count):
+        start, end = ENDPOINTS[kind]()
+        tween = Tween(start, end, 2, yoyo=True, easing_type='in_out_quad', clock=clock)
+        tween.loop()
+        tweens.append(tween)
+
+    best = float('inf')
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+
+        for _ in range(frames):
+            now = clock.tick()
+
+            for tween in tweens:
+                tween.update(now)
+
+        best = min(best, time.perf_counter() - start_time)
+
+    return count * frames / best
+
+
+def bench_tweens(counts=TWEEN_COUNTS, updates=100000):
+    results = {}
+
+    for kind in ENDPOINTS:
+        for count in counts:
+            frames = max(1, updates // count)
+            value = bench_tween(kind, count, frames)
+            results[f'tween.{kind}.{count}'] = dict(value=value, unit='updates/s')
+
+    return results
+
+
+def bench_memory(kind, count):
+    """Return the bytes allocated per Tween instance, including the objects it creates
+       until the first update, measured by tracemalloc.
+    """
+    endpoints = [ENDPOINTS[kind]() for _ in range(count)]
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tweens = [Tween(start, end, 2, easing_type='in_out_quad') for start, end in endpoints]
+
+        for tween in tweens:
+            tween.start(now=0)
+            tween.update(now=1)
+
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def bench_memories(count=10000):
+    results = {}
+
+    for kind in ENDPOINTS:
+        results[f'memory.{kind}'] = dict(value=bench_memory(kind, count), unit='bytes/tween')
+
+    return results
+
+
+def run(quick=False):
+    if quick:
+        results = bench_ease(samples=100, number=2, repeat=2)
+        results.update(bench_tweens(counts=[1, 1000], updates=1000))
+        results.update(bench_memories(count=100))
+    else:
+        results = bench_ease()
+        results.update(bench_tweens())
+        results.update(bench_memories())
+
+    return dict(
+        meta=dict(
+            python=platform.python_version(),
+            numpy=np.__version__,
+            machine=platform.machine(),
+            platform=platform.platform(),
+            time=time.strftime('%Y-%m-%d %H:%M:%S'),
+        ),
+        results=results
+    )
+
+
+def higher_is_better(unit):
+    return unit.endswith('/s')
+
+
+def compare(current, baseline, threshold=0.1):
+    """Compare results with the baseline and return a list of
+       (name, baseline value, current value, change ratio, regressed).
+       A result is regarded as regressed if it got worse by more than threshold.
+    """
+    rows = []
+
+    for name, result in current['results'].items():
+        if (base := baseline['results'].get(name)) is None:
+            continue
+
+        if higher_is_better(result['unit']):
+            change = result['value'] / base['value'] - 1
+        else:
+            change = base['value'] / result['value'] - 1
+
+        rows.append((name, base['value'], result['value'], change, change < -threshold))
+
+    return rows
+
+
+def print_results(data, file=sys.stdout):
+    for name, result in data['results'].items():
+        print(f"{name:<32}{result['value']:>16.1f} {result['unit']}", file=file)
+
+
+def print_comparison(rows, file=sys.stdout):
+    """Print the comparison; positive change means faster than the baseline.
+    """
+    for name, base, current, change, regressed in rows:
+        mark = 'REGRESSED' if regressed else ''
+        print(f'{name:<32}{base:>16.1f}{current:>16.1f}{change:>+9.1%} {mark}', file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmarks of pytweener')
+    parser.add_argument('--output', help='save results to this JSON file')
+    parser.add_argument('--compare', help='compare results with this baseline JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='ratio of slowdown regarded as a regression; default is 0.1')
+    parser.add_argument('--quick', action='store_true', help='run with fewer iterations')
+    args = parser.parse_args(argv)
+
+    data = run(args.quick)
+    print_results(data)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        rows = compare(data, baseline, args.threshold)
+        print()
+        print_comparison(rows)
+
+        if any(row[-1] for row in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
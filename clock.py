@@ -0,0 +1,28 @@
+class ManualClock:
+    """A clock whose time advances only when told to;
+       for fixed-timestep simulation and benchmarks.
+       An instance can be passed to Tween and TweenGroup as the clock.
+        Args:
+            start (float): the initial time in seconds.
+            step (float): the time in seconds that tick advances the clock by; default is 1/60.
+    """
+
+    def __init__(self, start=0.0, step=1 / 60):
+        self.time = start
+        self.step = step
+
+    def __call__(self):
+        return self.time
+
+    def set(self, t):
+        self.time = t
+
+    def advance(self, dt):
+        self.time += dt
+        return self.time
+
+    def tick(self):
+        """Advance the clock by one fixed timestep and return the new time.
+        """
+        self.time += self.step
+        return self.time
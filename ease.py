@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 class Ease:
     """A class to privide easing functions.
@@ -179,3 +181,237 @@ class Ease:
     def in_out_bounce(x):
         return (1 - Ease.out_bounce(1 - 2 * x)) / 2 if x < 0.5 \
             else (1 + Ease.out_bounce(2 * x - 1)) / 2
+
+
+class VecEase:
+    """A class to provide the easing functions in the Ease class for numpy.ndarray.
+       Each function takes an array of progress values in the bounds of 0 to 1
+       and evaluates all of them at once, returning the same values as the Ease class.
+       Accessible as Ease.vec, for example Ease.vec.in_out_expo(x).
+    """
+
+    @staticmethod
+    def _piecewise(x, conditions, funcs):
+        """Evaluate each function only on the elements selected by its condition;
+           the last function is applied to the rest of the elements.
+        """
+        result = np.empty_like(x)
+        rest = np.ones(x.shape, dtype=bool)
+
+        for cond, func in zip(conditions, funcs):
+            mask = cond & rest
+            result[mask] = func(x[mask])
+            rest &= ~mask
+
+        result[rest] = funcs[-1](x[rest])
+        return result
+
+    @staticmethod
+    def linear(x):
+        return np.array(x, dtype=np.float64)
+
+    @staticmethod
+    def in_sine(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x == 1.0, x, 1 - np.cos((x * math.pi) / 2))
+
+    @staticmethod
+    def out_sine(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.sin((x * math.pi) / 2)
+
+    @staticmethod
+    def in_out_sine(x):
+        x = np.asarray(x, dtype=np.float64)
+        return -(np.cos(math.pi * x) - 1) / 2
+
+    @staticmethod
+    def in_cubic(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.power(x, 3)
+
+    @staticmethod
+    def out_cubic(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - np.power(1 - x, 3)
+
+    @staticmethod
+    def in_out_cubic(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0.5, 4 * np.power(x, 3), 1 - np.power(-2 * x + 2, 3) / 2)
+
+    @staticmethod
+    def in_quint(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.power(x, 5)
+
+    @staticmethod
+    def out_quint(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - np.power(1 - x, 5)
+
+    @staticmethod
+    def in_out_quint(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0.5, 16 * np.power(x, 5), 1 - np.power(-2 * x + 2, 5) / 2)
+
+    @staticmethod
+    def in_circ(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - np.sqrt(1 - np.power(x, 2))
+
+    @staticmethod
+    def out_circ(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.sqrt(1 - np.power(x - 1, 2))
+
+    @staticmethod
+    def in_out_circ(x):
+        x = np.asarray(x, dtype=np.float64)
+        return VecEase._piecewise(
+            x,
+            [x < 0.5],
+            [lambda x: (1 - np.sqrt(1 - np.power(2 * x, 2))) / 2,
+             lambda x: (np.sqrt(1 - np.power(-2 * x + 2, 2)) + 1) / 2]
+        )
+
+    @staticmethod
+    def in_elastic(x):
+        x = np.asarray(x, dtype=np.float64)
+        c4 = math.tau / 3
+        return VecEase._piecewise(
+            x,
+            [(x == 0.0) | (x == 1.0)],
+            [lambda x: x,
+             lambda x: -np.power(2, 10 * x - 10) * np.sin((x * 10 - 10.75) * c4)]
+        )
+
+    @staticmethod
+    def out_elastic(x):
+        x = np.asarray(x, dtype=np.float64)
+        c4 = math.tau / 3
+        return VecEase._piecewise(
+            x,
+            [(x == 0.0) | (x == 1.0)],
+            [lambda x: x,
+             lambda x: np.power(2, -10 * x) * np.sin((x * 10 - 0.75) * c4) + 1]
+        )
+
+    @staticmethod
+    def in_out_elastic(x):
+        x = np.asarray(x, dtype=np.float64)
+        c5 = math.tau / 4.5
+        return VecEase._piecewise(
+            x,
+            [(x == 0.0) | (x == 1.0), x < 0.5],
+            [lambda x: x,
+             lambda x: -(np.power(2, 20 * x - 10) * np.sin((20 * x - 11.125) * c5)) / 2,
+             lambda x: np.power(2, -20 * x + 10) * np.sin((20 * x - 11.125) * c5) / 2 + 1]
+        )
+
+    @staticmethod
+    def in_quad(x):
+        x = np.asarray(x, dtype=np.float64)
+        return x * x
+
+    @staticmethod
+    def out_quad(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - np.power(1 - x, 2)
+
+    @staticmethod
+    def in_out_quad(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0.5, 2 * x * x, 1 - np.power(-2 * x + 2, 2) / 2)
+
+    @staticmethod
+    def in_quart(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.power(x, 4)
+
+    @staticmethod
+    def out_quart(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - np.power(1 - x, 4)
+
+    @staticmethod
+    def in_out_quart(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x < 0.5, 8 * np.power(x, 4), 1 - np.power(-2 * x + 2, 4) / 2)
+
+    @staticmethod
+    def in_expo(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x == 0.0, x, np.power(2, 10 * x - 10))
+
+    @staticmethod
+    def out_expo(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x == 1.0, x, 1 - np.power(2, -10 * x))
+
+    @staticmethod
+    def in_out_expo(x):
+        x = np.asarray(x, dtype=np.float64)
+        return VecEase._piecewise(
+            x,
+            [(x == 0.0) | (x == 1.0), x < 0.5],
+            [lambda x: x,
+             lambda x: np.power(2, 20 * x - 10) / 2,
+             lambda x: (2 - np.power(2, -20 * x + 10)) / 2]
+        )
+
+    @staticmethod
+    def in_back(x):
+        x = np.asarray(x, dtype=np.float64)
+        c1 = 1.70158
+        c3 = c1 + 1
+        return np.where(x == 1.0, x, c3 * np.power(x, 3) - c1 * np.power(x, 2))
+
+    @staticmethod
+    def out_back(x):
+        x = np.asarray(x, dtype=np.float64)
+        c1 = 1.70158
+        c3 = c1 + 1
+        return np.where(x == 0.0, x, 1 + c3 * np.power(x - 1, 3) + c1 * np.power(x - 1, 2))
+
+    @staticmethod
+    def in_out_back(x):
+        x = np.asarray(x, dtype=np.float64)
+        c1 = 1.70158
+        c2 = c1 * 1.525
+        return np.where(
+            x < 0.5,
+            (np.power(2 * x, 2) * ((c2 + 1) * 2 * x - c2)) / 2,
+            (np.power(2 * x - 2, 2) * ((c2 + 1) * (x * 2 - 2) + c2) + 2) / 2
+        )
+
+    @staticmethod
+    def in_bounce(x):
+        x = np.asarray(x, dtype=np.float64)
+        return 1 - VecEase.out_bounce(1 - x)
+
+    @staticmethod
+    def out_bounce(x):
+        x = np.asarray(x, dtype=np.float64)
+        n1 = 7.5625
+        d1 = 2.75
+        return VecEase._piecewise(
+            x,
+            [x < 1 / d1, x < 2 / d1, x < 2.5 / d1],
+            [lambda x: n1 * x * x,
+             lambda x: n1 * np.power(x - 1.5 / d1, 2) + 0.75,
+             lambda x: n1 * np.power(x - 2.25 / d1, 2) + 0.9375,
+             lambda x: n1 * np.power(x - 2.625 / d1, 2) * x + 0.984375]
+        )
+
+    @staticmethod
+    def in_out_bounce(x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(
+            x < 0.5,
+            (1 - VecEase.out_bounce(1 - 2 * x)) / 2,
+            (1 + VecEase.out_bounce(2 * x - 1)) / 2
+        )
+
+
+Ease.vec = VecEase
@@ -0,0 +1,275 @@
+import math
+
+import numpy as np
+
+from .jit import EASE_NAMES
+
+
+# The easing functions of the Ease class written as branches of (condition, expression);
+# the first branch whose condition is true is taken, and the last one has no condition.
+# The expressions are valid both in GLSL and, with the helpers in NUMPY_NAMESPACE, in numpy, so that the
+# emitted source can be checked against the Ease class without GPU. pow of GLSL is undefined for negative
+# bases, so integer powers are written by pow2 to pow5, and powers of 2 by exp2.
+
+def _f(value):
+    return repr(float(value))
+
+
+PI = _f(math.pi)
+C1 = _f(1.70158)
+C2 = _f(1.70158 * 1.525)
+C2_1 = _f(1.70158 * 1.525 + 1)
+C3 = _f(1.70158 + 1)
+C4 = _f(math.tau / 3)
+C5 = _f(math.tau / 4.5)
+N1 = _f(7.5625)
+D1 = 2.75
+
+ENDS = '(x == 0.0) || (x == 1.0)'
+
+
+EASE_BRANCHES = {
+    'linear': [(None, 'x')],
+    'in_sine': [('x == 1.0', 'x'), (None, f'1.0 - cos((x * {PI}) / 2.0)')],
+    'out_sine': [(None, f'sin((x * {PI}) / 2.0)')],
+    'in_out_sine': [(None, f'-(cos({PI} * x) - 1.0) / 2.0')],
+    'in_cubic': [(None, 'pow3(x)')],
+    'out_cubic': [(None, '1.0 - pow3(1.0 - x)')],
+    'in_out_cubic': [('x < 0.5', '4.0 * pow3(x)'), (None, '1.0 - pow3(-2.0 * x + 2.0) / 2.0')],
+    'in_quint': [(None, 'pow5(x)')],
+    'out_quint': [(None, '1.0 - pow5(1.0 - x)')],
+    'in_out_quint': [('x < 0.5', '16.0 * pow5(x)'), (None, '1.0 - pow5(-2.0 * x + 2.0) / 2.0')],
+    'in_circ': [(None, '1.0 - sqrt(1.0 - pow2(x))')],
+    'out_circ': [(None, 'sqrt(1.0 - pow2(x - 1.0))')],
+    'in_out_circ': [
+        ('x < 0.5', '(1.0 - sqrt(1.0 - pow2(2.0 * x))) / 2.0'),
+        (None, '(sqrt(1.0 - pow2(-2.0 * x + 2.0)) + 1.0) / 2.0')
+    ],
+    'in_elastic': [(ENDS, 'x'), (None, f'-exp2(10.0 * x - 10.0) * sin((x * 10.0 - 10.75) * {C4})')],
+    'out_elastic': [(ENDS, 'x'), (None, f'exp2(-10.0 * x) * sin((x * 10.0 - 0.75) * {C4}) + 1.0')],
+    'in_out_elastic': [
+        (ENDS, 'x'),
+        ('x < 0.5', f'-(exp2(20.0 * x - 10.0) * sin((20.0 * x - 11.125) * {C5})) / 2.0'),
+        (None, f'exp2(-20.0 * x + 10.0) * sin((20.0 * x - 11.125) * {C5}) / 2.0 + 1.0')
+    ],
+    'in_quad': [(None, 'x * x')],
+    'out_quad': [(None, '1.0 - pow2(1.0 - x)')],
+    'in_out_quad': [('x < 0.5', '2.0 * x * x'), (None, '1.0 - pow2(-2.0 * x + 2.0) / 2.0')],
+    'in_quart': [(None, 'pow4(x)')],
+    'out_quart': [(None, '1.0 - pow4(1.0 - x)')],
+    'in_out_quart': [('x < 0.5', '8.0 * pow4(x)'), (None, '1.0 - pow4(-2.0 * x + 2.0) / 2.0')],
+    'in_expo': [('x == 0.0', 'x'), (None, 'exp2(10.0 * x - 10.0)')],
+    'out_expo': [('x == 1.0', 'x'), (None, '1.0 - exp2(-10.0 * x)')],
+    'in_out_expo': [
+        (ENDS, 'x'),
+        ('x < 0.5', 'exp2(20.0 * x - 10.0) / 2.0'),
+        (None, '(2.0 - exp2(-20.0 * x + 10.0)) / 2.0')
+    ],
+    'in_back': [('x == 1.0', 'x'), (None, f'{C3} * pow3(x) - {C1} * pow2(x)')],
+    'out_back': [('x == 0.0', 'x'), (None, f'1.0 + {C3} * pow3(x - 1.0) + {C1} * pow2(x - 1.0)')],
+    'in_out_back': [
+        ('x < 0.5', f'(pow2(2.0 * x) * ({C2_1} * 2.0 * x - {C2})) / 2.0'),
+        (None, f'(pow2(2.0 * x - 2.0) * ({C2_1} * (x * 2.0 - 2.0) + {C2}) + 2.0) / 2.0')
+    ],
+    'in_bounce': [(None, '1.0 - ease_out_bounce(1.0 - x)')],
+    'out_bounce': [
+        (f'x < {_f(1 / D1)}', f'{N1} * x * x'),
+        (f'x < {_f(2 / D1)}', f'{N1} * pow2(x - {_f(1.5 / D1)}) + 0.75'),
+        (f'x < {_f(2.5 / D1)}', f'{N1} * pow2(x - {_f(2.25 / D1)}) + 0.9375'),
+        (None, f'{N1} * pow2(x - {_f(2.625 / D1)}) * x + 0.984375')
+    ],
+    'in_out_bounce': [
+        ('x < 0.5', '(1.0 - ease_out_bounce(1.0 - 2.0 * x)) / 2.0'),
+        (None, '(1.0 + ease_out_bounce(2.0 * x - 1.0)) / 2.0')
+    ],
+}
+
+
+HELPERS = '''float pow2(float v) { return v * v; }
+float pow3(float v) { return v * v * v; }
+float pow4(float v) { float v2 = v * v; return v2 * v2; }
+float pow5(float v) { float v2 = v * v; return v2 * v2 * v; }
+'''
+
+
+TWEEN_POSITION = '''// start: (start point, start time), end: (end point, duration),
+// params: (easing id, yoyo, the number of passes or 0 for an endless loop, unused)
+vec3 tween_position(float time, vec4 start, vec4 end, vec4 params) {
+    float duration = end.w;
+    bool yoyo = params.y > 0.5;
+    float pass_len = yoyo ? 2.0 * duration : duration;
+    float t = max(time - start.w, 0.0);
+
+    if (params.z > 0.0) {
+        t = min(t, pass_len * params.z);
+    }
+
+    float cycle = max(ceil(t / pass_len) - 1.0, 0.0);
+    float u = t - cycle * pass_len;
+    bool backward = yoyo && u > duration;
+    float progress = min((backward ? u - duration : u) / duration, 1.0);
+    float v = ease(int(params.x), progress);
+
+    return backward ? mix(end.xyz, start.xyz, v) : mix(start.xyz, end.xyz, v);
+}
+'''
+
+
+def ease_source(name):
+    """Return the GLSL function float ease_<name>(float x) of the easing function of the name.
+    """
+    try:
+        branches = EASE_BRANCHES[name]
+    except KeyError:
+        raise ValueError(f'not applicable: {name}')
+
+    lines = [f'float ease_{name}(float x) {{']
+
+    for cond, expr in branches:
+        if cond is None:
+            lines.append(f'    return {expr};')
+        else:
+            lines.append(f'    if ({cond}) return {expr};')
+
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def shader_source():
+    """Return the GLSL source of the helpers, all the easing functions, float ease(int id, float x),
+       which dispatches by the index in jit.EASE_NAMES, and vec3 tween_position(time, start, end, params),
+       which evaluates a tween packed by pack_group.
+    """
+    prototypes = ''.join(f'float ease_{name}(float x);\n' for name in EASE_NAMES)
+    functions = '\n'.join(ease_source(name) for name in EASE_NAMES)
+
+    cases = '\n'.join(f'    if (id == {i}) return ease_{name}(x);' for i, name in enumerate(EASE_NAMES[:-1]))
+    dispatch = f'float ease(int id, float x) {{\n{cases}\n    return ease_{EASE_NAMES[-1]}(x);\n}}\n'
+
+    return '\n'.join([HELPERS, prototypes, functions, dispatch, TWEEN_POSITION])
+
+
+NUMPY_NAMESPACE = {
+    'pow2': lambda v: v * v,
+    'pow3': lambda v: v * v * v,
+    'pow4': lambda v: (v * v) * (v * v),
+    'pow5': lambda v: (v * v) * (v * v) * v,
+    'exp2': np.exp2,
+    'sin': np.sin,
+    'cos': np.cos,
+    'sqrt': np.sqrt,
+}
+
+
+def _to_numpy(code):
+    return code.replace('||', '|').replace('&&', '&')
+
+
+def numpy_function(name):
+    """Return the easing function of the name evaluated by the same expressions as the GLSL source,
+       transpiled to numpy; all the branches are evaluated and the first one whose condition is true is taken.
+    """
+    try:
+        branches = EASE_BRANCHES[name]
+    except KeyError:
+        raise ValueError(f'not applicable: {name}')
+
+    compiled = [(None if cond is None else compile(_to_numpy(cond), name, 'eval'), compile(expr, name, 'eval'))
+                for cond, expr in branches]
+    functions = dict(NUMPY_NAMESPACE)
+
+    if any('ease_out_bounce' in expr for _, expr in branches):
+        functions['ease_out_bounce'] = numpy_function('out_bounce')
+
+    def func(x):
+        x = np.asarray(x, dtype=np.float64)
+        namespace = dict(functions, x=x)
+        conds = []
+        values = []
+
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            for cond, expr in compiled:
+                values.append(np.broadcast_to(eval(expr, namespace), x.shape))
+                conds.append(np.ones(x.shape, dtype=bool) if cond is None else eval(cond, namespace))
+
+        return np.select(conds, values)
+
+    func.__name__ = name
+    return func
+
+
+# the layout of a packed tween; each row is a vec4 of float32.
+PACKED_COLUMNS = ('tween_start', 'tween_end', 'tween_params')
+
+
+def pack_group(group, start_time=0.0, loop=False, repeat=None):
+    """Pack the tweens of a TweenGroup into an array of float32 of shape (N, 12), three vec4 for each tween:
+       (start point, start time), (end point, duration) and (easing id, yoyo, the number of passes, 0).
+       The points must have 3 or less dimensions. The start time of each tween is start_time plus its delay,
+       in the time of the shader; pass the seconds since start_time as the time uniform, so that
+       the time stays small enough for float32 regardless of the clock.
+       The loop and repeat are specified in the same way as loop().
+    """
+    n, dim = group.start_pt.shape
+
+    if dim > 3:
+        raise ValueError(f'points must have 3 or less dimensions: {dim}')
+
+    names = [func.__name__ for func in group.ease_funcs]
+
+    if (unknown := [name for name in names if name not in EASE_BRANCHES]):
+        raise ValueError(f'not applicable: {unknown}')
+
+    if not loop:
+        passes = 1
+    else:
+        passes = repeat or 0
+
+    # the endpoints are swapped while turning back, so pack the original ones in the same way as bake.
+    turned = group.is_turning_back[:, None]
+
+    packed = np.zeros((n, 12), dtype=np.float32)
+    packed[:, 0:dim] = np.where(turned, group.end_pt, group.start_pt)
+    packed[:, 3] = start_time + group.delay
+    packed[:, 4:4 + dim] = np.where(turned, group.start_pt, group.end_pt)
+    packed[:, 7] = group.duration / 1000
+    packed[:, 8] = np.array([EASE_NAMES.index(name) for name in names])[group.ease_id]
+    packed[:, 9] = group.yoyo
+    packed[:, 10] = passes
+
+    return packed
+
+
+def make_vertex_data(packed, instanced=True, name='tweens'):
+    """Return GeomVertexData which has the packed tweens in the columns tween_start, tween_end and
+       tween_params of vec4; if instanced, the columns advance per instance instead of per vertex.
+    """
+    from panda3d.core import Geom, GeomVertexArrayFormat, GeomVertexData, GeomVertexFormat
+
+    array_format = GeomVertexArrayFormat()
+
+    for column in PACKED_COLUMNS:
+        array_format.add_column(column, 4, Geom.NT_float32, Geom.C_other)
+
+    if instanced:
+        array_format.set_divisor(1)
+
+    fmt = GeomVertexFormat.register_format(GeomVertexFormat(array_format))
+    vdata = GeomVertexData(name, fmt, Geom.UH_static)
+    vdata.unclean_set_num_rows(len(packed))
+
+    view = memoryview(vdata.modify_array(0)).cast('B')
+    view[:] = np.ascontiguousarray(packed, dtype=np.float32).tobytes()
+    return vdata
+
+
+def make_buffer_texture(packed, name='tweens'):
+    """Return a buffer texture of rgba32 which has the packed tweens;
+       the three vec4 of the i-th tween are fetched by texelFetch at 3i, 3i + 1 and 3i + 2.
+    """
+    from panda3d.core import GeomEnums, Texture
+
+    texture = Texture(name)
+    texture.setup_buffer_texture(len(packed) * 3, Texture.T_float, Texture.F_rgba32, GeomEnums.UH_static)
+    texture.set_ram_image_as(np.ascontiguousarray(packed, dtype=np.float32).tobytes(), 'RGBA')
+    return texture
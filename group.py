@@ -0,0 +1,336 @@
+import time
+
+import numpy as np
+
+from . import jit, registry
+from .ease import Ease
+from .timeline import count_cycles, frame_times, interpolate, progress_at
+
+
+def stagger(n, each, order='linear', seed=None):
+    """Return the delays of n tweens started one after another at intervals of each seconds.
+        Args:
+            n (int): the number of tweens.
+            each (float): the interval of the starts; specify in seconds.
+            order (string or numpy.ndarray):
+                'linear': from the first to the last.
+                'reverse': from the last to the first.
+                'center': from the center outward.
+                'edges': from both ends inward.
+                'random': in random order.
+                numpy.ndarray: the ranks of the tweens, which are multiplied by each; can be floats.
+            seed (int): the seed of the random order.
+    """
+    if not isinstance(order, str):
+        ranks = np.asarray(order, dtype=np.float64)
+
+        if ranks.shape != (n,):
+            raise ValueError(f'order must be of shape ({n},): {ranks.shape}')
+        return ranks * each
+
+    i = np.arange(n, dtype=np.float64)
+    mid = (n - 1) / 2
+
+    if order == 'linear':
+        ranks = i
+    elif order == 'reverse':
+        ranks = n - 1 - i
+    elif order == 'center':
+        ranks = np.abs(i - mid)
+        ranks -= ranks.min()
+    elif order == 'edges':
+        ranks = mid - np.abs(i - mid)
+        ranks -= ranks.min()
+    elif order == 'random':
+        ranks = np.random.default_rng(seed).permutation(n).astype(np.float64)
+    else:
+        raise ValueError(f'not applicable order: {order}')
+
+    return ranks * each
+
+
+class TweenGroup:
+    """A class for tweening many points at once.
+       The states of all tweens are held in numpy arrays, and one call of update
+       advances every tween and writes the positions into the preallocated next_pos.
+        Args:
+            start (numpy.ndarray):
+                The starting points of the animations; shape (N, dim) or (N,).
+            end (numpy.ndarray):
+                The end points of the animations; shape (N, dim) or (N,).
+            duration (float or numpy.ndarray): The time that each animation takes to complete; specify in seconds.
+            delay (float or numpy.ndarray): start delay time of each animation; specify in seconds.
+            yoyo (bool or numpy.ndarray): If true, go to the end point and come back, if false, just go to the end point.
+            easing_type (string, callable or list): a name or function accepted by registry.get_ease,
+                or a list of them for each tween; default is linear.
+            clock (callable): returns the current time in seconds; default is time.perf_counter.
+            backend (string): 'numba' to update by the compiled kernel, or 'numpy';
+                by default, numba is used if it is installed.
+    """
+
+    def __init__(self, start, end, duration, delay=0, yoyo=False, easing_type='linear', clock=None, backend=None):
+        start = np.array(start, dtype=np.float64)
+        end = np.array(end, dtype=np.float64)
+
+        if start.ndim == 1:
+            start = start.reshape(-1, 1)
+            end = end.reshape(-1, 1)
+
+        if start.shape != end.shape:
+            raise ValueError(f'start and end must have the same shape: {start.shape}, {end.shape}')
+
+        self.size = n = len(start)
+        self.start_pt = start
+        self.end_pt = end
+        self.delta = end - start
+        self.duration = np.broadcast_to(np.asarray(duration, dtype=np.float64) * 1000, n).copy()
+        self.delay = np.broadcast_to(np.asarray(delay, dtype=np.float64), n).copy()
+        self.yoyo = np.broadcast_to(np.asarray(yoyo, dtype=bool), n).copy()
+
+        self.is_playing = np.zeros(n, dtype=bool)
+        self.is_turning_back = np.zeros(n, dtype=bool)
+        self.is_paused = np.zeros(n, dtype=bool)
+        self.do_finish = np.zeros(n, dtype=bool)
+        self.do_loop = np.zeros(n, dtype=bool)
+        self.repeat = np.zeros(n, dtype=np.int64)
+        self.repeat_cnt = np.zeros(n, dtype=np.int64)
+        self.start_time = np.zeros(n, dtype=np.float64)
+        self.pause_start_time = np.zeros(n, dtype=np.float64)
+        self.step = np.zeros(n, dtype=np.float64)
+
+        self.clock = clock
+        self.backend = self.get_backend(backend)
+        self.next_pos = start.copy()
+        self._buf = np.empty_like(start)
+
+        self.set_easing(easing_type)
+
+    @classmethod
+    def from_tweens(cls, tweens):
+        """Create a TweenGroup from the current endpoints and settings of Tween instances.
+        """
+        return cls(
+            [np.ravel(t.start_pt) for t in tweens],
+            [np.ravel(t.end_pt) for t in tweens],
+            [t.duration / 1000 for t in tweens],
+            delay=[t.delay for t in tweens],
+            yoyo=[t.yoyo for t in tweens],
+            easing_type=[t.ease for t in tweens]
+        )
+
+    @classmethod
+    def staggered(cls, start, end, duration, each, order='linear', seed=None, delay=0, **kwargs):
+        """Create a group whose tweens start one after another; each, order and seed are the same as stagger,
+           and the delays are added to delay. The other arguments are passed to the constructor.
+        """
+        delays = stagger(len(start), each, order, seed) + np.asarray(delay, dtype=np.float64)
+        return cls(start, end, duration, delays, **kwargs)
+
+    def __len__(self):
+        return self.size
+
+    def get_ease_func(self, easing_type):
+        try:
+            ease_func = registry.get_vec_ease(registry.get_ease(easing_type))
+        except (AttributeError, TypeError, ValueError):
+            print(f'not applicable: {easing_type}')
+            ease_func = Ease.vec.linear
+
+        return ease_func
+
+    def get_backend(self, backend):
+        if backend is None:
+            return 'numba' if jit.AVAILABLE else 'numpy'
+
+        if backend == 'numba' and not jit.AVAILABLE:
+            raise ValueError('numba is not installed.')
+
+        if backend not in ('numba', 'numpy'):
+            raise ValueError(f'not applicable backend: {backend}')
+
+        return backend
+
+    def get_time(self, now=None):
+        if now is not None:
+            return now
+
+        if self.clock is None:
+            return time.perf_counter()
+
+        return self.clock()
+
+    def set_easing(self, easing_type):
+        """Set the easing functions; easing_type is one name or function for all tweens,
+           or a name or function for each tween.
+        """
+        names = [easing_type] if isinstance(easing_type, str) or callable(easing_type) else list(easing_type)
+        uniques = list(dict.fromkeys(names))
+        self.ease_funcs = [self.get_ease_func(name) for name in uniques]
+        # the names of the functions, by which a snapshot can build them again.
+        self.ease_names = [name if isinstance(name, str) else getattr(name, '__name__', '') for name in uniques]
+
+        if len(names) == 1:
+            self.ease_id = np.zeros(self.size, dtype=np.int16)
+        else:
+            if len(names) != self.size:
+                raise ValueError(f'easing_type must have {self.size} names: {len(names)}')
+            self.ease_id = np.array([uniques.index(name) for name in names], dtype=np.int16)
+
+        self._ease_indices = [np.flatnonzero(self.ease_id == i) for i in range(len(uniques))]
+        self._jit_ids = None
+
+        if self.backend == 'numba':
+            # fall back to numpy if some of the functions are not compiled; the functions are compared by identity,
+            # so that a custom function named like a function of the Ease class is not replaced by the kernel.
+            builtin = all(f is getattr(Ease.vec, f.__name__, None) for f in self.ease_funcs)
+
+            if builtin and (ids := jit.get_ease_ids([f.__name__ for f in self.ease_funcs])) is not None:
+                self._jit_ids = ids[self.ease_id]
+
+    def _select(self, index):
+        if index is None:
+            return np.ones(self.size, dtype=bool)
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[index] = True
+        return mask
+
+    def ease(self, step, sl=None):
+        """Evaluate the easing function of each tween; step is for all tweens,
+           or for the tweens in the slice sl.
+        """
+        if len(self.ease_funcs) == 1:
+            return self.ease_funcs[0](step)
+
+        if sl is None:
+            ease_indices = self._ease_indices
+        else:
+            ease_id = self.ease_id[sl]
+            ease_indices = [np.flatnonzero(ease_id == i) for i in range(len(self.ease_funcs))]
+
+        eased = np.empty_like(step)
+
+        for func, indices in zip(self.ease_funcs, ease_indices):
+            eased[..., indices] = func(step[..., indices])
+
+        return eased
+
+    def setup(self, mask, do_loop, repeat, now):
+        self.do_loop[mask] = do_loop
+        self.repeat[mask] = repeat or 0
+        self.repeat_cnt[mask] = 0
+        self.do_finish[mask] = False
+        self.start_time[mask] = now + self.delay[mask]
+        self.is_playing[mask] = True
+
+    def start(self, index=None, now=None):
+        """Start the tweens that are not playing; index selects the tweens, all of them by default.
+           The start of each tween is delayed by its delay.
+        """
+        now = self.get_time(now)
+        mask = self._select(index) & ~self.is_playing
+        self.setup(mask, False, None, now)
+
+    def loop(self, repeat=None, index=None, now=None):
+        now = self.get_time(now)
+        mask = self._select(index) & ~self.is_playing
+        self.setup(mask, True, repeat, now)
+
+    def pause(self, index=None, now=None):
+        now = self.get_time(now)
+        mask = self._select(index) & ~self.is_paused
+        self.is_paused[mask] = True
+        self.pause_start_time[mask] = now
+
+    def resume(self, index=None, now=None):
+        now = self.get_time(now)
+        mask = self._select(index) & self.is_paused
+        self.start_time[mask] += now - self.pause_start_time[mask]
+        self.is_paused[mask] = False
+
+    def finish(self, index=None):
+        mask = self._select(index) & self.is_playing & ~self.is_paused
+        self.do_finish[mask] = True
+
+    def turn(self, mask):
+        self.start_pt[mask], self.end_pt[mask] = self.end_pt[mask], self.start_pt[mask]
+        self.delta[mask] *= -1
+
+    @property
+    def is_any_playing(self):
+        return bool(self.is_playing.any())
+
+    def update(self, now=None):
+        """Advance all of the playing tweens and return next_pos, the (N, dim) array of positions.
+        """
+        now = self.get_time(now)
+        active = self.is_playing & ~self.is_paused
+
+        if not active.any():
+            return self.next_pos
+
+        self.compute(now, active)
+        done = active & (self.step == 1.0)
+
+        if done.any():
+            self._complete(done, now)
+
+        return self.next_pos
+
+    def compute(self, now, active, sl=slice(None)):
+        """Compute the progress and positions of the active tweens in the slice sl.
+           Slices that do not overlap can be computed concurrently.
+        """
+        if self._jit_ids is not None:
+            jit.group_update(now, self.start_time[sl], self.duration[sl], active[sl], self._jit_ids[sl],
+                             self.start_pt[sl], self.delta[sl], self.step[sl], self.next_pos[sl])
+            return
+
+        step = self.step[sl]
+        elapsed = (now - self.start_time[sl]) * 1000  # ms
+        np.copyto(step, np.clip(elapsed / self.duration[sl], 0.0, 1.0), where=active[sl])
+
+        eased = self.ease(step, None if sl == slice(None) else sl)
+        buf = self._buf[sl]
+        np.multiply(self.delta[sl], eased[:, None], out=buf)
+        buf += self.start_pt[sl]
+        np.copyto(self.next_pos[sl], buf, where=active[sl, None])
+
+    def _complete(self, done, now):
+        turned = done & self.yoyo
+        returned = turned & self.is_turning_back
+
+        self.start_time[turned] = now
+        self.turn(turned)
+        self.is_turning_back[turned] = ~self.is_turning_back[turned]
+
+        ended = returned | (done & ~self.yoyo)
+        self.start_time[ended & ~self.yoyo & self.do_loop] = now
+        self.is_playing[ended & ~self.do_loop] = False
+        self.do_continue(ended & self.do_loop)
+
+    def do_continue(self, mask):
+        finished = mask & self.do_finish
+        repeating = mask & ~self.do_finish & (self.repeat > 0)
+        counting = repeating & (self.repeat_cnt < self.repeat - 1)
+
+        self.repeat_cnt[counting] += 1
+        self.is_playing[finished | (repeating & ~counting)] = False
+
+    def bake(self, fps, loop=False, repeat=None):
+        """Return all the positions of the tweens sampled at fps as an array of shape (frames, N, dim),
+           from the start including the delays until every tween ends.
+           The loop and repeat are specified in the same way as loop(); an endless loop cannot be baked.
+        """
+        turned = self.is_turning_back[:, None]
+        start = np.where(turned, self.end_pt, self.start_pt)
+        end = np.where(turned, self.start_pt, self.end_pt)
+        duration = self.duration / 1000
+        cycles = count_cycles(loop, repeat)
+
+        total = self.delay + duration * np.where(self.yoyo, 2, 1) * cycles
+        times = frame_times(fps, total.max())[:, None]
+        step, backward, _ = progress_at(times, duration, self.delay, self.yoyo, cycles)
+        v = self.ease(step)
+
+        return interpolate(start, end, v, backward)
@@ -0,0 +1,223 @@
+import numpy as np
+
+from .ease import Ease
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Compiled kernels of the easing functions and the TweenGroup update loop.
+# numba is used if it is installed; otherwise the kernels are plain Python functions,
+# which give the same results but are slow, and TweenGroup uses numpy instead.
+AVAILABLE = njit is not None
+
+
+def _jit(func):
+    if AVAILABLE:
+        return njit(cache=True, nogil=True)(func)
+
+    return func
+
+
+EASE_NAMES = (
+    'linear',
+    'in_sine',
+    'out_sine',
+    'in_out_sine',
+    'in_cubic',
+    'out_cubic',
+    'in_out_cubic',
+    'in_quint',
+    'out_quint',
+    'in_out_quint',
+    'in_circ',
+    'out_circ',
+    'in_out_circ',
+    'in_elastic',
+    'out_elastic',
+    'in_out_elastic',
+    'in_quad',
+    'out_quad',
+    'in_out_quad',
+    'in_quart',
+    'out_quart',
+    'in_out_quart',
+    'in_expo',
+    'out_expo',
+    'in_out_expo',
+    'in_back',
+    'out_back',
+    'in_out_back',
+    'in_bounce',
+    'out_bounce',
+    'in_out_bounce'
+)
+
+
+linear = _jit(Ease.linear)
+in_sine = _jit(Ease.in_sine)
+out_sine = _jit(Ease.out_sine)
+in_out_sine = _jit(Ease.in_out_sine)
+in_cubic = _jit(Ease.in_cubic)
+out_cubic = _jit(Ease.out_cubic)
+in_out_cubic = _jit(Ease.in_out_cubic)
+in_quint = _jit(Ease.in_quint)
+out_quint = _jit(Ease.out_quint)
+in_out_quint = _jit(Ease.in_out_quint)
+in_circ = _jit(Ease.in_circ)
+out_circ = _jit(Ease.out_circ)
+in_out_circ = _jit(Ease.in_out_circ)
+in_elastic = _jit(Ease.in_elastic)
+out_elastic = _jit(Ease.out_elastic)
+in_out_elastic = _jit(Ease.in_out_elastic)
+in_quad = _jit(Ease.in_quad)
+out_quad = _jit(Ease.out_quad)
+in_out_quad = _jit(Ease.in_out_quad)
+in_quart = _jit(Ease.in_quart)
+out_quart = _jit(Ease.out_quart)
+in_out_quart = _jit(Ease.in_out_quart)
+in_expo = _jit(Ease.in_expo)
+out_expo = _jit(Ease.out_expo)
+in_out_expo = _jit(Ease.in_out_expo)
+in_back = _jit(Ease.in_back)
+out_back = _jit(Ease.out_back)
+in_out_back = _jit(Ease.in_out_back)
+out_bounce = _jit(Ease.out_bounce)
+
+
+# in_bounce and in_out_bounce of the Ease class call Ease.out_bounce, which cannot be compiled.
+@_jit
+def in_bounce(x):
+    return 1 - out_bounce(1 - x)
+
+
+@_jit
+def in_out_bounce(x):
+    return (1 - out_bounce(1 - 2 * x)) / 2 if x < 0.5 \
+        else (1 + out_bounce(2 * x - 1)) / 2
+
+
+@_jit
+def ease_by_id(ease_id, x):
+    """Evaluate the easing function whose name is EASE_NAMES[ease_id].
+    """
+    if ease_id == 0:
+        return linear(x)
+    elif ease_id == 1:
+        return in_sine(x)
+    elif ease_id == 2:
+        return out_sine(x)
+    elif ease_id == 3:
+        return in_out_sine(x)
+    elif ease_id == 4:
+        return in_cubic(x)
+    elif ease_id == 5:
+        return out_cubic(x)
+    elif ease_id == 6:
+        return in_out_cubic(x)
+    elif ease_id == 7:
+        return in_quint(x)
+    elif ease_id == 8:
+        return out_quint(x)
+    elif ease_id == 9:
+        return in_out_quint(x)
+    elif ease_id == 10:
+        return in_circ(x)
+    elif ease_id == 11:
+        return out_circ(x)
+    elif ease_id == 12:
+        return in_out_circ(x)
+    elif ease_id == 13:
+        return in_elastic(x)
+    elif ease_id == 14:
+        return out_elastic(x)
+    elif ease_id == 15:
+        return in_out_elastic(x)
+    elif ease_id == 16:
+        return in_quad(x)
+    elif ease_id == 17:
+        return out_quad(x)
+    elif ease_id == 18:
+        return in_out_quad(x)
+    elif ease_id == 19:
+        return in_quart(x)
+    elif ease_id == 20:
+        return out_quart(x)
+    elif ease_id == 21:
+        return in_out_quart(x)
+    elif ease_id == 22:
+        return in_expo(x)
+    elif ease_id == 23:
+        return out_expo(x)
+    elif ease_id == 24:
+        return in_out_expo(x)
+    elif ease_id == 25:
+        return in_back(x)
+    elif ease_id == 26:
+        return out_back(x)
+    elif ease_id == 27:
+        return in_out_back(x)
+    elif ease_id == 28:
+        return in_bounce(x)
+    elif ease_id == 29:
+        return out_bounce(x)
+    else:
+        return in_out_bounce(x)
+
+
+@_jit
+def _ease_array(ease_id, x, out):
+    for i in range(x.size):
+        out[i] = ease_by_id(ease_id, x[i])
+
+
+def ease_array(easing_type, x):
+    """Evaluate the easing function of the name for numpy.ndarray in one pass.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    _ease_array(EASE_NAMES.index(easing_type), x.reshape(-1), out.reshape(-1))
+    return out
+
+
+@_jit
+def group_update(now, start_time, duration, active, ease_ids, start_pt, delta, step, out):
+    """Compute the progress, easing and interpolation of the active tweens of TweenGroup in one pass.
+    """
+    n, dim = out.shape
+
+    for i in range(n):
+        if not active[i]:
+            continue
+
+        s = (now - start_time[i]) * 1000 / duration[i]
+        s = min(max(s, 0.0), 1.0)
+        step[i] = s
+        v = ease_by_id(ease_ids[i], s)
+
+        for j in range(dim):
+            out[i, j] = delta[i, j] * v + start_pt[i, j]
+
+
+def get_ease_ids(names):
+    """Return the indices in EASE_NAMES of the names, or None if any name is not compiled.
+    """
+    names = list(names)
+
+    if any(name not in EASE_NAMES for name in names):
+        return None
+
+    return np.array([EASE_NAMES.index(name) for name in names], dtype=np.int64)
+
+
+def warm_up():
+    """Compile the kernels beforehand so that the first frame does not take time.
+    """
+    x = np.linspace(0.0, 1.0, 2)
+    _ease_array(0, x, np.empty_like(x))
+    group_update(
+        0.0, np.zeros(1), np.ones(1), np.ones(1, dtype=bool), np.zeros(1, dtype=np.int64),
+        np.zeros((1, 1)), np.ones((1, 1)), np.zeros(1), np.zeros((1, 1))
+    )
@@ -0,0 +1,112 @@
+from bisect import bisect_right
+
+import numpy as np
+
+from . import registry
+from .ease import Ease
+
+
+class KeyframeTrack:
+    """A class to interpolate values between many keyframes.
+       Each segment between two keyframes has its own easing function.
+        Args:
+            times (list): the times of the keyframes in strictly increasing order; specify in seconds.
+            values (list):
+                the values at the keyframes;
+                can be specified as scalars, numpy.ndarray, panda3d.core.Point3 and so on.
+            easing_type (string or list): the function name(s) defined in the Ease class for the segments;
+                one name for all segments or a name for each segment; default is linear.
+    """
+
+    def __init__(self, times, values, easing_type='linear'):
+        self.times = np.array(times, dtype=np.float64)
+
+        if self.times.ndim != 1 or len(self.times) < 2:
+            raise ValueError('at least two keyframes are required.')
+
+        if np.any(np.diff(self.times) <= 0):
+            raise ValueError('times must be in strictly increasing order.')
+
+        self.is_scalar = np.ndim(values[0]) == 0
+        self.values = np.array([np.ravel(v) for v in values], dtype=np.float64)
+
+        if len(self.values) != len(self.times):
+            raise ValueError(f'the number of values must be {len(self.times)}: {len(self.values)}')
+
+        self.deltas = np.diff(self.values, axis=0)
+        self.spans = np.diff(self.times)
+        self._times = self.times.tolist()
+        self.cursor = 0
+
+        n = len(self.spans)
+        names = [easing_type] * n if isinstance(easing_type, str) else list(easing_type)
+
+        if len(names) != n:
+            raise ValueError(f'easing_type must have {n} names: {len(names)}')
+
+        self.eases = [self.get_ease_func(name) for name in names]
+        uniques = list(dict.fromkeys(self.eases))
+        self.ease_id = np.array([uniques.index(func) for func in self.eases], dtype=np.int16)
+        self.vec_eases = [registry.get_vec_ease(func) for func in uniques]
+
+    def get_ease_func(self, easing_type):
+        try:
+            ease_func = registry.get_ease(easing_type)
+        except (AttributeError, TypeError, ValueError):
+            print(f'not applicable: {easing_type}')
+            ease_func = Ease.linear
+
+        return ease_func
+
+    @property
+    def duration(self):
+        return self._times[-1] - self._times[0]
+
+    def find_segment(self, t):
+        """Return the index of the segment containing t. The segment found last is checked first,
+           and then the next one, so that monotonic playback takes amortized O(1) time;
+           otherwise the segment is found by binary search.
+        """
+        times = self._times
+        i = self.cursor
+
+        if times[i] <= t < times[i + 1]:
+            return i
+
+        if i + 2 < len(times) and times[i + 1] <= t < times[i + 2]:
+            self.cursor = i + 1
+            return self.cursor
+
+        self.cursor = min(max(bisect_right(times, t) - 1, 0), len(times) - 2)
+        return self.cursor
+
+    def sample(self, t):
+        """Return the value at t seconds; before the first keyframe and after the last one,
+           the values of them are returned.
+        """
+        i = self.find_segment(t)
+        step = min(max((t - self._times[i]) / self.spans[i], 0.0), 1.0)
+        value = self.deltas[i] * self.eases[i](step) + self.values[i]
+
+        return value[0] if self.is_scalar else value
+
+    def sample_many(self, t):
+        """Return the values at the times of numpy.ndarray at once; the shape of the result is
+           t.shape for scalar keyframes, otherwise t.shape + (dim,).
+        """
+        t = np.asarray(t, dtype=np.float64)
+        seg = np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self.spans) - 1)
+        step = np.clip((t - self.times[seg]) / self.spans[seg], 0.0, 1.0)
+
+        if len(self.vec_eases) == 1:
+            v = self.vec_eases[0](step)
+        else:
+            v = np.empty_like(step)
+            seg_ease_id = self.ease_id[seg]
+
+            for i, func in enumerate(self.vec_eases):
+                mask = seg_ease_id == i
+                v[mask] = func(step[mask])
+
+        values = self.deltas[seg] * v[..., None] + self.values[seg]
+        return values[..., 0] if self.is_scalar else values
@@ -0,0 +1,106 @@
+import numpy as np
+
+from . import registry
+
+
+class EaseLUT:
+    """A class to evaluate an easing function by a precomputed lookup table.
+       The table holds the values of the function sampled at regular intervals in 0 to 1,
+       and is built only once for each pair of function and resolution.
+       Both a scalar and numpy.ndarray can be passed, like the Ease functions.
+        Args:
+            func (callable or string): the function or the easing name accepted by registry.get_ease.
+            resolution (int): the number of samples; must be 2 or more.
+            interpolation (string): 'linear' or 'cubic'; default is linear.
+    """
+
+    _tables = {}
+
+    def __init__(self, func, resolution=1024, interpolation='linear'):
+        if isinstance(func, str):
+            func = registry.get_ease(func)
+
+        if resolution < 2:
+            raise ValueError(f'resolution must be 2 or more: {resolution}')
+
+        if interpolation not in ('linear', 'cubic'):
+            raise ValueError(f'not applicable interpolation: {interpolation}')
+
+        self.func = func
+        self.resolution = resolution
+        self.interpolation = interpolation
+        self.intervals = resolution - 1
+        self.table = self.get_table(func, resolution)
+        self._values = self.table.tolist()
+        self._max_error = None
+
+    @property
+    def __name__(self):
+        return self.func.__name__
+
+    @classmethod
+    def get_table(cls, func, resolution):
+        """Return the samples of func padded with one extrapolated value at each end,
+           which are used by the cubic interpolation.
+        """
+        key = (func, resolution)
+
+        if (table := cls._tables.get(key)) is None:
+            xs = np.linspace(0.0, 1.0, resolution)
+            values = [func(x) for x in xs.tolist()]
+            values = [2 * values[0] - values[1]] + values + [2 * values[-1] - values[-2]]
+            table = np.array(values, dtype=np.float64)
+            table.flags.writeable = False
+            cls._tables[key] = table
+
+        return table
+
+    @classmethod
+    def clear_cache(cls):
+        cls._tables.clear()
+
+    def __call__(self, x):
+        if isinstance(x, np.ndarray):
+            return self.evaluate(x)
+
+        pos = min(max(x, 0.0), 1.0) * self.intervals
+        i = int(pos)
+
+        if i == self.intervals:
+            return self._values[-2]
+
+        t = pos - i
+        p0, p1, p2, p3 = self._values[i: i + 4]
+
+        if self.interpolation == 'linear':
+            return p1 + (p2 - p1) * t
+
+        return p1 + 0.5 * t * (p2 - p0 + t * (2 * p0 - 5 * p1 + 4 * p2 - p3 + t * (3 * (p1 - p2) + p3 - p0)))
+
+    def evaluate(self, x):
+        """Evaluate the table for numpy.ndarray.
+        """
+        pos = np.clip(x, 0.0, 1.0) * self.intervals
+        i = np.minimum(pos.astype(np.intp), self.intervals - 1)
+        t = pos - i
+        table = self.table
+        p1 = table[i + 1]
+        p2 = table[i + 2]
+
+        if self.interpolation == 'linear':
+            return p1 + (p2 - p1) * t
+
+        p0 = table[i]
+        p3 = table[i + 3]
+        return p1 + 0.5 * t * (p2 - p0 + t * (2 * p0 - 5 * p1 + 4 * p2 - p3 + t * (3 * (p1 - p2) + p3 - p0)))
+
+    def max_error(self, samples=100001):
+        """Return the max absolute error against the exact easing function,
+           measured at the specified number of points in 0 to 1.
+        """
+        if self._max_error is None or self._max_error[0] != samples:
+            xs = np.linspace(0.0, 1.0, samples)
+            exact = np.array([self.func(x) for x in xs.tolist()], dtype=np.float64)
+            self._max_error = (samples, float(np.abs(self.evaluate(xs) - exact).max()))
+
+        return self._max_error[1]
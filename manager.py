@@ -0,0 +1,181 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class TweenManager:
+    """A class to own tweens and update them every frame.
+       Tweens waiting for their delay are kept in a min-heap keyed by the time they start,
+       so that only the active tweens are updated each frame.
+       Finished tweens are removed automatically and their completion callbacks are called.
+       The callbacks of the events which occurred in a frame are called together after all the tweens
+       are updated, so that callbacks can add or remove tweens safely.
+        Args:
+            clock (callable): returns the current time in seconds; default is time.perf_counter.
+            profiler (Profiler): If specified, each frame of update is recorded by it while it is enabled.
+    """
+
+    def __init__(self, clock=None, profiler=None):
+        self.clock = clock
+        self.profiler = profiler
+        self.pending = []
+        self.active = []
+        self._entries = {}
+        self._futures = {}
+        self._events = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, tween):
+        return tween in self._entries
+
+    def get_time(self, now=None):
+        if now is not None:
+            return now
+
+        if self.clock is None:
+            return time.perf_counter()
+
+        return self.clock()
+
+    def add(self, tween, loop=False, repeat=None, on_complete=None, now=None,
+            on_start=None, on_update=None, on_yoyo=None, on_loop=None):
+        """Start the tween after its delay.
+            Args:
+                tween (Tween): the tween to be started; must not be playing.
+                loop (bool): If true, the tween is started by loop(), otherwise by start().
+                repeat (int): the number of repeats of the loop.
+                on_complete (callable): called with the tween when the tween is finished.
+                on_start (callable): called with the tween when the tween is started after its delay.
+                on_update (callable): called with the tween every frame after it is updated.
+                on_yoyo (callable): called with the tween when it turns back at the end point.
+                on_loop (callable): called with the tween when a pass of the loop ends and the next one begins.
+        """
+        if tween in self._entries:
+            raise ValueError('the tween has already been added.')
+
+        callbacks = dict(on_start=on_start, on_update=on_update, on_yoyo=on_yoyo, on_loop=on_loop)
+        # None if no callbacks are specified, so that the tween is updated without checking the events.
+        hooks = {name: func for name, func in callbacks.items() if func is not None} or None
+
+        start_time = self.get_time(now) + tween.delay
+        cnt = next(self._counter)
+        self._entries[tween] = (cnt, loop, repeat, on_complete, hooks)
+        heapq.heappush(self.pending, (start_time, cnt, tween))
+        return tween
+
+    def wait(self, tween):
+        """Return asyncio.Future which is resolved with the tween when the tween is finished,
+           so that it can be awaited; the future is cancelled if the tween is removed.
+           Must be called in the running event loop, in which update is also called.
+        """
+        if tween not in self._entries:
+            raise ValueError('the tween has not been added.')
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures.setdefault(tween, []).append(future)
+        return future
+
+    def remove(self, tween):
+        """Remove the tween without calling its completion callback.
+        """
+        if self._entries.pop(tween, None) is None:
+            return
+
+        if tween in self.active:
+            self.active.remove(tween)
+        # a pending tween is skipped when it is popped from the heap.
+
+        for future in self._futures.pop(tween, []):
+            future.cancel()
+
+    def clear(self):
+        self.pending.clear()
+        self.active.clear()
+        self._entries.clear()
+
+        for futures in self._futures.values():
+            for future in futures:
+                future.cancel()
+
+        self._futures.clear()
+
+    def activate(self, now):
+        while self.pending and self.pending[0][0] <= now:
+            start_time, cnt, tween = heapq.heappop(self.pending)
+            entry = self._entries.get(tween)
+
+            # skip the tweens removed while pending.
+            if entry is None or entry[0] != cnt:
+                continue
+
+            _, loop, repeat, _, hooks = entry
+            tween.setup(loop, repeat, start_time)
+            self.active.append(tween)
+
+            if hooks is not None and (func := hooks.get('on_start')) is not None:
+                self._events.append((func, tween))
+
+    def update(self, now=None):
+        """Start the tweens whose delay has passed and update the active tweens.
+           Returns the list of tweens finished in this frame.
+        """
+        now = self.get_time(now)
+
+        if self.profiler is not None:
+            self.profiler.begin_frame()
+
+        self.activate(now)
+
+        entries = self._entries
+        events = self._events
+        playing = []
+        finished = []
+
+        for tween in self.active:
+            if (hooks := entries[tween][4]) is None:
+                tween.update(now)
+            else:
+                start_time = tween.start_time
+                tween.update(now)
+
+                # start_time is reset when the tween turns back or begins the next pass.
+                if tween.start_time != start_time and tween.is_playing:
+                    name = 'on_yoyo' if tween.is_turning_back else 'on_loop'
+
+                    if (func := hooks.get(name)) is not None:
+                        events.append((func, tween))
+
+                if (func := hooks.get('on_update')) is not None:
+                    events.append((func, tween))
+
+            if tween.is_playing:
+                playing.append(tween)
+            else:
+                finished.append(tween)
+
+        self.active = playing
+
+        for tween in finished:
+            _, _, _, on_complete, _ = entries.pop(tween)
+
+            if on_complete is not None:
+                events.append((on_complete, tween))
+
+            for future in self._futures.pop(tween, []):
+                if not future.done():
+                    future.set_result(tween)
+
+        self._events = []
+
+        for func, tween in events:
+            func(tween)
+
+        if self.profiler is not None:
+            paused = sum(tween.is_paused for tween in playing)
+            self.profiler.end_frame(len(playing) - paused, paused, len(finished), len(self.pending))
+
+        return finished
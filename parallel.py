@@ -0,0 +1,49 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .group import TweenGroup
+
+
+class ParallelTweenGroup(TweenGroup):
+    """A TweenGroup that splits the arrays into chunks and computes them in a thread pool.
+       numpy ufuncs and the numba kernel release the GIL, so the chunks are computed in parallel,
+       and every chunk writes its positions directly into the shared next_pos.
+       The usage is the same as TweenGroup; call close() or use the with statement to stop the threads.
+        Args:
+            workers (int): the number of threads; default is os.cpu_count().
+            min_chunk (int): the minimum number of tweens in a chunk; smaller groups are computed in one chunk.
+            The other arguments are the same as TweenGroup.
+    """
+
+    def __init__(self, *args, workers=None, min_chunk=50000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self.executor = ThreadPoolExecutor(self.workers)
+        self.chunks = self.split(self.size)
+
+    def split(self, n):
+        cnt = max(1, min(self.workers, math.ceil(n / self.min_chunk)))
+        bounds = [n * i // cnt for i in range(cnt + 1)]
+        return [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def compute(self, now, active, sl=slice(None)):
+        if len(self.chunks) == 1:
+            super().compute(now, active, sl)
+            return
+
+        compute = super().compute
+        futures = [self.executor.submit(compute, now, active, chunk) for chunk in self.chunks]
+
+        for future in futures:
+            future.result()
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
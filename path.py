@@ -0,0 +1,130 @@
+import numpy as np
+
+from .tween import Tween
+
+
+class Path:
+    """A class for a curve through control points, parameterized by normalized arc length.
+       The arc-length table is computed once when the path is created,
+       so that sampling is a lookup and an interpolation.
+        Args:
+            points (list):
+                the control points; can be specified as numpy.ndarray, panda3d.core.Point3 and so on.
+                For catmull_rom, the curve passes through all of the points.
+                For bezier, the points are joined cubic Bezier curves; the number of them must be 3n + 1.
+            kind (string): 'catmull_rom' or 'bezier'; default is catmull_rom.
+            resolution (int): the number of arc-length samples per segment; default is 64.
+    """
+
+    def __init__(self, points, kind='catmull_rom', resolution=64):
+        first = points[0]
+        self.point_type = None if isinstance(first, (np.ndarray, list, tuple)) else type(first)
+        pts = np.array([np.ravel(p) for p in points], dtype=np.float64)
+
+        if kind == 'catmull_rom':
+            if len(pts) < 2:
+                raise ValueError('catmull_rom requires at least 2 points.')
+            self.coeffs = self.catmull_rom_coeffs(pts)
+        elif kind == 'bezier':
+            if len(pts) < 4 or (len(pts) - 1) % 3:
+                raise ValueError(f'the number of points for bezier must be 3n + 1: {len(pts)}')
+            self.coeffs = self.bezier_coeffs(pts)
+        else:
+            raise ValueError(f'not applicable kind: {kind}')
+
+        self.points = pts
+        self.kind = kind
+        self.segments = len(self.coeffs)
+        self.build_table(resolution)
+
+    @staticmethod
+    def catmull_rom_coeffs(pts):
+        """Return the coefficients of the cubic polynomials of the segments; shape (segments, 4, dim).
+           Both ends are extended by extrapolated points.
+        """
+        padded = np.concatenate([[2 * pts[0] - pts[1]], pts, [2 * pts[-1] - pts[-2]]])
+        p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+
+        a = (-p0 + 3 * p1 - 3 * p2 + p3) / 2
+        b = (2 * p0 - 5 * p1 + 4 * p2 - p3) / 2
+        c = (p2 - p0) / 2
+        return np.stack([a, b, c, p1], axis=1)
+
+    @staticmethod
+    def bezier_coeffs(pts):
+        p0, p1, p2, p3 = pts[:-1:3], pts[1::3], pts[2::3], pts[3::3]
+
+        a = -p0 + 3 * p1 - 3 * p2 + p3
+        b = 3 * (p0 - 2 * p1 + p2)
+        c = 3 * (p1 - p0)
+        return np.stack([a, b, c, p0], axis=1)
+
+    def evaluate(self, u):
+        """Return the points at the curve parameter u in the bounds of 0 to the number of segments.
+        """
+        u = np.asarray(u, dtype=np.float64)
+        seg = np.clip(u.astype(np.intp), 0, self.segments - 1)
+        t = (u - seg)[..., None]
+        a, b, c, d = (self.coeffs[seg, i] for i in range(4))
+        return ((a * t + b) * t + c) * t + d
+
+    def build_table(self, resolution):
+        self.u_table = np.linspace(0, self.segments, self.segments * resolution + 1)
+        pts = self.evaluate(self.u_table)
+        lengths = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(pts, axis=0), axis=1))])
+        self.length = lengths[-1]
+
+        if self.length > 0:
+            self.s_table = lengths / self.length
+        else:
+            self.s_table = np.linspace(0, 1, len(lengths))
+
+    def sample_many(self, t):
+        """Return the points at the normalized arc lengths t in the bounds of 0 to 1 as numpy.ndarray;
+           the shape of the result is t.shape + (dim,).
+        """
+        u = np.interp(t, self.s_table, self.u_table)
+        return self.evaluate(u)
+
+    def sample(self, t, out=None):
+        """Return the point at the normalized arc length t; the type of the point is the same as
+           that of the control points. If out is specified, the point is written into it.
+        """
+        pt = self.sample_many(t)
+
+        if out is not None:
+            if isinstance(out, np.ndarray):
+                out[...] = pt
+            else:
+                out.set(*pt)
+            return out
+
+        if self.point_type is None:
+            return pt
+
+        return self.point_type(*pt)
+
+
+class PathTween(Tween):
+    """A class for tweening along a Path.
+       The eased progress is applied to the normalized arc length, so that the speed along the path
+       follows the easing function regardless of the spacing of the control points.
+        Args:
+            path (Path): the path to move along.
+            The other arguments are the same as Tween.
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path, duration, delay=0, yoyo=False, easing_type='linear', lut=None, clock=None):
+        super().__init__(0.0, 1.0, duration, delay, yoyo, easing_type, lut, clock)
+        self.path = path
+        self.next_pos = path.sample(0.0)
+
+    def interpolate(self, v, out=None):
+        return self.path.sample(super().interpolate(v), out)
+
+    def sample_at(self, t, loop=False, repeat=None):
+        """Return the points at the times t as numpy.ndarray of shape t.shape + (dim,).
+        """
+        return self.path.sample_many(super().sample_at(t, loop, repeat)[..., 0])
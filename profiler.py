@@ -0,0 +1,189 @@
+import functools
+import json
+import time
+import tracemalloc
+from collections import deque
+
+from .tween import Tween
+
+
+class Profiler:
+    """A class to measure the cost of updating tweens. Nothing is measured until enable() is called:
+       then Tween.update is replaced with a wrapper measuring the calls and time, which are also summed up
+       for each easing function over the updates that evaluated it. disable() restores the original,
+       so there is no overhead when the profiler is disabled.
+       The frames are recorded by begin_frame and end_frame, which TweenManager calls if it has a profiler.
+        Args:
+            track_allocations (bool): If true, the memory allocated in each frame is measured by tracemalloc,
+                which slows down everything considerably; default is false.
+            max_frames (int): the number of the latest frames to be kept; default is 10000.
+    """
+
+    _enabled = None
+
+    def __init__(self, track_allocations=False, max_frames=10000):
+        self.track_allocations = track_allocations
+        self.frames = deque(maxlen=max_frames)
+        # the numbers and times of the updates that evaluated each easing function
+        self.ease_calls = {}
+        self.ease_update_time = {}
+        self._original_update = None
+        self._started_tracing = False
+        self._frame_start = None
+        self.reset()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    @property
+    def enabled(self):
+        return Profiler._enabled is self
+
+    def reset(self):
+        self.update_calls = 0
+        self.update_time = 0
+        self.ease_calls.clear()
+        self.ease_update_time.clear()
+        self.frames.clear()
+
+    def enable(self):
+        if Profiler._enabled is self:
+            return
+
+        if Profiler._enabled is not None:
+            raise ValueError('another profiler is already enabled.')
+
+        original = Tween.update
+        perf_counter_ns = time.perf_counter_ns
+        ease_calls = self.ease_calls
+        ease_update_time = self.ease_update_time
+
+        @functools.wraps(original)
+        def update(tween, now=None, out=None):
+            # paused and stopped tweens return without evaluating the easing function.
+            evaluated = tween.is_playing and not tween.is_paused
+            start = perf_counter_ns()
+            original(tween, now, out)
+            elapsed = perf_counter_ns() - start
+
+            if evaluated:
+                name = tween.ease.__name__
+                ease_calls[name] = ease_calls.get(name, 0) + 1
+                ease_update_time[name] = ease_update_time.get(name, 0) + elapsed
+
+            self.update_calls += 1
+            self.update_time += elapsed
+
+        self._original_update = original
+        Tween.update = update
+        Profiler._enabled = self
+
+        # tracing started by others, such as python -X tracemalloc, is left as it is.
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def disable(self):
+        if Profiler._enabled is not self:
+            return
+
+        Tween.update = self._original_update
+        self._original_update = None
+        Profiler._enabled = None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+
+        self._frame_start = time.perf_counter_ns()
+        self._frame_calls = self.update_calls
+        self._frame_time = self.update_time
+
+        if self.track_allocations:
+            tracemalloc.reset_peak()
+            self._frame_memory = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self, active=0, paused=0, finished=0, pending=0):
+        """Record the frame begun by begin_frame with the numbers of the tweens.
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+
+        end = time.perf_counter_ns()
+        frame = dict(
+            start=self._frame_start,
+            duration=end - self._frame_start,
+            update_calls=self.update_calls - self._frame_calls,
+            update_time=self.update_time - self._frame_time,
+            active=active,
+            paused=paused,
+            finished=finished,
+            pending=pending,
+        )
+
+        if self.track_allocations:
+            # the peak of the memory allocated during the frame
+            frame['allocated'] = tracemalloc.get_traced_memory()[1] - self._frame_memory
+
+        self.frames.append(frame)
+        self._frame_start = None
+
+    def snapshot(self):
+        """Return the statistics as a dict; times are in nanoseconds.
+           The updates outside of begin_frame and end_frame are also counted in the totals.
+        """
+        return dict(
+            frames=len(self.frames),
+            update_calls=self.update_calls,
+            update_time=self.update_time,
+            eases={
+                name: dict(calls=calls, update_time=self.ease_update_time[name])
+                for name, calls in self.ease_calls.items()
+            },
+            last_frame=dict(self.frames[-1]) if self.frames else None,
+        )
+
+    def to_json(self, path=None):
+        """Return the snapshot and the frames as a JSON string, and write it into the file if path is specified.
+        """
+        text = json.dumps(dict(self.snapshot(), frame_records=list(self.frames)), indent=2)
+
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+
+        return text
+
+    def to_chrome_trace(self, path=None):
+        """Return the frames in the Chrome trace event format, which can be opened in chrome://tracing
+           or Perfetto, and write it as JSON into the file if path is specified.
+        """
+        events = []
+
+        for frame in self.frames:
+            ts = frame['start'] / 1000  # microseconds
+            events.append(dict(
+                name='frame', ph='X', ts=ts, dur=frame['duration'] / 1000, pid=0, tid=0,
+                args=dict(update_calls=frame['update_calls'], update_time=frame['update_time'] / 1000)
+            ))
+            counters = {key: frame[key] for key in ('active', 'paused', 'finished', 'pending')}
+            events.append(dict(name='tweens', ph='C', ts=ts, pid=0, tid=0, args=counters))
+
+            if 'allocated' in frame:
+                events.append(dict(name='allocated', ph='C', ts=ts, pid=0, tid=0, args=dict(bytes=frame['allocated'])))
+
+        trace = dict(traceEvents=events, displayTimeUnit='ms')
+
+        if path is not None:
+            with open(path, 'w') as f:
+                json.dump(trace, f)
+
+        return trace
@@ -0,0 +1,591 @@
+import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+from .ease import Ease
+
+
+class ParametricEase:
+    """A class for an easing function built from parameters.
+       Called with a scalar like the functions in the Ease class, or with numpy.ndarray, which is evaluated by vec.
+        Args:
+            name (string): the name, from which get_ease can build the same function again.
+            func (callable): the function for a scalar.
+            vec (callable): the function for numpy.ndarray.
+    """
+
+    def __init__(self, name, func, vec):
+        self.__name__ = name
+        self.func = func
+        self.vec = vec
+
+    def __call__(self, x):
+        if isinstance(x, np.ndarray):
+            return self.vec(x)
+
+        return self.func(x)
+
+    def __repr__(self):
+        return f'ParametricEase({self.__name__})'
+
+    def bake(self, resolution=1024, interpolation='linear'):
+        """Return an EaseLUT sampling this function, which is evaluated at the same cost however it is composed.
+        """
+        from .lut import EaseLUT
+        return EaseLUT(self, resolution, interpolation)
+
+
+def _format_name(name, *params):
+    # repr gives the shortest string that is read back as the same float, so the name builds the same function.
+    return f"{name}({', '.join(repr(p) if isinstance(p, float) else str(p) for p in params)})"
+
+
+def cubic_bezier(x1, y1, x2, y2, samples=101):
+    """Return the easing function of the CSS cubic-bezier(x1, y1, x2, y2), memoized by the parameters.
+       The x of the curve is sampled once into a table; for each progress x, the curve parameter t is
+       guessed from the table and refined by Newton's method, or by bisection if Newton's method fails.
+    """
+    return _cubic_bezier(x1, y1, x2, y2, samples)
+
+
+@lru_cache(maxsize=None)
+def _cubic_bezier(x1, y1, x2, y2, samples):
+    if not (0 <= x1 <= 1 and 0 <= x2 <= 1):
+        raise ValueError(f'x1 and x2 must be in the bounds of 0 to 1: {x1}, {x2}')
+
+    cx = 3 * x1
+    bx = 3 * (x2 - x1) - cx
+    ax = 1 - cx - bx
+    cy = 3 * y1
+    by = 3 * (y2 - y1) - cy
+    ay = 1 - cy - by
+
+    ts = np.linspace(0.0, 1.0, samples)
+    xs = ((ax * ts + bx) * ts + cx) * ts
+    x_table = xs.tolist()
+    t_table = ts.tolist()
+
+    def solve(x):
+        i = min(max(bisect_right(x_table, x) - 1, 0), samples - 2)
+        span = x_table[i + 1] - x_table[i]
+        t = t_table[i] + (t_table[i + 1] - t_table[i]) * ((x - x_table[i]) / span if span > 0 else 0.0)
+
+        for _ in range(4):
+            err = ((ax * t + bx) * t + cx) * t - x
+
+            if abs(err) < 1e-12:
+                return t
+
+            slope = (3 * ax * t + 2 * bx) * t + cx
+
+            if abs(slope) < 1e-9:
+                break
+
+            t -= err / slope
+
+        lo, hi = t_table[i], t_table[i + 1]
+        t = (lo + hi) / 2
+
+        for _ in range(60):
+            err = ((ax * t + bx) * t + cx) * t - x
+
+            if abs(err) < 1e-12:
+                break
+
+            if err > 0:
+                hi = t
+            else:
+                lo = t
+
+            t = (lo + hi) / 2
+
+        return t
+
+    def func(x):
+        if x <= 0.0 or x >= 1.0:
+            return 0.0 if x <= 0.0 else 1.0
+
+        t = solve(x)
+        return ((ay * t + by) * t + cy) * t
+
+    def solve_vec(x):
+        """The same iterations as solve for numpy.ndarray; each element stops where solve returns.
+        """
+        i = np.clip(np.searchsorted(xs, x, side='right') - 1, 0, samples - 2)
+        lo, hi = ts[i], ts[i + 1]
+        span = xs[i + 1] - xs[i]
+        t = lo + (hi - lo) * np.where(span > 0, (x - xs[i]) / np.where(span > 0, span, 1.0), 0.0)
+        newton = np.ones(x.shape, dtype=bool)
+        solved = np.zeros(x.shape, dtype=bool)
+
+        for _ in range(4):
+            err = ((ax * t + bx) * t + cx) * t - x
+            converged = newton & (np.abs(err) < 1e-12)
+            solved |= converged
+            newton &= ~converged
+            slope = (3 * ax * t + 2 * bx) * t + cx
+            newton &= np.abs(slope) >= 1e-9
+            t = np.where(newton, t - err / np.where(newton, slope, 1.0), t)
+
+        # bisection where Newton's method failed
+        bisecting = ~solved
+        t = np.where(bisecting, (lo + hi) / 2, t)
+
+        for _ in range(60):
+            if not bisecting.any():
+                break
+
+            err = ((ax * t + bx) * t + cx) * t - x
+            bisecting &= np.abs(err) >= 1e-12
+            hi = np.where(bisecting & (err > 0), t, hi)
+            lo = np.where(bisecting & (err <= 0), t, lo)
+            t = np.where(bisecting, (lo + hi) / 2, t)
+
+        return t
+
+    def vec(x):
+        x = np.asarray(x, dtype=np.float64)
+        t = solve_vec(x)
+        y = ((ay * t + by) * t + cy) * t
+        return np.where(x <= 0.0, 0.0, np.where(x >= 1.0, 1.0, y))
+
+    return ParametricEase(_format_name('cubic_bezier', x1, y1, x2, y2), func, vec)
+
+
+def steps(n, position='end'):
+    """Return the easing function of the CSS steps(n, jump-start or jump-end), memoized by the parameters.
+    """
+    return _steps(n, position)
+
+
+@lru_cache(maxsize=None)
+def _steps(n, position):
+    if n < 1:
+        raise ValueError(f'the number of steps must be 1 or more: {n}')
+
+    if position == 'end':
+        rounding, np_rounding = math.floor, np.floor
+    elif position == 'start':
+        rounding, np_rounding = math.ceil, np.ceil
+    else:
+        raise ValueError(f'not applicable position: {position}')
+
+    def func(x):
+        return min(max(rounding(x * n) / n, 0.0), 1.0)
+
+    def vec(x):
+        return np.clip(np_rounding(np.asarray(x, dtype=np.float64) * n) / n, 0.0, 1.0)
+
+    return ParametricEase(_format_name('steps', n, position), func, vec)
+
+
+def back(overshoot=1.70158, mode='in'):
+    """Return the back easing function with the overshoot, memoized by the parameters;
+       the default overshoot gives in_back, out_back and in_out_back of the Ease class.
+    """
+    return _back(overshoot, mode)
+
+
+@lru_cache(maxsize=None)
+def _back(overshoot, mode):
+    c1 = overshoot
+    c2 = c1 * 1.525
+    c3 = c1 + 1
+
+    if mode == 'in':
+        def func(x):
+            return x if x == 1.0 else c3 * x * x * x - c1 * x * x
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            return np.where(x == 1.0, x, c3 * x * x * x - c1 * x * x)
+    elif mode == 'out':
+        def func(x):
+            return x if x == 0.0 else 1 + c3 * (x - 1) ** 3 + c1 * (x - 1) ** 2
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            return np.where(x == 0.0, x, 1 + c3 * (x - 1) ** 3 + c1 * (x - 1) ** 2)
+    elif mode == 'in_out':
+        def func(x):
+            return ((2 * x) ** 2 * ((c2 + 1) * 2 * x - c2)) / 2 if x < 0.5 \
+                else ((2 * x - 2) ** 2 * ((c2 + 1) * (x * 2 - 2) + c2) + 2) / 2
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            return np.where(
+                x < 0.5,
+                ((2 * x) ** 2 * ((c2 + 1) * 2 * x - c2)) / 2,
+                ((2 * x - 2) ** 2 * ((c2 + 1) * (x * 2 - 2) + c2) + 2) / 2
+            )
+    else:
+        raise ValueError(f'not applicable mode: {mode}')
+
+    return ParametricEase(_format_name(f'{mode}_back', overshoot), func, vec)
+
+
+def elastic(period=None, mode='in'):
+    """Return the elastic easing function with the period, memoized by the parameters;
+       if period is not specified, 0.3 for in and out and 0.45 for in_out, which give
+       in_elastic, out_elastic and in_out_elastic of the Ease class.
+    """
+    if period is None:
+        period = 0.45 if mode == 'in_out' else 0.3
+
+    return _elastic(period, mode)
+
+
+@lru_cache(maxsize=None)
+def _elastic(period, mode):
+    if period <= 0:
+        raise ValueError(f'period must be positive: {period}')
+
+    c = math.tau / (10 * period)
+    shift = 2.5 * period
+
+    if mode == 'in':
+        def func(x):
+            if x == 0.0 or x == 1.0:
+                return x
+            return -2 ** (10 * x - 10) * math.sin((x * 10 - 10 - shift) * c)
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            y = -np.exp2(10 * x - 10) * np.sin((x * 10 - 10 - shift) * c)
+            return np.where((x == 0.0) | (x == 1.0), x, y)
+    elif mode == 'out':
+        def func(x):
+            if x == 0.0 or x == 1.0:
+                return x
+            return 2 ** (-10 * x) * math.sin((x * 10 - shift) * c) + 1
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            y = np.exp2(-10 * x) * np.sin((x * 10 - shift) * c) + 1
+            return np.where((x == 0.0) | (x == 1.0), x, y)
+    elif mode == 'in_out':
+        def func(x):
+            if x == 0.0 or x == 1.0:
+                return x
+            if x < 0.5:
+                return -(2 ** (20 * x - 10) * math.sin((20 * x - 10 - shift) * c)) / 2
+            return 2 ** (-20 * x + 10) * math.sin((20 * x - 10 - shift) * c) / 2 + 1
+
+        def vec(x):
+            x = np.asarray(x, dtype=np.float64)
+            s = np.sin((20 * x - 10 - shift) * c)
+            y = np.where(x < 0.5, -(np.exp2(20 * x - 10) * s) / 2, np.exp2(-20 * x + 10) * s / 2 + 1)
+            return np.where((x == 0.0) | (x == 1.0), x, y)
+    else:
+        raise ValueError(f'not applicable mode: {mode}')
+
+    return ParametricEase(_format_name(f'{mode}_elastic', period), func, vec)
+
+
+# Combinators build an easing function from other easing functions, which are specified by functions
+# or names accepted by get_ease. The function for numpy.ndarray evaluates each of the functions once
+# for the whole array, and the result can be baked into a lookup table by ParametricEase.bake.
+
+def reverse(func):
+    """Return the easing function played backward and upside down, 1 - func(1 - x); for example,
+       the reverse of out_bounce is in_bounce.
+    """
+    return _reverse(get_ease(func))
+
+
+@lru_cache(maxsize=None)
+def _reverse(f):
+    f_vec = get_vec_ease(f)
+
+    def func(x):
+        return 1.0 - f(1.0 - x)
+
+    def vec(x):
+        return 1.0 - f_vec(1.0 - np.asarray(x, dtype=np.float64))
+
+    return ParametricEase(_format_name('reverse', f.__name__), func, vec)
+
+
+def mirror(func):
+    """Return the easing function that plays func in the first half and its reverse in the second half;
+       for example, the mirror of in_expo is in_out_expo.
+    """
+    return _mirror(get_ease(func))
+
+
+@lru_cache(maxsize=None)
+def _mirror(f):
+    f_vec = get_vec_ease(f)
+
+    def func(x):
+        if x < 0.5:
+            return f(2 * x) / 2
+        return 1.0 - f(2 - 2 * x) / 2
+
+    def vec(x):
+        x = np.asarray(x, dtype=np.float64)
+        first = x < 0.5
+        y = f_vec(np.where(first, 2 * x, 2 - 2 * x)) / 2
+        return np.where(first, y, 1.0 - y)
+
+    return ParametricEase(_format_name('mirror', f.__name__), func, vec)
+
+
+def blend(func1, func2, weight=0.5):
+    """Return the weighted average of two easing functions, func1 * (1 - weight) + func2 * weight.
+    """
+    return _blend(get_ease(func1), get_ease(func2), weight)
+
+
+@lru_cache(maxsize=None)
+def _blend(f1, f2, weight):
+    f1_vec = get_vec_ease(f1)
+    f2_vec = get_vec_ease(f2)
+
+    def func(x):
+        y = f1(x)
+        return y + (f2(x) - y) * weight
+
+    def vec(x):
+        x = np.asarray(x, dtype=np.float64)
+        y = f1_vec(x)
+        return y + (f2_vec(x) - y) * weight
+
+    return ParametricEase(_format_name('blend', f1.__name__, f2.__name__, float(weight)), func, vec)
+
+
+def piecewise(*funcs, breaks=None):
+    """Return the easing function that plays the functions one after another. The progress is divided at
+       breaks, by default into equal segments, and each function goes from the start to the end of its segment;
+       for example, piecewise('in_quad', 'out_elastic') plays in_quad in the first half from 0 to 0.5.
+    """
+    if breaks is None:
+        breaks = [i / len(funcs) for i in range(1, len(funcs))]
+
+    return _piecewise(tuple(get_ease(f) for f in funcs), tuple(float(b) for b in breaks))
+
+
+@lru_cache(maxsize=None)
+def _piecewise(fs, breaks):
+    if not fs:
+        raise ValueError('one or more functions must be specified.')
+
+    if len(breaks) != len(fs) - 1:
+        raise ValueError(f'breaks must have {len(fs) - 1} values: {len(breaks)}')
+
+    edges = (0.0,) + breaks + (1.0,)
+
+    if any(lo >= hi for lo, hi in zip(edges[:-1], edges[1:])):
+        raise ValueError(f'breaks must be increasing in the bounds of 0 to 1: {breaks}')
+
+    vecs = [get_vec_ease(f) for f in fs]
+    last = len(fs) - 1
+    lows = np.array(edges[:-1])
+    spans = np.diff(edges)
+
+    def func(x):
+        i = min(bisect_right(breaks, x), last)
+        lo, hi = edges[i], edges[i + 1]
+        return lo + (hi - lo) * fs[i]((x - lo) / (hi - lo))
+
+    def vec(x):
+        x = np.asarray(x, dtype=np.float64)
+        i = np.minimum(np.searchsorted(breaks, x, side='right'), last)
+        lo = lows[i]
+        span = spans[i]
+        u = (x - lo) / span
+        y = np.empty_like(u)
+
+        for k, f_vec in enumerate(vecs):
+            selected = i == k
+            y[selected] = f_vec(u[selected])
+
+        return lo + span * y
+
+    return ParametricEase(_format_name('piecewise', *[f.__name__ for f in fs], *breaks), func, vec)
+
+
+def time_scale(func, start=0.0, end=1.0):
+    """Return the easing function that plays func during start to end of the progress,
+       staying at its start before and at its end after.
+    """
+    return _time_scale(get_ease(func), start, end)
+
+
+@lru_cache(maxsize=None)
+def _time_scale(f, start, end):
+    if start >= end:
+        raise ValueError(f'start must be less than end: {start}, {end}')
+
+    f_vec = get_vec_ease(f)
+    scale = 1.0 / (end - start)
+
+    def func(x):
+        return f(min(max((x - start) * scale, 0.0), 1.0))
+
+    def vec(x):
+        return f_vec(np.clip((np.asarray(x, dtype=np.float64) - start) * scale, 0.0, 1.0))
+
+    return ParametricEase(_format_name('time_scale', f.__name__, float(start), float(end)), func, vec)
+
+
+def clamp(func, low=0.0, high=1.0):
+    """Return the easing function whose values are clamped to low to high,
+       for example, to cut the overshoot of the back and elastic functions.
+    """
+    return _clamp(get_ease(func), low, high)
+
+
+@lru_cache(maxsize=None)
+def _clamp(f, low, high):
+    if low > high:
+        raise ValueError(f'low must be high or less: {low}, {high}')
+
+    f_vec = get_vec_ease(f)
+
+    def func(x):
+        return min(max(f(x), low), high)
+
+    def vec(x):
+        return np.clip(f_vec(x), low, high)
+
+    return ParametricEase(_format_name('clamp', f.__name__, float(low), float(high)), func, vec)
+
+
+def _piecewise_factory(*params):
+    funcs = [p for p in params if isinstance(p, str)]
+    breaks = [p for p in params if not isinstance(p, str)]
+    return piecewise(*funcs, breaks=breaks or None)
+
+
+FACTORIES = {
+    'cubic_bezier': cubic_bezier,
+    'cubic-bezier': cubic_bezier,
+    'steps': steps,
+    'in_back': lambda *args: back(*args, mode='in'),
+    'out_back': lambda *args: back(*args, mode='out'),
+    'in_out_back': lambda *args: back(*args, mode='in_out'),
+    'in_elastic': lambda *args: elastic(*args, mode='in'),
+    'out_elastic': lambda *args: elastic(*args, mode='out'),
+    'in_out_elastic': lambda *args: elastic(*args, mode='in_out'),
+    'reverse': reverse,
+    'mirror': mirror,
+    'blend': blend,
+    'piecewise': _piecewise_factory,
+    'time_scale': time_scale,
+    'clamp': clamp,
+}
+
+_registered = {}
+
+_pattern = re.compile(r'^\s*([\w-]+)\s*\((.*)\)\s*$')
+
+
+def register(name, func, vec=None):
+    """Register a custom easing function by the name, so that it can be specified as easing_type.
+       If vec, the function for numpy.ndarray, is not specified, func is vectorized by numpy.vectorize.
+    """
+    if hasattr(Ease, name) or name in FACTORIES:
+        raise ValueError(f'the name is already used: {name}')
+
+    if vec is None:
+        vec = np.vectorize(func, otypes=[np.float64])
+
+    _registered[name] = ParametricEase(name, func, vec)
+    return _registered[name]
+
+
+def unregister(name):
+    _registered.pop(name, None)
+
+
+def _parse_param(param):
+    try:
+        return int(param)
+    except ValueError:
+        pass
+
+    try:
+        return float(param)
+    except ValueError:
+        return param
+
+
+def _split_params(params):
+    """Split the parameters at the commas outside of parentheses,
+       so that a parameter can be an easing function with its own parameters.
+    """
+    parts = []
+    depth = 0
+    begin = 0
+
+    for i, c in enumerate(params):
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(params[begin:i])
+            begin = i + 1
+
+    parts.append(params[begin:])
+    return parts
+
+
+def parse(easing_type):
+    """Build a parametric easing function from a string such as 'cubic-bezier(0.25, 0.1, 0.25, 1)',
+       'steps(4, start)', 'out_back(2.5)' or 'blend(linear, in_out_back(2.5), 0.7)';
+       return None if the string is not of such form.
+    """
+    if (m := _pattern.match(easing_type)) is None:
+        return None
+
+    if (factory := FACTORIES.get(m.group(1))) is None:
+        return None
+
+    params = [_parse_param(p.strip()) for p in _split_params(m.group(2)) if p.strip()]
+    return factory(*params)
+
+
+def get_ease(easing_type):
+    """Return the easing function for a scalar: a function of the Ease class, a registered function
+       or a parametric function built from the string. A callable is returned as is.
+       Raises AttributeError if not found.
+    """
+    if callable(easing_type):
+        return easing_type
+
+    if not isinstance(easing_type, str):
+        raise AttributeError(easing_type)
+
+    if isinstance(func := getattr(Ease, easing_type, None), type(Ease.linear)):
+        return func
+
+    if (func := _registered.get(easing_type)) is not None:
+        return func
+
+    if (func := parse(easing_type)) is not None:
+        return func
+
+    raise AttributeError(easing_type)
+
+
+def get_vec_ease(func):
+    """Return the easing function for numpy.ndarray corresponding to func returned by get_ease.
+    """
+    from .lut import EaseLUT
+
+    if isinstance(func, ParametricEase):
+        return func.vec
+
+    if isinstance(func, EaseLUT):
+        return func
+
+    # looked up by identity, so that a custom function named like a function of the Ease class is not replaced.
+    if func is getattr(Ease, name := getattr(func, '__name__', ''), None):
+        return getattr(Ease.vec, name)
+
+    return np.vectorize(func, otypes=[np.float64])
@@ -0,0 +1,141 @@
+import numpy as np
+
+from .group import TweenGroup
+from .tween import Tween
+
+
+def _as_quats(q):
+    return np.array([np.ravel(v) for v in q], dtype=np.float64)
+
+
+def nlerp(q0, q1, t):
+    """Interpolate quaternions linearly and normalize them; cheaper than slerp,
+       but the angular speed is not constant.
+        Args:
+            q0, q1 (numpy.ndarray): quaternions in the order of (w, x, y, z) as Panda3D; shape (4,) or (N, 4).
+            t (float or numpy.ndarray): the progress; shape () or (N,).
+    """
+    q0 = np.asarray(q0, dtype=np.float64)
+    q1 = np.asarray(q1, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+
+    # take the shorter way
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0, -q1, q1)
+
+    q = q0 + (q1 - q0) * t
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def slerp(q0, q1, t):
+    """Interpolate quaternions along the great arc at constant angular speed.
+       Where the quaternions are almost the same, nlerp is used to avoid division by zero.
+        Args:
+            q0, q1 (numpy.ndarray): quaternions in the order of (w, x, y, z) as Panda3D; shape (4,) or (N, 4).
+            t (float or numpy.ndarray): the progress; shape () or (N,).
+    """
+    q0 = np.asarray(q0, dtype=np.float64)
+    q1 = np.asarray(q1, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+
+    dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+    q1 = np.where(dot < 0, -q1, q1)
+    dot = np.minimum(np.abs(dot), 1.0)
+
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    close = sin_theta < 1e-6
+    sin_theta = np.where(close, 1.0, sin_theta)
+
+    w0 = np.where(close, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+    w1 = np.where(close, t, np.sin(t * theta) / sin_theta)
+    q = w0 * q0 + w1 * q1
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+INTERPOLATIONS = {'slerp': slerp, 'nlerp': nlerp}
+
+
+def get_interpolation(mode):
+    try:
+        return INTERPOLATIONS[mode]
+    except KeyError:
+        raise ValueError(f'not applicable mode: {mode}')
+
+
+class RotationTween(Tween):
+    """A class for tweening orientations by quaternions instead of componentwise lerp.
+        Args:
+            start (panda3d.core.Quat or numpy.ndarray): the starting orientation; (w, x, y, z) for numpy.ndarray.
+            end (panda3d.core.Quat or numpy.ndarray): the end orientation.
+            mode (string): 'slerp' or 'nlerp'; default is slerp.
+            The other arguments are the same as Tween.
+    """
+
+    __slots__ = ('start_quat', 'end_quat', 'quat_type', 'lerp')
+
+    def __init__(self, start, end, duration, delay=0, yoyo=False, easing_type='linear',
+                 lut=None, clock=None, mode='slerp'):
+        super().__init__(0.0, 1.0, duration, delay, yoyo, easing_type, lut, clock)
+        self.quat_type = None if isinstance(start, np.ndarray) else type(start)
+        self.start_quat = np.array(start, dtype=np.float64).reshape(4)
+        self.end_quat = np.array(end, dtype=np.float64).reshape(4)
+        self.lerp = get_interpolation(mode)
+        self.next_pos = start
+
+    def interpolate(self, v, out=None):
+        q = self.lerp(self.start_quat, self.end_quat, super().interpolate(v))
+
+        if out is not None:
+            if isinstance(out, np.ndarray):
+                out[...] = q
+            else:
+                out.set(*q)
+            return out
+
+        if self.quat_type is None:
+            return q
+
+        return self.quat_type(*q)
+
+    def sample_at(self, t, loop=False, repeat=None):
+        """Return the quaternions at the times t as numpy.ndarray of shape t.shape + (4,).
+        """
+        return self.lerp(self.start_quat, self.end_quat, super().sample_at(t, loop, repeat)[..., 0])
+
+
+class RotationTweenGroup(TweenGroup):
+    """A class for tweening many orientations at once.
+       The progress of the tweens is computed by TweenGroup, and the quaternions are interpolated
+       by one vectorized call; the results are stored in orientations, an array of shape (N, 4).
+        Args:
+            start (numpy.ndarray or list): the starting quaternions (w, x, y, z); shape (N, 4) or a list of Quat.
+            end (numpy.ndarray or list): the end quaternions.
+            mode (string): 'slerp' or 'nlerp'; default is slerp.
+            The other arguments are the same as TweenGroup.
+    """
+
+    def __init__(self, start, end, duration, delay=0, yoyo=False, easing_type='linear',
+                 clock=None, backend=None, mode='slerp'):
+        self.start_quat = _as_quats(start)
+        self.end_quat = _as_quats(end)
+
+        if self.start_quat.shape != self.end_quat.shape or self.start_quat.shape[1:] != (4,):
+            raise ValueError(f'start and end must be of shape (N, 4): {self.start_quat.shape}, {self.end_quat.shape}')
+
+        n = len(self.start_quat)
+        super().__init__(np.zeros(n), np.ones(n), duration, delay, yoyo, easing_type, clock, backend)
+        self.lerp = get_interpolation(mode)
+        self.orientations = self.start_quat.copy()
+
+    def update(self, now=None):
+        """Advance all of the playing tweens and return orientations, the (N, 4) array of quaternions.
+        """
+        progress = super().update(now)
+        self.orientations[...] = self.lerp(self.start_quat, self.end_quat, progress[:, 0])
+        return self.orientations
+
+    def bake(self, fps, loop=False, repeat=None):
+        """Return all the quaternions sampled at fps as an array of shape (frames, N, 4).
+        """
+        return self.lerp(self.start_quat, self.end_quat, super().bake(fps, loop, repeat)[..., 0])
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+from .manager import TweenManager
+
+
+async def ticks(fps, clock=None):
+    """Yield the current time at fps, waiting for each frame by asyncio.sleep instead of busy-waiting.
+       The deadlines of the frames are advanced from the first frame by the frame interval,
+       so that the errors of sleep do not accumulate; if a frame is late by more than one interval,
+       the deadlines are restarted from it instead of yielding the missed frames one after another.
+        Args:
+            fps (float): the frame rate.
+            clock (callable): returns the current time in seconds; default is time.perf_counter.
+    """
+    if fps <= 0:
+        raise ValueError(f'fps must be positive: {fps}')
+
+    if clock is None:
+        clock = time.perf_counter
+
+    interval = 1 / fps
+    deadline = clock()
+
+    while True:
+        now = clock()
+
+        if now - deadline > interval:
+            deadline = now
+
+        yield now
+        deadline += interval
+        await asyncio.sleep(max(deadline - clock(), 0.0))
+
+
+class AsyncRunner:
+    """A class to update tweens at a frame rate in the asyncio event loop.
+       The tweens are owned by a TweenManager, and a task updating them is started when a tween is added
+       and ends when all of them are finished.
+        Args:
+            fps (float): the frame rate; default is 60.
+            clock (callable): returns the current time in seconds; default is time.perf_counter.
+    """
+
+    def __init__(self, fps=60, clock=None):
+        self.fps = fps
+        self.clock = clock
+        self.manager = TweenManager(clock)
+        self.task = None
+
+    def __len__(self):
+        return len(self.manager)
+
+    def add(self, tween, loop=False, repeat=None, **callbacks):
+        """Add the tween in the same way as TweenManager.add, and start the task if it is not running.
+           Must be called in the running event loop.
+        """
+        self.manager.add(tween, loop, repeat, **callbacks)
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+        return tween
+
+    async def run(self):
+        async for now in ticks(self.fps, self.clock):
+            self.manager.update(now)
+
+            if not len(self.manager):
+                break
+
+    async def play(self, tween, loop=False, repeat=None, **callbacks):
+        """Add the tween and wait until it is finished.
+        """
+        self.add(tween, loop, repeat, **callbacks)
+        return await self.manager.wait(tween)
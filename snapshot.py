@@ -0,0 +1,321 @@
+import operator
+import time
+
+import numpy as np
+
+from .group import TweenGroup
+from .tween import Tween
+
+
+MAX_DIM = 4
+# the names of composite easing functions carry their parameters at full precision.
+NAME_SIZE = 128
+
+# The state of a tween as a record of fixed layout, so that the records of many tweens are stored in
+# one numpy structured array, which is written and memory-mapped as it is by numpy.save and numpy.load.
+# start and end are the current endpoints, which are swapped while the tween is turning back.
+# The times are stored relative to an epoch, so that an animation can be restored on another clock.
+STATE_DTYPE = np.dtype([
+    ('start', '<f8', MAX_DIM),
+    ('end', '<f8', MAX_DIM),
+    ('next_pos', '<f8', MAX_DIM),
+    ('duration', '<f8'),            # ms
+    ('delay', '<f8'),
+    ('start_time', '<f8'),          # seconds from the epoch; nan if not started
+    ('pause_start_time', '<f8'),    # seconds from the epoch; nan if not paused
+    ('step', '<f8'),
+    ('repeat', '<i8'),              # 0 if not specified
+    ('repeat_cnt', '<i8'),
+    ('dim', 'u1'),                  # 0 for a scalar
+    ('yoyo', '?'),
+    ('is_playing', '?'),
+    ('is_turning_back', '?'),
+    ('is_paused', '?'),
+    ('do_finish', '?'),
+    ('do_loop', '?'),
+    ('easing', f'S{NAME_SIZE}'),
+])
+
+FLAGS = ('yoyo', 'is_playing', 'is_turning_back', 'is_paused', 'do_finish', 'do_loop')
+
+_get_start = operator.attrgetter('start_pt')
+_get_end = operator.attrgetter('end_pt')
+_get_next_pos = operator.attrgetter('next_pos')
+_get_start_time = operator.attrgetter('start_time')
+
+
+def _now(clock):
+    if clock is None:
+        return time.perf_counter()
+
+    return clock()
+
+
+def _dim(pt):
+    try:
+        return len(pt)
+    except TypeError:
+        return 0
+
+
+def _encode(names):
+    """Return the names as an array of bytes; each name is checked only once.
+    """
+    for name in dict.fromkeys(names):
+        if len(name.encode()) > NAME_SIZE:
+            raise ValueError(f'the easing name must be {NAME_SIZE} bytes or less: {name}')
+
+    return np.array(names, dtype=STATE_DTYPE['easing'])
+
+
+def _point(values, dim, like=None):
+    """Convert the values of a record into a point of the same type as like;
+       a float or numpy.ndarray if like is not specified.
+    """
+    if dim == 0:
+        return values[0]
+
+    values = values[:dim]
+
+    if like is None:
+        return np.array(values)
+
+    if isinstance(like, np.ndarray):
+        return np.array(values, dtype=like.dtype).reshape(like.shape)
+
+    return type(like)(*values)
+
+
+def _points(points):
+    """Return the points as an array of shape (N, MAX_DIM) and the number of values of each point.
+    """
+    values = np.zeros((len(points), MAX_DIM), dtype=np.float64)
+
+    try:
+        uniform = np.array(points, dtype=np.float64)
+    except (ValueError, TypeError):
+        # the points have different dims.
+        uniform = None
+
+    if uniform is not None and uniform.ndim <= 2:
+        dims = np.full(len(points), uniform.shape[1] if uniform.ndim == 2 else 0)
+    else:
+        dims = np.array([_dim(pt) for pt in points])
+
+    if (max_dim := dims.max()) > MAX_DIM:
+        raise ValueError(f'the endpoints must have {MAX_DIM} or less values: {max_dim}')
+
+    if uniform is not None and uniform.ndim <= 2:
+        values[:, :max(dims[0], 1)] = uniform.reshape(len(points), -1)
+        return values, dims
+
+    for dim in np.unique(dims).tolist():
+        index = np.flatnonzero(dims == dim)
+        values[index, :max(dim, 1)] = np.array([points[i] for i in index], dtype=np.float64).reshape(len(index), -1)
+
+    return values, dims
+
+
+def dump_tweens(tweens, epoch=None):
+    """Return the states of Tween instances as a structured array of STATE_DTYPE.
+        Args:
+            tweens (list): Tween instances; the endpoints must have MAX_DIM or less values.
+            epoch (float): the time that the times are stored relative to;
+                default is the current time of the clock of the first tween.
+    """
+    tweens = list(tweens)
+    records = np.zeros(len(tweens), dtype=STATE_DTYPE)
+
+    if not tweens:
+        return records
+
+    if epoch is None:
+        epoch = tweens[0].get_time()
+
+    records['start'], records['dim'] = _points(list(map(_get_start, tweens)))
+    records['end'] = _points(list(map(_get_end, tweens)))[0]
+    records['next_pos'] = _points(list(map(_get_next_pos, tweens)))[0]
+
+    for field in ('duration', 'delay', 'step', 'repeat_cnt') + FLAGS:
+        records[field] = list(map(operator.attrgetter(field), tweens))
+
+    # None is converted to nan.
+    records['start_time'] = np.array(list(map(_get_start_time, tweens)), dtype=np.float64) - epoch
+    records['pause_start_time'] = np.array(
+        [t.pause_start_time if t.is_paused else None for t in tweens], dtype=np.float64) - epoch
+    records['repeat'] = [t.repeat or 0 for t in tweens]
+    records['easing'] = _encode([t.ease.__name__ for t in tweens])
+
+    return records
+
+
+def restore_tweens(records, tweens, epoch=None):
+    """Restore the states in records into Tween instances, so that they continue where they were dumped.
+       The endpoints keep their types, and the easing functions are not changed.
+        Args:
+            records (numpy.ndarray): the structured array returned by dump_tweens.
+            tweens (list): Tween instances, one for each record.
+            epoch (float): the time that the times are restored relative to;
+                default is the current time of the clock of the first tween.
+    """
+    tweens = list(tweens)
+
+    if len(records) != len(tweens):
+        raise ValueError(f'tweens must have {len(records)} items: {len(tweens)}')
+
+    if not tweens:
+        return tweens
+
+    if epoch is None:
+        epoch = tweens[0].get_time()
+
+    columns = {name: records[name].tolist() for name in STATE_DTYPE.names if name != 'easing'}
+
+    for i, tween in enumerate(tweens):
+        dim = columns['dim'][i]
+        start = _point(columns['start'][i], dim, tween._start_pt)
+        end = _point(columns['end'][i], dim, tween._start_pt)
+
+        tween.start_pt = start
+        tween.end_pt = end
+        tween.delta = end - start
+        tween._start_pt, tween._end_pt = (end, start) if columns['is_turning_back'][i] else (start, end)
+        tween.next_pos = _point(columns['next_pos'][i], dim, tween._start_pt)
+
+        start_time = columns['start_time'][i]
+        pause_start_time = columns['pause_start_time'][i]
+        tween.start_time = None if start_time != start_time else epoch + start_time
+        tween.pause_start_time = None if pause_start_time != pause_start_time else epoch + pause_start_time
+        tween.repeat = columns['repeat'][i] or None
+
+        for field in ('duration', 'delay', 'step', 'repeat_cnt') + FLAGS:
+            setattr(tween, field, columns[field][i])
+
+    return tweens
+
+
+def load_tweens(records, epoch=None, clock=None):
+    """Create Tween instances from records returned by dump_tweens. The endpoints are floats or numpy.ndarray,
+       and the easing functions are built from their names; a function that cannot be built from its name,
+       such as a lambda, falls back to linear, so use restore_tweens for such tweens.
+        Args:
+            records (numpy.ndarray): the structured array returned by dump_tweens.
+            epoch (float): the time that the times are restored relative to; default is the current time of clock.
+            clock (callable): the clock of the tweens; default is time.perf_counter.
+    """
+    if epoch is None:
+        epoch = _now(clock)
+
+    dims = records['dim'].tolist()
+    starts = records['start'].tolist()
+    ends = records['end'].tolist()
+    names = [name.decode() for name in records['easing'].tolist()]
+
+    tweens = [
+        Tween(_point(start, dim), _point(end, dim), 0, easing_type=name, clock=clock)
+        for start, end, dim, name in zip(starts, ends, dims, names)
+    ]
+
+    return restore_tweens(records, tweens, epoch)
+
+
+def dump_group(group, epoch=None):
+    """Return the states of the tweens in a TweenGroup as a structured array of STATE_DTYPE.
+        Args:
+            group (TweenGroup): the endpoints must have MAX_DIM or less values.
+            epoch (float): the time that the times are stored relative to; default is the current time of group.
+    """
+    n, dim = group.start_pt.shape
+
+    if dim > MAX_DIM:
+        raise ValueError(f'the endpoints must have {MAX_DIM} or less values: {dim}')
+
+    if epoch is None:
+        epoch = group.get_time()
+
+    records = np.zeros(n, dtype=STATE_DTYPE)
+    records['start'][:, :dim] = group.start_pt
+    records['end'][:, :dim] = group.end_pt
+    records['next_pos'][:, :dim] = group.next_pos
+    records['dim'] = dim
+    records['start_time'] = group.start_time - epoch
+    records['pause_start_time'] = np.where(group.is_paused, group.pause_start_time - epoch, np.nan)
+
+    for field in ('duration', 'delay', 'step', 'repeat', 'repeat_cnt') + FLAGS:
+        records[field] = getattr(group, field)
+
+    records['easing'] = _encode(group.ease_names)[group.ease_id]
+
+    return records
+
+
+def restore_group(records, group, epoch=None):
+    """Restore the states in records into a TweenGroup of the same size and dim,
+       so that it continues where it was dumped. The easing functions are not changed.
+        Args:
+            records (numpy.ndarray): the structured array returned by dump_group.
+            group (TweenGroup): the group to be restored.
+            epoch (float): the time that the times are restored relative to; default is the current time of group.
+    """
+    n, dim = group.start_pt.shape
+
+    if len(records) != n:
+        raise ValueError(f'records must have {n} items: {len(records)}')
+
+    if n and (dims := np.unique(records['dim'])).tolist() != [dim]:
+        raise ValueError(f'records must have the dim of the group, {dim}: {dims}')
+
+    if epoch is None:
+        epoch = group.get_time()
+
+    group.start_pt[:] = records['start'][:, :dim]
+    group.end_pt[:] = records['end'][:, :dim]
+    np.subtract(group.end_pt, group.start_pt, out=group.delta)
+    group.next_pos[:] = records['next_pos'][:, :dim]
+    group.start_time[:] = records['start_time'] + epoch
+    group.pause_start_time[:] = np.where(records['is_paused'], records['pause_start_time'] + epoch, 0.0)
+
+    for field in ('duration', 'delay', 'step', 'repeat', 'repeat_cnt') + FLAGS:
+        getattr(group, field)[:] = records[field]
+
+    return group
+
+
+def load_group(records, epoch=None, clock=None, backend=None):
+    """Create a TweenGroup from records returned by dump_group; the easing functions are built from their names.
+        Args:
+            records (numpy.ndarray): the structured array returned by dump_group; all the records must have the same dim.
+            epoch (float): the time that the times are restored relative to; default is the current time of clock.
+            clock (callable): the clock of the group; default is time.perf_counter.
+            backend (string): the backend of the group, the same as TweenGroup.
+    """
+    if not len(records):
+        raise ValueError('records must have one or more items.')
+
+    dim = max(int(records['dim'][0]), 1)
+    names = [name.decode() for name in records['easing'].tolist()]
+    uniques = list(dict.fromkeys(names))
+
+    group = TweenGroup(
+        records['start'][:, :dim], records['end'][:, :dim], records['duration'] / 1000,
+        easing_type=uniques[0] if len(uniques) == 1 else names, clock=clock, backend=backend
+    )
+
+    return restore_group(records, group, _now(clock) if epoch is None else epoch)
+
+
+def save(path, records):
+    """Write records into the file in the .npy format.
+    """
+    np.save(path, records, allow_pickle=False)
+
+
+def load(path, mmap_mode=None):
+    """Read records written by save; with mmap_mode such as 'r', the file is memory-mapped instead of read.
+    """
+    records = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
+    if records.dtype != STATE_DTYPE:
+        raise ValueError(f'not applicable dtype: {records.dtype}')
+
+    return records
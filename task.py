@@ -0,0 +1,165 @@
+import numpy as np
+from panda3d.core import ClockObject, GeomVertexColumn, GeomVertexWriter, InternalName
+
+from .manager import TweenManager
+
+
+class VertexColumnWriter:
+    """A class to write the positions of a TweenGroup into a column of GeomVertexData in bulk,
+       for example the vertices of a point cloud or the offsets of instances.
+       If the column is of float32, the positions are copied through a numpy view of the vertex array
+       at once; otherwise they are written row by row by GeomVertexWriter.
+        Args:
+            vdata (panda3d.core.GeomVertexData): the vertex data, which must have a row for each tween.
+            column (string): the name of the column; default is vertex.
+    """
+
+    def __init__(self, vdata, column='vertex'):
+        self.vdata = vdata
+        self.name = InternalName.make(column)
+        fmt = vdata.get_format()
+
+        if (col := fmt.get_column(self.name)) is None:
+            raise ValueError(f'the vertex data does not have the column: {column}')
+
+        self.array_index = fmt.get_array_with(self.name)
+        self.stride = fmt.get_array(self.array_index).get_stride()
+        self.start = col.get_start()
+        self.components = col.get_num_components()
+        self.bulk = col.get_numeric_type() == GeomVertexColumn.NT_float32
+
+    def write(self, positions):
+        """Write the positions, an array of shape (rows, dim), into the column.
+        """
+        rows, dim = positions.shape
+        dim = min(dim, self.components)
+
+        if self.vdata.get_num_rows() < rows:
+            self.vdata.set_num_rows(rows)
+
+        if self.bulk:
+            # modify_array marks the array as modified, so that it is uploaded again.
+            raw = np.frombuffer(memoryview(self.vdata.modify_array(self.array_index)).cast('B'), dtype=np.uint8)
+            view = raw.reshape(-1, self.stride)[:rows, self.start:self.start + self.components * 4].view(np.float32)
+            view[:, :dim] = positions[:, :dim]
+        else:
+            writer = GeomVertexWriter(self.vdata, self.name)
+            set_data = getattr(writer, f'set_data{self.components}f')
+            padded = np.zeros((rows, self.components))
+            padded[:, :dim] = positions[:, :dim]
+
+            for pos in padded.tolist():
+                set_data(*pos)
+
+
+class TweenTask:
+    """A class to update tweens by a single task of Panda3D's task manager, with the frame time of globalClock.
+       The positions are written into nodes by the setters cached when the tweens are added,
+       or into vertex data in bulk, so that one task replaces a task or callback for each node.
+        Args:
+            task_mgr (direct.task.Task.TaskManager): default is the global taskMgr.
+            clock (panda3d.core.ClockObject): default is the global clock.
+            name (string): the name of the task.
+            sort (int): the sort of the task.
+    """
+
+    def __init__(self, task_mgr=None, clock=None, name='pytweener', sort=0):
+        if task_mgr is None:
+            from direct.task.TaskManagerGlobal import taskMgr as task_mgr
+
+        self.task_mgr = task_mgr
+        self.clock = ClockObject.get_global_clock() if clock is None else clock
+        self.name = name
+        self.sort = sort
+        self.task = None
+        self.manager = TweenManager(clock=self.get_time)
+        self.setters = {}
+        self.groups = []
+
+    def get_time(self):
+        return self.clock.get_frame_time()
+
+    def add(self, tween, node=None, setter='set_pos', loop=False, repeat=None, **callbacks):
+        """Add the tween to the TweenManager; if node is specified, the position is written into it every frame
+           by the setter, the name of the method of NodePath such as set_pos, set_hpr or set_scale.
+           The other arguments are the same as TweenManager.add.
+        """
+        self.manager.add(tween, loop, repeat, **callbacks)
+
+        if node is not None:
+            self.setters[tween] = getattr(node, setter)
+
+        return tween
+
+    def remove(self, tween):
+        self.manager.remove(tween)
+        self.setters.pop(tween, None)
+
+    def add_group(self, group, nodes=None, setter='set_pos', vdata=None, column='vertex', loop=False, repeat=None):
+        """Start the TweenGroup and update it every frame. The positions are written into nodes, a list of
+           NodePath for each tween, by the cached setters, or into the column of vdata, GeomVertexData, in bulk.
+        """
+        if nodes is not None and len(nodes) != len(group):
+            raise ValueError(f'nodes must have {len(group)} items: {len(nodes)}')
+
+        setters = None if nodes is None else [getattr(node, setter) for node in nodes]
+        writer = None if vdata is None else VertexColumnWriter(vdata, column)
+
+        if loop:
+            group.loop(repeat, now=self.get_time())
+        else:
+            group.start(now=self.get_time())
+
+        self.groups.append((group, setters, writer))
+        return group
+
+    def remove_group(self, group):
+        self.groups = [item for item in self.groups if item[0] is not group]
+
+    def start(self):
+        """Add the task to the task manager.
+        """
+        if self.task is None:
+            self.task = self.task_mgr.add(self.update_task, self.name, sort=self.sort)
+
+    def stop(self):
+        if self.task is not None:
+            self.task_mgr.remove(self.task)
+            self.task = None
+
+    def update_task(self, task):
+        self.update()
+        return task.cont
+
+    def update(self, now=None):
+        """Update all the tweens and groups, and write their positions.
+        """
+        now = self.get_time() if now is None else now
+        finished = self.manager.update(now)
+        setters = self.setters
+
+        for tween in self.manager.active:
+            if (func := setters.get(tween)) is not None:
+                func(tween.next_pos)
+
+        # write the final positions of the tweens finished in this frame.
+        for tween in finished:
+            if (func := setters.pop(tween, None)) is not None:
+                func(tween.next_pos)
+
+        playing = []
+
+        for group, group_setters, writer in self.groups:
+            positions = group.update(now)
+
+            if group_setters is not None:
+                for func, pos in zip(group_setters, positions.tolist()):
+                    func(*pos)
+
+            if writer is not None:
+                writer.write(positions)
+
+            if group.is_any_playing:
+                playing.append((group, group_setters, writer))
+
+        self.groups = playing
@@ -0,0 +1,50 @@
+import unittest
+
+from ..benchmarks import bench
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_bench -v
+
+
+class TestCompare(unittest.TestCase):
+    """tests for bench.compare
+    """
+
+    def test_compare(self):
+        baseline = dict(results={
+            'ease.linear': dict(value=100, unit='ns/call'),
+            'ease.in_sine': dict(value=100, unit='ns/call'),
+            'tween.float.1': dict(value=1000, unit='updates/s'),
+            'tween.float.1000': dict(value=1000, unit='updates/s'),
+        })
+        current = dict(results={
+            'ease.linear': dict(value=125, unit='ns/call'),
+            'ease.in_sine': dict(value=80, unit='ns/call'),
+            'tween.float.1': dict(value=800, unit='updates/s'),
+            'tween.float.1000': dict(value=950, unit='updates/s'),
+            'tween.float.100000': dict(value=950, unit='updates/s'),
+        })
+        rows = bench.compare(current, baseline, threshold=0.1)
+        regressed = {name: regressed for name, *_, regressed in rows}
+
+        self.assertEqual(
+            regressed,
+            {
+                'ease.linear': True,
+                'ease.in_sine': False,
+                'tween.float.1': True,
+                'tween.float.1000': False
+            }
+        )
+
+    def test_run_quick(self):
+        data = bench.run(quick=True)
+        self.assertIn('ease.in_out_elastic', data['results'])
+        self.assertIn('tween.Point3.1000', data['results'])
+        self.assertEqual(data['results']['tween.ndarray.1']['unit'], 'updates/s')
+        self.assertEqual(data['results']['memory.Point3']['unit'], 'bytes/tween')
+
+
+if __name__ == '__main__':
+    unittest.main()
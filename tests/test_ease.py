@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from ..ease import Ease
 
 
@@ -59,5 +61,38 @@ class TestEase(unittest.TestCase):
                     self.assertEqual(result, expect)
 
 
+class TestVecEase(unittest.TestCase):
+
+    def test_endpoints(self):
+        x = np.array([0.0, 1.0])
+
+        for func_name in functions:
+            func = getattr(Ease.vec, func_name)
+
+            with self.subTest(func_name):
+                np.testing.assert_array_equal(func(x), x)
+
+    def test_match_scalar(self):
+        """The results must match the scalar versions within floating point rounding.
+        """
+        x = np.concatenate([np.linspace(0, 1, 1001), np.random.default_rng(0).random(1000)])
+
+        for func_name in functions:
+            vec_func = getattr(Ease.vec, func_name)
+            func = getattr(Ease, func_name)
+
+            with self.subTest(func_name):
+                expect = np.array([func(t) for t in x])
+                np.testing.assert_allclose(vec_func(x), expect, rtol=0, atol=1e-14)
+
+    def test_keep_shape(self):
+        x = np.linspace(0, 1, 12).reshape(3, 4)
+
+        for func_name in functions:
+            with self.subTest(func_name):
+                result = getattr(Ease.vec, func_name)(x)
+                self.assertEqual(result.shape, (3, 4))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
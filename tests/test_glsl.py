@@ -0,0 +1,154 @@
+import re
+import unittest
+
+import numpy as np
+from panda3d.core import GeomVertexReader
+
+from .. import glsl
+from ..ease import Ease
+from ..group import TweenGroup
+from ..jit import EASE_NAMES
+from ..timeline import progress_at
+from .test_ease import functions
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_glsl -v
+
+
+class TestSource(unittest.TestCase):
+    """tests for glsl.ease_source and glsl.shader_source
+    """
+
+    def test_all_functions(self):
+        self.assertEqual(set(glsl.EASE_BRANCHES), set(functions))
+        self.assertEqual(set(glsl.EASE_BRANCHES), set(EASE_NAMES))
+
+    def test_ease_source(self):
+        source = glsl.ease_source('in_out_expo')
+        self.assertTrue(source.startswith('float ease_in_out_expo(float x) {'))
+        self.assertIn('if ((x == 0.0) || (x == 1.0)) return x;', source)
+        self.assertEqual(source.count('return'), 3)
+
+        with self.assertRaises(ValueError):
+            glsl.ease_source('not_exist')
+
+    def test_shader_source(self):
+        source = glsl.shader_source()
+
+        for i, name in enumerate(EASE_NAMES):
+            with self.subTest(name):
+                self.assertIn(f'float ease_{name}(float x) {{', source)
+
+        self.assertIn('vec3 tween_position(float time, vec4 start, vec4 end, vec4 params)', source)
+        self.assertEqual(source.count('{'), source.count('}'))
+        # pow of GLSL is undefined for negative bases.
+        self.assertIsNone(re.search(r'\bpow\(', source))
+        # float literals only, because int is not converted to float implicitly in some GLSL versions.
+        for _, expr in [b for branches in glsl.EASE_BRANCHES.values() for b in branches]:
+            self.assertIsNone(re.search(r'(?<![\w.])\d+(?![\w.])', expr), expr)
+
+
+class TestParity(unittest.TestCase):
+    """tests for the expressions of the GLSL source transpiled to numpy
+    """
+
+    def test_parity(self):
+        x = np.concatenate([np.linspace(0, 1, 1001), [0.5 - 1e-12, 1 / 2.75, 2 / 2.75, 2.5 / 2.75]])
+
+        for name in functions:
+            with self.subTest(name):
+                func = glsl.numpy_function(name)
+                expect = [getattr(Ease, name)(t) for t in x]
+                np.testing.assert_allclose(func(x), expect, rtol=0, atol=1e-13)
+                self.assertEqual(func(0.0), getattr(Ease, name)(0.0))
+                self.assertEqual(func(1.0), getattr(Ease, name)(1.0))
+
+
+def tween_position(time, packed):
+    """The same as tween_position of the GLSL source.
+    """
+    start, end, params = packed[:, 0:4], packed[:, 4:8], packed[:, 8:12]
+    cycles = np.where(params[:, 2] > 0, params[:, 2], np.inf)
+    step, backward, _ = progress_at(time - start[:, 3], end[:, 3], 0, params[:, 1] > 0.5, cycles)
+    v = np.empty_like(step)
+
+    for i, (ease_id, s) in enumerate(zip(params[:, 0].astype(int), step)):
+        v[i] = glsl.numpy_function(EASE_NAMES[ease_id])(s)
+
+    v = v[:, None]
+    return np.where(backward[:, None], end[:, :3] + (start[:, :3] - end[:, :3]) * v,
+                    start[:, :3] + (end[:, :3] - start[:, :3]) * v)
+
+
+class TestPack(unittest.TestCase):
+    """tests for glsl.pack_group, make_vertex_data and make_buffer_texture
+    """
+
+    def setUp(self):
+        self.group = TweenGroup(
+            np.zeros((3, 3)), np.arange(9, dtype=np.float64).reshape(3, 3), [1, 2, 0.5],
+            delay=[0, 0.5, 1], yoyo=[False, True, True], easing_type=['in_quad', 'out_bounce', 'linear']
+        )
+
+    def test_pack_group(self):
+        packed = glsl.pack_group(self.group, start_time=0.0, loop=True, repeat=2)
+        self.assertEqual(packed.shape, (3, 12))
+        self.assertEqual(packed.dtype, np.float32)
+        np.testing.assert_array_equal(packed[:, 3], [0, 0.5, 1])
+        np.testing.assert_array_equal(packed[:, 7], [1, 2, 0.5])
+        np.testing.assert_array_equal(packed[:, 8], [EASE_NAMES.index(n) for n in ['in_quad', 'out_bounce', 'linear']])
+        np.testing.assert_array_equal(packed[:, 9:11], [[0, 2], [1, 2], [1, 2]])
+
+        endless = glsl.pack_group(self.group, loop=True)
+        np.testing.assert_array_equal(endless[:, 10], 0)
+
+    def test_same_as_bake(self):
+        packed = glsl.pack_group(self.group, loop=True, repeat=2)
+        baked = self.group.bake(8, loop=True, repeat=2)
+
+        for i, frame in enumerate(baked):
+            with self.subTest(i):
+                np.testing.assert_allclose(tween_position(i / 8, packed), frame, atol=1e-5)
+
+    def test_pack_turning_back(self):
+        expect = glsl.pack_group(self.group, loop=True, repeat=2)
+
+        # the yoyo tweens are turning back after 2.6 seconds.
+        self.group.loop(2, now=0)
+        self.group.update(now=2.6)
+        self.assertEqual(self.group.is_turning_back.tolist(), [False, True, True])
+
+        packed = glsl.pack_group(self.group, loop=True, repeat=2)
+        np.testing.assert_array_equal(packed, expect)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            glsl.pack_group(TweenGroup(np.zeros((2, 4)), np.ones((2, 4)), 1))
+
+        with self.assertRaises(ValueError):
+            glsl.pack_group(TweenGroup(np.zeros(2), np.ones(2), 1, easing_type='steps(4)'))
+
+    def test_vertex_data(self):
+        packed = glsl.pack_group(self.group)
+        vdata = glsl.make_vertex_data(packed)
+        self.assertEqual(vdata.get_num_rows(), 3)
+        self.assertEqual(vdata.get_format().get_array(0).get_divisor(), 1)
+
+        for i, column in enumerate(glsl.PACKED_COLUMNS):
+            with self.subTest(column):
+                reader = GeomVertexReader(vdata, column)
+                rows = [list(reader.get_data4()) for _ in range(3)]
+                np.testing.assert_array_equal(rows, packed[:, i * 4:i * 4 + 4])
+
+    def test_buffer_texture(self):
+        packed = glsl.pack_group(self.group)
+        texture = glsl.make_buffer_texture(packed)
+        self.assertEqual(texture.get_x_size(), 9)
+
+        image = np.frombuffer(bytes(texture.get_ram_image_as('RGBA')), dtype=np.float32)
+        np.testing.assert_array_equal(image, packed.ravel())
+
+
+if __name__ == '__main__':
+    unittest.main()
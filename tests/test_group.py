@@ -0,0 +1,324 @@
+import sys
+import unittest
+from io import StringIO
+
+import numpy as np
+from panda3d.core import Point3
+
+from ..group import TweenGroup, stagger
+from ..tween import Tween
+from ..ease import Ease
+from ..lut import EaseLUT
+from ..clock import ManualClock
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_group -v
+
+
+class TestInit(unittest.TestCase):
+    """tests for TweenGroup.__init__
+    """
+
+    def test_scalar_points(self):
+        group = TweenGroup([0, 1, 2], [10, 11, 12], 2)
+        self.assertEqual(group.next_pos.shape, (3, 1))
+        np.testing.assert_array_equal(group.delta, [[10], [10], [10]])
+        np.testing.assert_array_equal(group.duration, [2000, 2000, 2000])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            TweenGroup(np.zeros((3, 2)), np.zeros((3, 3)), 2)
+
+    def test_easing_type(self):
+        group = TweenGroup(np.zeros((3, 2)), np.ones((3, 2)), 2,
+                           easing_type=['in_sine', 'out_bounce', 'in_sine'])
+        self.assertEqual(group.ease_funcs, [Ease.vec.in_sine, Ease.vec.out_bounce])
+        np.testing.assert_array_equal(group.ease_id, [0, 1, 0])
+
+    def test_failed_get_func(self):
+        capture = StringIO()
+        sys.stdout = capture
+
+        try:
+            group = TweenGroup([0], [1], 2, easing_type='test_func')
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(group.ease_funcs, [Ease.vec.linear])
+        self.assertEqual(capture.getvalue(), 'not applicable: test_func\n')
+
+    def test_from_tweens(self):
+        tweens = [
+            Tween(Point3(0, 0, 0), Point3(3, 3, 3), 2, delay=1, easing_type='in_quad'),
+            Tween(Point3(1, 1, 1), Point3(4, 4, 4), 3, yoyo=True, easing_type='out_quad'),
+        ]
+        group = TweenGroup.from_tweens(tweens)
+
+        np.testing.assert_array_equal(group.start_pt, [[0, 0, 0], [1, 1, 1]])
+        np.testing.assert_array_equal(group.duration, [2000, 3000])
+        np.testing.assert_array_equal(group.delay, [1, 0])
+        np.testing.assert_array_equal(group.yoyo, [False, True])
+        self.assertEqual(group.ease_funcs, [Ease.vec.in_quad, Ease.vec.out_quad])
+
+    def test_from_tweens_functions(self):
+        # functions that cannot be built from their names are passed as they are.
+        lut = EaseLUT('in_out_elastic', 64)
+        tweens = [Tween(0, 1, 1, easing_type=lambda x: x * x), Tween(0, 1, 1, lut=64, easing_type='in_out_elastic')]
+        group = TweenGroup.from_tweens(tweens)
+        group.start(now=0)
+        np.testing.assert_allclose(group.update(now=0.3)[:, 0], [0.09, lut(0.3)])
+
+    def test_easing_function(self):
+        group = TweenGroup(np.zeros(2), np.ones(2), 1, easing_type=lambda x: x * x)
+        group.start(now=0)
+        np.testing.assert_allclose(group.update(now=0.5)[:, 0], [0.25, 0.25])
+
+
+class TestControl(unittest.TestCase):
+    """tests for TweenGroup.start, loop, pause, resume and finish
+    """
+
+    def test_start(self):
+        group = TweenGroup(np.zeros(3), np.ones(3), 2, delay=[0, 1, 2])
+        group.start(index=[0, 2], now=100)
+
+        np.testing.assert_array_equal(group.is_playing, [True, False, True])
+        np.testing.assert_array_equal(group.start_time, [100, 0, 102])
+        np.testing.assert_array_equal(group.do_loop, [False, False, False])
+
+        # tweens that are already playing are not restarted.
+        group.start(now=200)
+        np.testing.assert_array_equal(group.start_time, [100, 201, 102])
+
+    def test_loop(self):
+        group = TweenGroup(np.zeros(2), np.ones(2), 2)
+        group.loop(repeat=3, now=100)
+
+        np.testing.assert_array_equal(group.do_loop, [True, True])
+        np.testing.assert_array_equal(group.repeat, [3, 3])
+        np.testing.assert_array_equal(group.repeat_cnt, [0, 0])
+
+    def test_pause_resume(self):
+        group = TweenGroup(np.zeros(2), np.ones(2), 2)
+        group.start(now=100)
+        group.pause(index=0, now=120)
+
+        np.testing.assert_array_equal(group.is_paused, [True, False])
+        self.assertEqual(group.pause_start_time[0], 120)
+
+        group.resume(now=160)
+        np.testing.assert_array_equal(group.is_paused, [False, False])
+        np.testing.assert_array_equal(group.start_time, [140, 100])
+
+    def test_finish(self):
+        group = TweenGroup(np.zeros(3), np.ones(3), 2)
+        group.start(index=[0, 1], now=100)
+        group.pause(index=1, now=100)
+        group.finish()
+
+        np.testing.assert_array_equal(group.do_finish, [True, False, False])
+
+
+class TestUpdate(unittest.TestCase):
+    """tests for TweenGroup.update
+    """
+
+    def test_update(self):
+        start = np.array([[0, 0, 0], [10, 10, 10]])
+        end = np.array([[100, 100, 100], [20, 20, 20]])
+        group = TweenGroup(start, end, 2)
+        group.start(now=1000)
+        next_pos = group.update(now=1001)
+
+        self.assertIs(next_pos, group.next_pos)
+        np.testing.assert_array_equal(next_pos, [[50, 50, 50], [15, 15, 15]])
+
+    def test_easing_per_tween(self):
+        types = ['in_sine', 'out_bounce', 'in_out_elastic']
+        group = TweenGroup(np.zeros(3), np.full(3, 10.0), 2, easing_type=types)
+        group.start(now=1000)
+        group.update(now=1000.6)
+
+        expect = [getattr(Ease, name)(0.3) * 10 for name in types]
+        np.testing.assert_allclose(group.next_pos[:, 0], expect)
+
+    def test_delay(self):
+        group = TweenGroup(np.zeros(2), np.full(2, 100.0), 2, delay=[0, 1])
+        group.start(now=1000)
+        group.update(now=1001)
+
+        np.testing.assert_array_equal(group.next_pos[:, 0], [50, 0])
+
+    def test_not_playing_or_paused(self):
+        group = TweenGroup(np.zeros(3), np.full(3, 100.0), 2)
+        group.start(index=[0, 1], now=1000)
+        group.update(now=1001)
+        group.pause(index=1, now=1001)
+        group.update(now=1001.5)
+
+        np.testing.assert_array_equal(group.next_pos[:, 0], [75, 50, 0])
+
+    def test_not_yoyo_end(self):
+        group = TweenGroup([0], [100], 2)
+        group.start(now=1000)
+        group.update(now=1002)
+
+        self.assertFalse(group.is_playing[0])
+        self.assertEqual(group.next_pos[0, 0], 100)
+        self.assertEqual(group.start_time[0], 1000)
+
+    def test_not_yoyo_loop(self):
+        group = TweenGroup([0], [100], 2)
+        group.loop(repeat=2, now=1000)
+
+        group.update(now=1002)
+        self.assertTrue(group.is_playing[0])
+        self.assertEqual(group.repeat_cnt[0], 1)
+        self.assertEqual(group.start_time[0], 1002)
+
+        group.update(now=1004)
+        self.assertFalse(group.is_playing[0])
+
+    def test_yoyo(self):
+        group = TweenGroup([0], [100], 2, yoyo=True)
+        group.start(now=1000)
+
+        group.update(now=1002)
+        self.assertTrue(group.is_turning_back[0])
+        self.assertTrue(group.is_playing[0])
+        self.assertEqual(group.start_pt[0, 0], 100)
+        self.assertEqual(group.end_pt[0, 0], 0)
+        self.assertEqual(group.start_time[0], 1002)
+
+        group.update(now=1003)
+        self.assertEqual(group.next_pos[0, 0], 50)
+
+        group.update(now=1004)
+        self.assertFalse(group.is_turning_back[0])
+        self.assertFalse(group.is_playing[0])
+        self.assertEqual(group.next_pos[0, 0], 0)
+
+    def test_yoyo_loop_finish(self):
+        group = TweenGroup([0], [100], 2, yoyo=True)
+        group.loop(now=1000)
+        group.update(now=1002)
+        group.update(now=1004)
+        self.assertTrue(group.is_playing[0])
+
+        group.finish()
+        group.update(now=1006)
+        self.assertTrue(group.is_playing[0])
+        group.update(now=1008)
+        self.assertFalse(group.is_playing[0])
+
+    def test_clock(self):
+        clock = ManualClock(1000, step=0.5)
+        group = TweenGroup([0], [100], 2, clock=clock)
+        group.start()
+        clock.tick()
+        group.update()
+
+        self.assertEqual(group.next_pos[0, 0], 25)
+
+    def test_bake(self):
+        durations = [2, 1, 0.5]
+        delays = [0, 0.5, 1]
+        yoyos = [True, False, True]
+        types = ['linear', 'in_out_expo', 'out_back']
+        group = TweenGroup(np.zeros((3, 2)), np.full((3, 2), 8.0), durations,
+                           delay=delays, yoyo=yoyos, easing_type=types)
+        baked = group.bake(4, loop=True, repeat=2)
+
+        # the longest tween takes 8 seconds.
+        self.assertEqual(baked.shape, (33, 3, 2))
+
+        for i, params in enumerate(zip(durations, delays, yoyos, types)):
+            with self.subTest(i):
+                duration, delay, yoyo, name = params
+                tween = Tween(np.zeros(2), np.full(2, 8.0), duration, delay=delay, yoyo=yoyo, easing_type=name)
+                expect = tween.bake(4, loop=True, repeat=2)
+                n = len(expect)
+
+                np.testing.assert_allclose(baked[:n, i], expect)
+                # the tweens that ended earlier stay at their final positions.
+                np.testing.assert_allclose(baked[n:, i], np.broadcast_to(expect[-1], (33 - n, 2)))
+
+    def test_same_as_tween(self):
+        """Positions must be the same as those of Tween with the same settings.
+        """
+        types = ['linear', 'in_out_expo', 'out_back']
+        group = TweenGroup(np.zeros((3, 2)), np.full((3, 2), 8.0), 2, yoyo=True, easing_type=types)
+        tweens = [Tween(np.zeros(2), np.full(2, 8.0), 2, yoyo=True, easing_type=name) for name in types]
+
+        for tween in tweens:
+            tween.setup(True, 2)
+            tween.start_time = 1000
+        group.loop(repeat=2, now=1000)
+
+        for now in np.arange(1000, 1010, 0.25):
+            group.update(now=now)
+
+            for i, tween in enumerate(tweens):
+                with self.subTest((now, i)):
+                    tween.update(now)
+
+                    np.testing.assert_allclose(group.next_pos[i], tween.next_pos)
+                    self.assertEqual(group.is_playing[i], tween.is_playing)
+
+
+class TestStagger(unittest.TestCase):
+    """tests for stagger and TweenGroup.staggered
+    """
+
+    def test_orders(self):
+        tests = [
+            ('linear', [0, 1, 2, 3, 4]),
+            ('reverse', [4, 3, 2, 1, 0]),
+            ('center', [2, 1, 0, 1, 2]),
+            ('edges', [0, 1, 2, 1, 0]),
+        ]
+
+        for order, expect in tests:
+            with self.subTest(order):
+                np.testing.assert_allclose(stagger(5, 0.5, order), np.array(expect) * 0.5)
+
+        np.testing.assert_allclose(stagger(4, 1, 'center'), [1, 0, 0, 1])
+        np.testing.assert_allclose(stagger(4, 1, 'edges'), [0, 1, 1, 0])
+        np.testing.assert_allclose(stagger(3, 2, np.array([0.0, 0.5, 3.0])), [0, 1, 6])
+
+    def test_random(self):
+        delays = stagger(100, 0.1, 'random', seed=1)
+        np.testing.assert_array_equal(delays, stagger(100, 0.1, 'random', seed=1))
+        np.testing.assert_allclose(np.sort(delays), np.arange(100) * 0.1)
+        self.assertFalse(np.array_equal(delays, stagger(100, 0.1)))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            stagger(3, 1, 'sideways')
+
+        with self.assertRaises(ValueError):
+            stagger(3, 1, np.zeros(4))
+
+    def test_staggered(self):
+        group = TweenGroup.staggered(np.zeros(4), np.full(4, 10.0), 1, 0.5, delay=1, easing_type='in_quad')
+        np.testing.assert_allclose(group.delay, [1, 1.5, 2, 2.5])
+
+        group.start(now=0)
+        group.update(now=2)
+        np.testing.assert_allclose(group.next_pos[:, 0], [10, 2.5, 0, 0])
+        np.testing.assert_array_equal(group.is_playing, [False, True, True, True])
+
+        # the same as Tween started after each delay
+        group.update(now=2.7)
+
+        for i, delay in enumerate(group.delay):
+            with self.subTest(delay):
+                tween = Tween(0, 10, 1, easing_type='in_quad')
+                tween.start(now=delay)
+                tween.update(now=2.7)
+                self.assertAlmostEqual(group.next_pos[i, 0], tween.next_pos)
+
+
+if __name__ == '__main__':
+    unittest.main()
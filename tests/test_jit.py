@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from .. import jit
+from ..ease import Ease
+from ..group import TweenGroup
+from .test_ease import functions
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_jit -v
+
+
+class TestEaseArray(unittest.TestCase):
+    """tests for the compiled easing functions;
+       if numba is not installed, the same kernels are tested as Python functions.
+    """
+
+    def test_catalogue(self):
+        self.assertEqual(list(jit.EASE_NAMES), functions)
+
+    def test_match_scalar(self):
+        x = np.concatenate([np.linspace(0, 1, 1001), np.random.default_rng(0).random(1000)])
+
+        for func_name in functions:
+            with self.subTest(func_name):
+                expect = np.array([getattr(Ease, func_name)(t) for t in x])
+                result = jit.ease_array(func_name, x)
+                np.testing.assert_allclose(result, expect, rtol=0, atol=1e-14)
+
+    def test_endpoints(self):
+        x = np.array([0.0, 1.0])
+
+        for func_name in functions:
+            with self.subTest(func_name):
+                np.testing.assert_array_equal(jit.ease_array(func_name, x), x)
+
+    def test_keep_shape(self):
+        x = np.linspace(0, 1, 12).reshape(3, 4)
+        self.assertEqual(jit.ease_array('out_bounce', x).shape, (3, 4))
+
+    def test_get_ease_ids(self):
+        np.testing.assert_array_equal(jit.get_ease_ids(['linear', 'in_out_bounce']), [0, 30])
+        self.assertIsNone(jit.get_ease_ids(['linear', 'test_func']))
+
+
+class TestGroupUpdate(unittest.TestCase):
+    """tests for the compiled update of TweenGroup
+    """
+
+    def test_backend(self):
+        group = TweenGroup([0], [1], 2, backend='numpy')
+        self.assertEqual(group.backend, 'numpy')
+        self.assertIsNone(group._jit_ids)
+
+        with self.assertRaises(ValueError):
+            TweenGroup([0], [1], 2, backend='test_backend')
+
+    @unittest.skipUnless(jit.AVAILABLE, 'numba is not installed')
+    def test_same_as_numpy(self):
+        rng = np.random.default_rng(0)
+        start = rng.random((50, 3))
+        end = rng.random((50, 3))
+        duration = rng.uniform(0.5, 2, 50)
+        delay = rng.uniform(0, 1, 50)
+        yoyo = rng.random(50) < 0.5
+        types = rng.choice(functions, 50).tolist()
+
+        groups = [
+            TweenGroup(start, end, duration, delay=delay, yoyo=yoyo, easing_type=types, backend=backend)
+            for backend in ['numba', 'numpy']
+        ]
+        self.assertIsNotNone(groups[0]._jit_ids)
+
+        for group in groups:
+            group.loop(repeat=2, now=1000)
+            group.pause(index=slice(0, 5), now=1000.5)
+
+        for now in np.arange(1000, 1010, 0.1):
+            with self.subTest(now):
+                numba_pos, numpy_pos = [group.update(now).copy() for group in groups]
+                np.testing.assert_allclose(numba_pos, numpy_pos, rtol=0, atol=1e-12)
+                np.testing.assert_array_equal(groups[0].is_playing, groups[1].is_playing)
+
+
+if __name__ == '__main__':
+    unittest.main()
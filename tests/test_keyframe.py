@@ -0,0 +1,110 @@
+import sys
+import unittest
+from io import StringIO
+
+import numpy as np
+from panda3d.core import Point3
+
+from ..keyframe import KeyframeTrack
+from ..ease import Ease
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_keyframe -v
+
+
+class TestInit(unittest.TestCase):
+    """tests for KeyframeTrack.__init__
+    """
+
+    def test_values(self):
+        track = KeyframeTrack([0, 1, 3], [Point3(0, 0, 0), Point3(1, 2, 3), Point3(0, 0, 0)])
+        self.assertFalse(track.is_scalar)
+        self.assertEqual(track.values.shape, (3, 3))
+        np.testing.assert_array_equal(track.spans, [1, 2])
+        self.assertEqual(track.duration, 3)
+
+    def test_easing_type(self):
+        track = KeyframeTrack([0, 1, 2, 3], [0, 1, 2, 3], easing_type=['in_sine', 'out_bounce', 'in_sine'])
+        self.assertEqual(track.eases, [Ease.in_sine, Ease.out_bounce, Ease.in_sine])
+        self.assertEqual(track.vec_eases, [Ease.vec.in_sine, Ease.vec.out_bounce])
+        np.testing.assert_array_equal(track.ease_id, [0, 1, 0])
+
+    def test_failed_get_func(self):
+        capture = StringIO()
+        sys.stdout = capture
+
+        try:
+            track = KeyframeTrack([0, 1], [0, 1], easing_type='test_func')
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(track.eases, [Ease.linear])
+        self.assertEqual(capture.getvalue(), 'not applicable: test_func\n')
+
+    def test_invalid(self):
+        tests = [
+            [[0], [0], 'linear'],
+            [[0, 1, 1], [0, 1, 2], 'linear'],
+            [[0, 2, 1], [0, 1, 2], 'linear'],
+            [[0, 1, 2], [0, 1], 'linear'],
+            [[0, 1, 2], [0, 1, 2], ['linear']],
+        ]
+
+        for times, values, easing_type in tests:
+            with self.subTest((times, values, easing_type)):
+                with self.assertRaises(ValueError):
+                    KeyframeTrack(times, values, easing_type)
+
+
+class TestSample(unittest.TestCase):
+    """tests for KeyframeTrack.sample and sample_many
+    """
+
+    def setUp(self):
+        self.track = KeyframeTrack(
+            [1, 2, 4, 5],
+            [0, 10, 30, 0],
+            easing_type=['linear', 'in_quad', 'out_bounce']
+        )
+
+    def test_sample(self):
+        tests = [
+            [0, 0],
+            [1, 0],
+            [1.5, 5],
+            [2, 10],
+            [3, 15],
+            [4, 30],
+            [4.5, 30 - 30 * Ease.out_bounce(0.5)],
+            [5, 0],
+            [6, 0]
+        ]
+
+        for t, expect in tests:
+            with self.subTest(t):
+                self.assertAlmostEqual(self.track.sample(t), expect)
+
+    def test_cursor(self):
+        for t in np.arange(1, 5, 0.25):
+            self.track.sample(t)
+            self.assertEqual(self.track.cursor, np.searchsorted(self.track.times, t, side='right') - 1)
+
+        # jump backward by binary search
+        self.track.sample(1.5)
+        self.assertEqual(self.track.cursor, 0)
+
+    def test_sample_many(self):
+        t = np.linspace(0, 6, 61)
+        expect = [self.track.sample(v) for v in t]
+        np.testing.assert_allclose(self.track.sample_many(t), expect)
+        self.assertEqual(self.track.sample_many(t.reshape(61, 1)).shape, (61, 1))
+
+    def test_vector_values(self):
+        track = KeyframeTrack([0, 1, 2], [np.zeros(2), np.array([2, 4]), np.zeros(2)], easing_type='in_out_sine')
+        np.testing.assert_allclose(track.sample(0.5), [1, 2])
+        np.testing.assert_allclose(track.sample_many(np.array([0.5, 1.5])), [[1, 2], [1, 2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
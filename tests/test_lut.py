@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from ..lut import EaseLUT
+from ..ease import Ease
+from ..tween import Tween
+from .test_ease import functions
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_lut -v
+
+
+class TestEaseLUT(unittest.TestCase):
+
+    def test_endpoints(self):
+        for func_name in functions:
+            for interpolation in ['linear', 'cubic']:
+                with self.subTest((func_name, interpolation)):
+                    lut = EaseLUT(func_name, 256, interpolation)
+                    self.assertEqual(lut(0.0), getattr(Ease, func_name)(0.0))
+                    self.assertEqual(lut(1.0), getattr(Ease, func_name)(1.0))
+
+    def test_scalar_and_array(self):
+        x = np.linspace(0, 1, 101)
+
+        for interpolation in ['linear', 'cubic']:
+            with self.subTest(interpolation):
+                lut = EaseLUT('in_out_back', 64, interpolation)
+                expect = [lut(t) for t in x.tolist()]
+                np.testing.assert_allclose(lut(x), expect, rtol=0, atol=1e-15)
+
+    def test_clip(self):
+        lut = EaseLUT('in_quad', 16)
+        self.assertEqual(lut(-0.5), 0.0)
+        self.assertEqual(lut(1.5), 1.0)
+        np.testing.assert_array_equal(lut(np.array([-0.5, 1.5])), [0.0, 1.0])
+
+    def test_cache(self):
+        lut1 = EaseLUT(Ease.in_out_elastic, 512)
+        lut2 = EaseLUT('in_out_elastic', 512, 'cubic')
+        lut3 = EaseLUT('in_out_elastic', 1024)
+
+        self.assertIs(lut1.table, lut2.table)
+        self.assertIsNot(lut1.table, lut3.table)
+
+    def test_max_error(self):
+        for func_name in ['in_out_back', 'in_out_sine', 'in_cubic']:
+            with self.subTest(func_name):
+                coarse = EaseLUT(func_name, 64).max_error()
+                fine = EaseLUT(func_name, 1024).max_error()
+                cubic = EaseLUT(func_name, 1024, 'cubic').max_error()
+
+                self.assertLess(fine, coarse)
+                self.assertLess(fine, 1e-4)
+                self.assertLess(cubic, fine)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            EaseLUT('linear', 1)
+
+        with self.assertRaises(ValueError):
+            EaseLUT('linear', 16, 'quadratic')
+
+
+class TestTweenLUT(unittest.TestCase):
+
+    def test_tween_lut(self):
+        tween = Tween(0, 1, 2, easing_type='in_out_bounce', lut=1024)
+        self.assertIsInstance(tween.ease, EaseLUT)
+        self.assertIs(tween.ease.func, Ease.in_out_bounce)
+        self.assertEqual(tween.ease.resolution, 1024)
+
+    def test_tween_no_lut(self):
+        tween = Tween(0, 1, 2, easing_type='in_out_bounce')
+        self.assertIs(tween.ease, Ease.in_out_bounce)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from ..manager import TweenManager
+from ..tween import Tween
+from ..clock import ManualClock
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_manager -v
+
+
+class TestAdd(unittest.TestCase):
+    """tests for TweenManager.add and remove
+    """
+
+    def test_add(self):
+        manager = TweenManager(clock=ManualClock(100))
+        tweens = [Tween(0, 1, 2, delay=delay) for delay in [3, 1, 2]]
+
+        for tween in tweens:
+            manager.add(tween)
+
+        self.assertEqual(len(manager), 3)
+        self.assertEqual([start_time for start_time, _, _ in sorted(manager.pending)], [101, 102, 103])
+        self.assertEqual(manager.pending[0][2], tweens[1])
+
+        with self.assertRaises(ValueError):
+            manager.add(tweens[0])
+
+    def test_remove(self):
+        clock = ManualClock(0)
+        manager = TweenManager(clock=clock)
+        tween1 = manager.add(Tween(0, 1, 2))
+        tween2 = manager.add(Tween(0, 1, 2, delay=1))
+        manager.update()
+        self.assertEqual(manager.active, [tween1])
+
+        manager.remove(tween1)
+        manager.remove(tween2)
+        self.assertEqual(len(manager), 0)
+        self.assertEqual(manager.active, [])
+
+        clock.set(1)
+        manager.update()
+        self.assertEqual(manager.active, [])
+        self.assertFalse(tween2.is_playing)
+
+    def test_add_again_after_remove(self):
+        clock = ManualClock(0)
+        manager = TweenManager(clock=clock)
+        tween = manager.add(Tween(0, 1, 2, delay=1))
+        manager.remove(tween)
+        manager.add(tween, loop=True, now=0.5)
+
+        clock.set(1)
+        manager.update()
+        self.assertFalse(tween.is_playing)
+
+        clock.set(1.5)
+        manager.update()
+        self.assertTrue(tween.is_playing)
+        self.assertTrue(tween.do_loop)
+        self.assertEqual(tween.start_time, 1.5)
+
+
+class TestUpdate(unittest.TestCase):
+    """tests for TweenManager.update
+    """
+
+    def test_activate(self):
+        manager = TweenManager()
+        tweens = [manager.add(Tween(0, 100, 2, delay=delay), now=1000) for delay in [0, 0.5, 1]]
+
+        manager.update(now=1000.5)
+        self.assertEqual(manager.active, tweens[:2])
+        self.assertEqual(len(manager.pending), 1)
+        self.assertEqual([tween.start_time for tween in tweens[:2]], [1000, 1000.5])
+        self.assertEqual(tweens[0].next_pos, 25)
+        self.assertEqual(tweens[1].next_pos, 0)
+
+    def test_update_active_only(self):
+        manager = TweenManager()
+        active = manager.add(Tween(0, 100, 2), now=1000)
+        manager.add(Tween(0, 100, 2, delay=10), now=1000)
+
+        with mock.patch.object(Tween, 'update', autospec=True) as mock_update:
+            manager.update(now=1001)
+            mock_update.assert_called_once_with(active, 1001)
+
+    def test_finish(self):
+        on_complete = mock.MagicMock()
+        manager = TweenManager()
+        tween1 = manager.add(Tween(0, 100, 2), on_complete=on_complete, now=1000)
+        tween2 = manager.add(Tween(0, 100, 2, yoyo=True), on_complete=on_complete, now=1000)
+
+        self.assertEqual(manager.update(now=1002), [tween1])
+        on_complete.assert_called_once_with(tween1)
+        self.assertEqual(manager.active, [tween2])
+        self.assertEqual(len(manager), 1)
+
+        on_complete.reset_mock()
+        self.assertEqual(manager.update(now=1004), [tween2])
+        on_complete.assert_called_once_with(tween2)
+        self.assertEqual(len(manager), 0)
+
+    def test_loop(self):
+        manager = TweenManager()
+        tween = manager.add(Tween(0, 100, 2), loop=True, repeat=2, now=1000)
+
+        manager.update(now=1002)
+        self.assertIn(tween, manager)
+        manager.update(now=1004)
+        self.assertNotIn(tween, manager)
+
+
+class TestCallbacks(unittest.TestCase):
+    """tests for the callbacks of TweenManager
+    """
+
+    def test_events(self):
+        calls = []
+        manager = TweenManager()
+
+        def record(name):
+            return lambda tween: calls.append((name, tween))
+
+        tween = manager.add(
+            Tween(0, 100, 2, delay=1, yoyo=True), loop=True, repeat=2, now=1000,
+            on_start=record('start'), on_yoyo=record('yoyo'), on_loop=record('loop'), on_complete=record('complete')
+        )
+
+        manager.update(now=1000)
+        self.assertEqual(calls, [])
+
+        expects = [
+            (1001, [('start', tween)]),
+            (1002, []),
+            (1003, [('yoyo', tween)]),
+            (1005, [('loop', tween)]),
+            (1007, [('yoyo', tween)]),
+            (1009, [('complete', tween)]),
+        ]
+
+        for now, expect in expects:
+            with self.subTest(now):
+                calls.clear()
+                manager.update(now=now)
+                self.assertEqual(calls, expect)
+
+    def test_on_update(self):
+        on_update = mock.MagicMock()
+        manager = TweenManager()
+        tween = manager.add(Tween(0, 100, 2), on_update=on_update, now=1000)
+
+        manager.update(now=1001)
+        on_update.assert_called_once_with(tween)
+        self.assertEqual(tween.next_pos, 50)
+
+    def test_batched(self):
+        # callbacks are called after all the tweens are updated.
+        manager = TweenManager()
+        tweens = [Tween(0, 100, 2) for _ in range(3)]
+        states = []
+
+        def on_complete(tween):
+            states.append([t.is_playing for t in tweens])
+            manager.remove(tweens[2])
+
+        manager.add(tweens[0], on_complete=on_complete, now=1000)
+        manager.add(tweens[1], now=1000)
+        manager.add(tweens[2], now=1000)
+
+        self.assertEqual(manager.update(now=1002), tweens)
+        self.assertEqual(states, [[False, False, False]])
+
+
+class TestWait(unittest.TestCase):
+    """tests for TweenManager.wait
+    """
+
+    def test_wait(self):
+        async def main():
+            manager = TweenManager()
+            tween = manager.add(Tween(0, 100, 2), now=1000)
+            future = manager.wait(tween)
+
+            manager.update(now=1001)
+            self.assertFalse(future.done())
+
+            manager.update(now=1002)
+            self.assertIs(await future, tween)
+
+        asyncio.run(main())
+
+    def test_cancel(self):
+        async def main():
+            manager = TweenManager()
+            tween = manager.add(Tween(0, 100, 2), now=1000)
+            future = manager.wait(tween)
+            manager.remove(tween)
+
+            with self.assertRaises(asyncio.CancelledError):
+                await future
+
+        asyncio.run(main())
+
+    def test_not_added(self):
+        async def main():
+            with self.assertRaises(ValueError):
+                TweenManager().wait(Tween(0, 100, 2))
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
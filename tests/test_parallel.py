@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from ..group import TweenGroup
+from ..parallel import ParallelTweenGroup
+from .test_ease import functions
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_parallel -v
+
+
+class TestSplit(unittest.TestCase):
+    """tests for ParallelTweenGroup.split
+    """
+
+    def test_split(self):
+        with ParallelTweenGroup(np.zeros(10), np.ones(10), 2, workers=4, min_chunk=3) as group:
+            self.assertEqual(group.chunks, [slice(0, 2), slice(2, 5), slice(5, 7), slice(7, 10)])
+
+        with ParallelTweenGroup(np.zeros(10), np.ones(10), 2, workers=4, min_chunk=5) as group:
+            self.assertEqual(group.chunks, [slice(0, 5), slice(5, 10)])
+
+        with ParallelTweenGroup(np.zeros(10), np.ones(10), 2, workers=4) as group:
+            self.assertEqual(group.chunks, [slice(0, 10)])
+
+
+class TestUpdate(unittest.TestCase):
+    """tests for ParallelTweenGroup.update
+    """
+
+    def test_same_as_group(self):
+        rng = np.random.default_rng(0)
+        n = 1000
+        args = (rng.random((n, 3)), rng.random((n, 3)), rng.uniform(0.5, 2, n))
+        kwargs = dict(
+            delay=rng.uniform(0, 1, n),
+            yoyo=rng.random(n) < 0.5,
+            easing_type=rng.choice(functions, n).tolist()
+        )
+
+        for backend in ['numpy', None]:
+            with self.subTest(backend):
+                group = TweenGroup(*args, backend=backend, **kwargs)
+
+                with ParallelTweenGroup(*args, workers=3, min_chunk=100, backend=backend, **kwargs) as parallel:
+                    self.assertEqual(len(parallel.chunks), 3)
+
+                    for g in [group, parallel]:
+                        g.loop(repeat=2, now=1000)
+                        g.pause(index=slice(0, 50), now=1000.5)
+
+                    for now in np.arange(1000, 1010, 0.1):
+                        group.update(now)
+                        parallel.update(now)
+
+                        np.testing.assert_array_equal(parallel.next_pos, group.next_pos)
+                        np.testing.assert_array_equal(parallel.is_playing, group.is_playing)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+from panda3d.core import Point3
+
+from ..path import Path, PathTween
+from ..ease import Ease
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_path -v
+
+
+class TestPath(unittest.TestCase):
+    """tests for Path
+    """
+
+    def test_catmull_rom_passes_points(self):
+        pts = np.array([[0, 0], [1, 2], [3, 3], [4, 0]], dtype=np.float64)
+        path = Path(pts)
+
+        self.assertEqual(path.segments, 3)
+        np.testing.assert_allclose(path.evaluate(np.arange(4)), pts)
+
+    def test_bezier(self):
+        pts = np.array([[0, 0], [0, 1], [1, 1], [1, 0]], dtype=np.float64)
+        path = Path(pts, kind='bezier')
+
+        self.assertEqual(path.segments, 1)
+        np.testing.assert_allclose(path.evaluate(0.5), [0.5, 0.75])
+        np.testing.assert_allclose(path.evaluate(np.array([0.0, 1.0])), [[0, 0], [1, 0]])
+
+    def test_invalid(self):
+        tests = [
+            [[[0, 0]], 'catmull_rom'],
+            [[[0, 0], [1, 1], [2, 2]], 'bezier'],
+            [[[0, 0], [1, 1]], 'test_kind'],
+        ]
+
+        for points, kind in tests:
+            with self.subTest(kind):
+                with self.assertRaises(ValueError):
+                    Path(np.array(points), kind=kind)
+
+    def test_arc_length(self):
+        """On a straight line with uneven control points, equal arc lengths are equal distances.
+        """
+        path = Path(np.array([[0, 0], [1, 0], [2, 0], [10, 0]], dtype=np.float64), kind='bezier', resolution=256)
+        pts = path.sample_many(np.linspace(0, 1, 11))
+
+        self.assertAlmostEqual(path.length, 10, places=6)
+        np.testing.assert_allclose(pts[:, 0], np.arange(11), atol=1e-3)
+
+    def test_point_type(self):
+        path = Path([Point3(0, 0, 0), Point3(1, 1, 1), Point3(2, 0, 2)])
+        pt = path.sample(0.5)
+        self.assertIsInstance(pt, Point3)
+        self.assertTrue(pt.almost_equal(Point3(1, 1, 1), 1e-3))
+
+        out = Point3()
+        self.assertIs(path.sample(1.0, out), out)
+        self.assertTrue(out.almost_equal(Point3(2, 0, 2)))
+
+        path = Path(np.array([[0, 0], [1, 1]], dtype=np.float64))
+        self.assertIsInstance(path.sample(0.5), np.ndarray)
+
+    def test_sample_many(self):
+        path = Path([Point3(0, 0, 0), Point3(1, 1, 1), Point3(2, 0, 2)])
+        t = np.random.default_rng(0).random((5, 4))
+        pts = path.sample_many(t)
+
+        self.assertEqual(pts.shape, (5, 4, 3))
+        np.testing.assert_allclose(pts[2, 3], path.sample(t[2, 3]), rtol=1e-6)
+
+
+class TestPathTween(unittest.TestCase):
+    """tests for PathTween
+    """
+
+    def setUp(self):
+        self.path = Path([Point3(0, 0, 0), Point3(1, 1, 0), Point3(2, 0, 0), Point3(3, 1, 0)])
+
+    def test_update(self):
+        tween = PathTween(self.path, 2, easing_type='in_quad')
+        tween.start(now=1000)
+        tween.update(now=1001)
+
+        self.assertIsInstance(tween.next_pos, Point3)
+        self.assertTrue(tween.next_pos.almost_equal(self.path.sample(Ease.in_quad(0.5))))
+
+    def test_update_out_yoyo(self):
+        out = Point3()
+        tween = PathTween(self.path, 2, yoyo=True)
+        tween.start(now=1000)
+        tween.update(now=1002, out=out)
+        self.assertTrue(out.almost_equal(Point3(3, 1, 0)))
+
+        tween.update(now=1003.5, out=out)
+        self.assertIs(tween.next_pos, out)
+        self.assertTrue(out.almost_equal(self.path.sample(0.25)))
+
+    def test_bake(self):
+        tween = PathTween(self.path, 2, yoyo=True, easing_type='in_out_sine')
+        baked = tween.bake(4)
+
+        self.assertEqual(baked.shape, (17, 3))
+        np.testing.assert_allclose(baked[0], [0, 0, 0], atol=1e-12)
+        np.testing.assert_allclose(baked[8], [3, 1, 0], atol=1e-12)
+        np.testing.assert_allclose(baked[4], self.path.sample_many(0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
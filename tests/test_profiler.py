@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from ..manager import TweenManager
+from ..profiler import Profiler
+from ..tween import Tween
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_profiler -v
+
+
+class TestProfiler(unittest.TestCase):
+    """tests for Profiler
+    """
+
+    def test_enable_disable(self):
+        original = Tween.update
+        profiler = Profiler()
+
+        with profiler:
+            self.assertTrue(profiler.enabled)
+            self.assertIsNot(Tween.update, original)
+
+            with self.assertRaises(ValueError):
+                Profiler().enable()
+
+        self.assertFalse(profiler.enabled)
+        self.assertIs(Tween.update, original)
+
+    def test_disabled(self):
+        profiler = Profiler()
+        manager = TweenManager(profiler=profiler)
+        manager.add(Tween(0, 100, 2), now=1000)
+        manager.update(now=1001)
+
+        self.assertEqual(profiler.snapshot()['update_calls'], 0)
+        self.assertEqual(len(profiler.frames), 0)
+
+    def test_counts(self):
+        profiler = Profiler()
+        manager = TweenManager(profiler=profiler)
+        tweens = [
+            manager.add(Tween(0, 100, 2, easing_type='in_quad'), now=1000),
+            manager.add(Tween(0, 100, 1, easing_type='in_quad'), now=1000),
+            manager.add(Tween(0, 100, 2, easing_type='out_bounce'), now=1000),
+            manager.add(Tween(0, 100, 2, delay=5), now=1000),
+        ]
+
+        with profiler:
+            manager.update(now=1000.5)
+            tweens[0].pause(now=1000.5)
+            manager.update(now=1001)
+            # an update outside of frames
+            Tween(0, 1, 1, easing_type='in_quad').update(now=0)
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot['frames'], 2)
+        self.assertEqual(snapshot['update_calls'], 7)
+        # the paused tween and the tween not started do not evaluate in_quad.
+        self.assertEqual(snapshot['eases']['in_quad']['calls'], 3)
+        self.assertEqual(snapshot['eases']['out_bounce']['calls'], 2)
+        self.assertGreater(snapshot['update_time'], 0)
+        self.assertLessEqual(sum(e['update_time'] for e in snapshot['eases'].values()), snapshot['update_time'])
+
+        frame = snapshot['last_frame']
+        self.assertEqual(frame['update_calls'], 3)
+        self.assertEqual((frame['active'], frame['paused'], frame['finished'], frame['pending']), (1, 1, 1, 1))
+
+        profiler.reset()
+        self.assertEqual(profiler.snapshot()['update_calls'], 0)
+        self.assertEqual(profiler.snapshot()['eases'], {})
+
+    def test_allocations(self):
+        profiler = Profiler(track_allocations=True)
+        manager = TweenManager(profiler=profiler)
+        manager.add(Tween(0, 100, 2), now=1000)
+
+        with profiler:
+            manager.update(now=1001)
+
+        self.assertIn('allocated', profiler.frames[-1])
+
+    def test_tracing_kept(self):
+        # tracing started before the profiler is not stopped by it.
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+
+        with Profiler(track_allocations=True):
+            pass
+
+        self.assertTrue(tracemalloc.is_tracing())
+
+        tracemalloc.stop()
+
+        with Profiler(track_allocations=True):
+            self.assertTrue(tracemalloc.is_tracing())
+
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_dump(self):
+        profiler = Profiler(track_allocations=True)
+        manager = TweenManager(profiler=profiler)
+        manager.add(Tween(0, 100, 2), now=1000)
+
+        with profiler:
+            manager.update(now=1001)
+            manager.update(now=1002)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'stats.json')
+            text = profiler.to_json(path)
+
+            with open(path) as f:
+                self.assertEqual(json.load(f), json.loads(text))
+
+            path = os.path.join(dir_path, 'trace.json')
+            trace = profiler.to_chrome_trace(path)
+
+            with open(path) as f:
+                self.assertEqual(json.load(f), trace)
+
+        self.assertEqual(len(json.loads(text)['frame_records']), 2)
+        self.assertEqual([e['ph'] for e in trace['traceEvents']], ['X', 'C', 'C'] * 2)
+        self.assertEqual(trace['traceEvents'][1]['args']['finished'], 0)
+        self.assertEqual(trace['traceEvents'][4]['args']['finished'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,335 @@
+import unittest
+
+import numpy as np
+
+from .. import registry
+from ..ease import Ease
+from ..group import TweenGroup
+from ..keyframe import KeyframeTrack
+from ..lut import EaseLUT
+from ..tween import Tween
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_registry -v
+
+
+def brute_bezier(x1, y1, x2, y2, x):
+    """Solve x(t) = x by dense sampling and bisection as the reference.
+    """
+    def bezier(p1, p2, t):
+        return 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3
+
+    lo, hi = 0.0, 1.0
+
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if bezier(x1, x2, mid) < x:
+            lo = mid
+        else:
+            hi = mid
+
+    return bezier(y1, y2, (lo + hi) / 2)
+
+
+class TestCubicBezier(unittest.TestCase):
+    """tests for registry.cubic_bezier
+    """
+
+    def test_values(self):
+        x = np.linspace(0, 1, 201)
+
+        for params in [(0.25, 0.1, 0.25, 1.0), (0.42, 0.0, 0.58, 1.0), (0.0, 0.0, 1.0, 1.0), (0.3, -0.5, 0.7, 1.5)]:
+            with self.subTest(params):
+                func = registry.cubic_bezier(*params)
+                expect = [brute_bezier(*params, t) for t in x]
+                np.testing.assert_allclose([func(t) for t in x], expect, rtol=0, atol=1e-9)
+                np.testing.assert_allclose(func.vec(x), expect, rtol=0, atol=1e-9)
+
+    def test_endpoints(self):
+        func = registry.cubic_bezier(0.3, -0.5, 0.7, 1.5)
+        self.assertEqual(func(0.0), 0.0)
+        self.assertEqual(func(1.0), 1.0)
+        np.testing.assert_array_equal(func.vec(np.array([0.0, 1.0])), [0.0, 1.0])
+
+    def test_linear(self):
+        func = registry.cubic_bezier(0.0, 0.0, 1.0, 1.0)
+        self.assertAlmostEqual(func(0.5), 0.5, places=12)
+
+    def test_memoized(self):
+        self.assertIs(registry.cubic_bezier(0.25, 0.1, 0.25, 1.0), registry.cubic_bezier(0.25, 0.1, 0.25, 1.0))
+
+    def test_vec_same_as_scalar(self):
+        # the same iterations, including the bisection fallback, are run for a scalar and numpy.ndarray.
+        x = np.concatenate([np.linspace(0, 1, 2001), np.random.default_rng(0).random(2000)])
+
+        for params in [(0.25, 0.1, 0.25, 1.0), (0.3, -0.5, 0.7, 1.5), (1.0, 0.0, 0.0, 1.0), (0.123456789, 0.2, 0.9, 0.95)]:
+            with self.subTest(params):
+                func = registry.cubic_bezier(*params)
+                np.testing.assert_array_equal(func.vec(x), [func(t) for t in x])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            registry.cubic_bezier(1.5, 0.0, 0.5, 1.0)
+
+
+class TestParametric(unittest.TestCase):
+    """tests for registry.steps, back and elastic
+    """
+
+    def test_steps(self):
+        x = np.array([0.0, 0.1, 0.25, 0.5, 0.99, 1.0])
+
+        end = registry.steps(4)
+        self.assertEqual([end(t) for t in x], [0.0, 0.0, 0.25, 0.5, 0.75, 1.0])
+        np.testing.assert_array_equal(end.vec(x), [0.0, 0.0, 0.25, 0.5, 0.75, 1.0])
+
+        start = registry.steps(4, 'start')
+        self.assertEqual([start(t) for t in x], [0.0, 0.25, 0.25, 0.5, 1.0, 1.0])
+        np.testing.assert_array_equal(start.vec(x), [0.0, 0.25, 0.25, 0.5, 1.0, 1.0])
+
+        with self.assertRaises(ValueError):
+            registry.steps(0)
+
+    def test_defaults_equal_ease(self):
+        x = np.linspace(0, 1, 101)
+        tests = [
+            (registry.back(mode='in'), Ease.in_back),
+            (registry.back(mode='out'), Ease.out_back),
+            (registry.back(mode='in_out'), Ease.in_out_back),
+            (registry.elastic(mode='in'), Ease.in_elastic),
+            (registry.elastic(mode='out'), Ease.out_elastic),
+            (registry.elastic(mode='in_out'), Ease.in_out_elastic),
+        ]
+
+        for func, expect_func in tests:
+            with self.subTest(func.__name__):
+                expect = [expect_func(t) for t in x]
+                np.testing.assert_allclose([func(t) for t in x], expect, rtol=0, atol=1e-12)
+                np.testing.assert_allclose(func.vec(x), expect, rtol=0, atol=1e-12)
+
+    def test_parameters(self):
+        self.assertLess(min(registry.back(3.0)(t) for t in np.linspace(0, 1, 101)),
+                        min(registry.back(1.0)(t) for t in np.linspace(0, 1, 101)))
+        self.assertNotAlmostEqual(registry.elastic(0.5, 'out')(0.2), Ease.out_elastic(0.2))
+        self.assertEqual(registry.elastic(0.5, 'out')(1.0), 1.0)
+
+        with self.assertRaises(ValueError):
+            registry.back(mode='sideways')
+
+        with self.assertRaises(ValueError):
+            registry.elastic(0)
+
+
+class TestGetEase(unittest.TestCase):
+    """tests for registry.get_ease, parse and register
+    """
+
+    def test_ease_names(self):
+        self.assertIs(registry.get_ease('out_cubic'), Ease.out_cubic)
+        self.assertIs(registry.get_vec_ease(Ease.out_cubic), Ease.vec.out_cubic)
+
+        with self.assertRaises(AttributeError):
+            registry.get_ease('vec')
+
+        with self.assertRaises(AttributeError):
+            registry.get_ease('not_exist')
+
+    def test_parse(self):
+        self.assertIs(registry.get_ease('cubic-bezier(0.25, 0.1, 0.25, 1)'), registry.cubic_bezier(0.25, 0.1, 0.25, 1))
+        self.assertIs(registry.get_ease('steps(4, start)'), registry.steps(4, 'start'))
+        self.assertIs(registry.get_ease('out_back(2.5)'), registry.back(2.5, 'out'))
+        self.assertIs(registry.get_ease('in_out_elastic(0.6)'), registry.elastic(0.6, 'in_out'))
+        self.assertIsNone(registry.parse('unknown(1)'))
+
+        # the name builds the same function again
+        func = registry.get_ease('cubic-bezier(0.25, 0.1, 0.25, 1)')
+        self.assertIs(registry.get_ease(func.__name__), func)
+
+        # the parameters are not rounded in the names.
+        for func in [registry.back(2.123456789, 'out'), registry.elastic(1 / 3, 'in'),
+                     registry.cubic_bezier(0.123456789, 0.1, 0.25, 1.0)]:
+            with self.subTest(func.__name__):
+                self.assertIs(registry.get_ease(func.__name__), func)
+
+        self.assertEqual(registry.back(2.123456789, 'out').__name__, 'out_back(2.123456789)')
+
+    def test_register(self):
+        func = registry.register('smoothstep', lambda x: x * x * (3 - 2 * x))
+        self.addCleanup(registry.unregister, 'smoothstep')
+
+        self.assertIs(registry.get_ease('smoothstep'), func)
+        np.testing.assert_allclose(registry.get_vec_ease(func)(np.array([0.0, 0.5, 1.0])), [0.0, 0.5, 1.0])
+
+        with self.assertRaises(ValueError):
+            registry.register('linear', lambda x: x)
+
+
+class TestCombinators(unittest.TestCase):
+    """tests for registry.reverse, mirror, blend, piecewise, time_scale and clamp
+    """
+
+    def setUp(self):
+        self.x = np.linspace(0, 1, 1001)
+
+    def assert_same(self, func, expect):
+        scalars = [func(t) for t in self.x]
+        np.testing.assert_allclose(scalars, expect, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(func.vec(self.x), scalars, rtol=0, atol=1e-15)
+
+    def test_reverse(self):
+        self.assert_same(registry.reverse('out_bounce'), [Ease.in_bounce(t) for t in self.x])
+        self.assert_same(registry.reverse(Ease.in_quad), [Ease.out_quad(t) for t in self.x])
+
+    def test_mirror(self):
+        self.assert_same(registry.mirror('in_expo'), [Ease.in_out_expo(t) for t in self.x])
+        self.assert_same(registry.mirror('in_cubic'), [Ease.in_out_cubic(t) for t in self.x])
+
+    def test_blend(self):
+        func = registry.blend('linear', 'in_out_back', 0.7)
+        self.assert_same(func, [0.3 * t + 0.7 * Ease.in_out_back(t) for t in self.x])
+        self.assertEqual(func.__name__, 'blend(linear, in_out_back, 0.7)')
+
+    def test_piecewise(self):
+        func = registry.piecewise('in_quad', 'out_elastic')
+        expect = [Ease.in_quad(2 * t) / 2 if t < 0.5 else 0.5 + Ease.out_elastic(2 * t - 1) / 2 for t in self.x]
+        self.assert_same(func, expect)
+
+        func = registry.piecewise('in_quad', 'linear', breaks=[0.2])
+        self.assertAlmostEqual(func(0.1), 0.2 * Ease.in_quad(0.5))
+        self.assertAlmostEqual(func(0.6), 0.6)
+        self.assertEqual((func(0.0), func(1.0)), (0.0, 1.0))
+
+        with self.assertRaises(ValueError):
+            registry.piecewise('in_quad', 'linear', breaks=[0.5, 0.7])
+
+        with self.assertRaises(ValueError):
+            registry.piecewise('in_quad', 'linear', breaks=[1.0])
+
+        with self.assertRaises(ValueError):
+            registry.piecewise()
+
+    def test_time_scale(self):
+        func = registry.time_scale('in_quad', 0.2, 0.6)
+        self.assert_same(func, [Ease.in_quad(min(max((t - 0.2) / 0.4, 0.0), 1.0)) for t in self.x])
+
+        with self.assertRaises(ValueError):
+            registry.time_scale('in_quad', 0.6, 0.2)
+
+    def test_clamp(self):
+        func = registry.clamp('out_back')
+        self.assert_same(func, [min(Ease.out_back(t), 1.0) for t in self.x])
+
+        with self.assertRaises(ValueError):
+            registry.clamp('out_back', 1.0, 0.0)
+
+    def test_nested(self):
+        func = registry.clamp(registry.blend('in_elastic', registry.reverse('out_back(2.5)')), -0.1, 1.0)
+        inner = registry.back(2.5, 'in')
+        self.assert_same(func, [min(max((Ease.in_elastic(t) + inner(t)) / 2, -0.1), 1.0) for t in self.x])
+
+        # the name builds the same function again.
+        self.assertEqual(func.__name__, 'clamp(blend(in_elastic, reverse(out_back(2.5)), 0.5), -0.1, 1.0)')
+        self.assertIs(registry.get_ease(func.__name__), func)
+        self.assertIs(registry.get_ease('piecewise(in_quad, out_elastic, 0.5)'), registry.piecewise('in_quad', 'out_elastic'))
+
+        with self.assertRaises(AttributeError):
+            registry.reverse('not_exist')
+
+    def test_names_round_trip(self):
+        funcs = [
+            registry.piecewise('in_quad', 'linear', 'out_quad'),
+            registry.blend('linear', 'in_quad', 1 / 3),
+            registry.time_scale('in_quad', 1 / 3, 2 / 3),
+            registry.clamp('out_back', -1 / 3, 1.0),
+        ]
+        self.assertEqual(funcs[0].__name__, 'piecewise(in_quad, linear, out_quad, 0.3333333333333333, 0.6666666666666666)')
+
+        for func in funcs:
+            with self.subTest(func.__name__):
+                self.assertIs(registry.get_ease(func.__name__), func)
+
+    def test_call_with_array(self):
+        # numpy.ndarray is evaluated in one pass by vec.
+        x = np.linspace(0, 1, 11)
+        funcs = [
+            registry.cubic_bezier(0.25, 0.1, 0.25, 1.0), registry.back(2.0, 'in'), registry.steps(4),
+            registry.reverse('out_bounce'), registry.piecewise('in_quad', 'out_elastic'),
+        ]
+
+        for func in funcs:
+            with self.subTest(func.__name__):
+                np.testing.assert_array_equal(func(x), func.vec(x))
+                np.testing.assert_allclose(func(x), [func(t) for t in x], rtol=0, atol=1e-15)
+
+    def test_bake(self):
+        func = registry.blend('linear', 'in_out_back', 0.7)
+        lut = func.bake(4096, 'cubic')
+        self.assertIsInstance(lut, EaseLUT)
+        self.assertIs(lut.func, func)
+        self.assertLess(lut.max_error(), 1e-5)
+        np.testing.assert_allclose(lut(self.x), func.vec(self.x), atol=1e-5)
+
+    def test_tween(self):
+        tween = Tween(0, 100, 1, easing_type='mirror(in_expo)')
+        tween.start(now=0)
+        tween.update(now=0.25)
+        self.assertAlmostEqual(tween.next_pos, 100 * Ease.in_out_expo(0.25))
+
+        group = TweenGroup(np.zeros(2), np.full(2, 100.0), 1, easing_type=['reverse(out_bounce)', 'linear'])
+        group.start(now=0)
+        np.testing.assert_allclose(group.update(now=0.3)[:, 0], [100 * Ease.in_bounce(0.3), 30])
+
+
+class TestIntegration(unittest.TestCase):
+    """tests for the easings of the registry in Tween, TweenGroup and KeyframeTrack
+    """
+
+    def test_tween(self):
+        tween = Tween(0, 10, 1, easing_type='cubic-bezier(0.42, 0, 0.58, 1)')
+        self.assertIs(tween.ease, registry.cubic_bezier(0.42, 0, 0.58, 1))
+        self.assertIs(tween.get_vec_ease(), tween.ease.vec)
+
+        tween = Tween(0, 10, 1, easing_type=Ease.in_quad)
+        self.assertIs(tween.ease, Ease.in_quad)
+
+    def test_group(self):
+        names = ['steps(4)', 'linear', 'out_back(2.5)']
+        group = TweenGroup(np.zeros(3), np.ones(3), 1, easing_type=names)
+        group.start(now=0.0)
+        pos = group.update(now=0.3)
+        np.testing.assert_allclose(pos[:, 0], [0.25, 0.3, registry.back(2.5, 'out')(0.3)])
+
+        tweens = [Tween(0.0, 1.0, 1, easing_type=name) for name in names]
+        other = TweenGroup.from_tweens(tweens)
+        other.start(now=0.0)
+        np.testing.assert_array_equal(other.update(now=0.3), pos)
+
+    def test_same_name_as_ease(self):
+        # a custom function named like a function of the Ease class is not replaced by it.
+        def in_quad(x):
+            return x ** 3
+
+        self.assertIsNot(registry.get_vec_ease(in_quad), Ease.vec.in_quad)
+
+        tween = Tween(0.0, 1.0, 1, easing_type=in_quad)
+        tween.start(now=0)
+        tween.update(now=0.5)
+        self.assertEqual(tween.next_pos, 0.125)
+        np.testing.assert_allclose(tween.sample_at(np.array([0.5]))[:, 0], [0.125])
+
+        for backend in ('numpy', 'numba'):
+            with self.subTest(backend):
+                group = TweenGroup(np.zeros(2), np.ones(2), 1, easing_type=[in_quad, 'in_quad'], backend=backend)
+                group.start(now=0)
+                np.testing.assert_allclose(group.update(now=0.5)[:, 0], [0.125, 0.25])
+
+        reverse = registry.reverse(in_quad)
+        np.testing.assert_allclose(reverse.vec(np.array([0.5])), [reverse(0.5)])
+        track = KeyframeTrack([0, 1], [0.0, 1.0], [in_quad])
+        np.testing.assert_allclose(track.sample_many(np.array([0.5])), [0.125])
+
+    def test_keyframe(self):
+        track = KeyframeTrack([0, 1, 2], [0.0, 1.0, 2.0], ['steps(2)', 'linear'])
+        self.assertEqual(track.sample(0.6), 0.5)
+        np.testing.assert_allclose(track.sample_many(np.array([0.6, 1.5])), [0.5, 1.5])
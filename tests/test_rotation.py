@@ -0,0 +1,141 @@
+import unittest
+
+import numpy as np
+from panda3d.core import Quat
+
+from ..rotation import slerp, nlerp, RotationTween, RotationTweenGroup
+from ..ease import Ease
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_rotation -v
+
+
+def quat_from_hpr(h, p, r):
+    q = Quat()
+    q.set_hpr((h, p, r))
+    return q
+
+
+class TestSlerp(unittest.TestCase):
+    """tests for slerp and nlerp
+    """
+
+    def test_slerp(self):
+        q0 = np.array(quat_from_hpr(0, 0, 0))
+        q1 = np.array(quat_from_hpr(90, 0, 0))
+
+        for t in [0, 0.25, 0.5, 1]:
+            with self.subTest(t):
+                expect = np.array(quat_from_hpr(90 * t, 0, 0))
+                np.testing.assert_allclose(slerp(q0, q1, t), expect, atol=1e-6)
+
+    def test_shorter_way(self):
+        q0 = np.array(quat_from_hpr(0, 0, 0))
+        q1 = -np.array(quat_from_hpr(90, 0, 0))
+
+        for func in [slerp, nlerp]:
+            with self.subTest(func.__name__):
+                q = func(q0, q1, 0.5)
+                self.assertGreater(abs(np.dot(q, np.array(quat_from_hpr(45, 0, 0)))), 1 - 1e-6)
+
+    def test_same_quats(self):
+        q = np.array(quat_from_hpr(30, 20, 10))
+        np.testing.assert_allclose(slerp(q, q, 0.3), q, atol=1e-12)
+
+    def test_batch(self):
+        rng = np.random.default_rng(0)
+        q0 = rng.normal(size=(100, 4))
+        q1 = rng.normal(size=(100, 4))
+        q0 /= np.linalg.norm(q0, axis=1, keepdims=True)
+        q1 /= np.linalg.norm(q1, axis=1, keepdims=True)
+        t = rng.random(100)
+
+        for func in [slerp, nlerp]:
+            with self.subTest(func.__name__):
+                result = func(q0, q1, t)
+                self.assertEqual(result.shape, (100, 4))
+                np.testing.assert_allclose(np.linalg.norm(result, axis=1), 1)
+                np.testing.assert_allclose(result[7], func(q0[7], q1[7], t[7]))
+
+    def test_constant_speed(self):
+        q0 = np.array(quat_from_hpr(0, 0, 0))
+        q1 = np.array(quat_from_hpr(150, 40, 0))
+        qs = slerp(q0, q1, np.linspace(0, 1, 11))
+        angles = np.arccos(np.clip(np.abs(np.sum(qs[1:] * qs[:-1], axis=1)), -1, 1))
+
+        np.testing.assert_allclose(angles, angles[0])
+
+
+class TestRotationTween(unittest.TestCase):
+    """tests for RotationTween
+    """
+
+    def test_update(self):
+        start = quat_from_hpr(0, 0, 0)
+        end = quat_from_hpr(90, 0, 0)
+
+        for mode in ['slerp', 'nlerp']:
+            with self.subTest(mode):
+                tween = RotationTween(start, end, 2, easing_type='in_quad', mode=mode)
+                tween.start(now=1000)
+                tween.update(now=1001)
+
+                self.assertIsInstance(tween.next_pos, Quat)
+                expect = quat_from_hpr(90 * Ease.in_quad(0.5), 0, 0) if mode == 'slerp' else \
+                    Quat(*nlerp(np.array(start), np.array(end), 0.25))
+                self.assertTrue(tween.next_pos.almost_equal(expect, 1e-5))
+
+    def test_yoyo_out(self):
+        out = np.zeros(4)
+        start = np.array(quat_from_hpr(0, 0, 0))
+        end = np.array(quat_from_hpr(0, 90, 0))
+        tween = RotationTween(start, end, 2, yoyo=True)
+        tween.start(now=1000)
+        tween.update(now=1002)
+        tween.update(now=1003, out=out)
+
+        self.assertIs(tween.next_pos, out)
+        np.testing.assert_allclose(out, np.array(quat_from_hpr(0, 45, 0)), atol=1e-6)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            RotationTween(Quat(), Quat(), 2, mode='test_mode')
+
+    def test_bake(self):
+        tween = RotationTween(quat_from_hpr(0, 0, 0), quat_from_hpr(90, 0, 0), 1)
+        baked = tween.bake(2)
+
+        self.assertEqual(baked.shape, (3, 4))
+        np.testing.assert_allclose(baked[1], np.array(quat_from_hpr(45, 0, 0)), atol=1e-6)
+
+
+class TestRotationTweenGroup(unittest.TestCase):
+    """tests for RotationTweenGroup
+    """
+
+    def test_update(self):
+        start = [quat_from_hpr(0, 0, 0), quat_from_hpr(0, 0, 0)]
+        end = [quat_from_hpr(90, 0, 0), quat_from_hpr(0, 0, 60)]
+        group = RotationTweenGroup(start, end, [2, 1], yoyo=[False, True])
+        group.start(now=1000)
+        orientations = group.update(now=1001)
+
+        self.assertIs(orientations, group.orientations)
+        np.testing.assert_allclose(orientations[0], np.array(quat_from_hpr(45, 0, 0)), atol=1e-6)
+        np.testing.assert_allclose(orientations[1], np.array(quat_from_hpr(0, 0, 60)), atol=1e-6)
+
+        group.update(now=1001.5)
+        np.testing.assert_allclose(orientations[1], np.array(quat_from_hpr(0, 0, 30)), atol=1e-6)
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            RotationTweenGroup(np.zeros((3, 4)), np.zeros((3, 3)), 2)
+
+    def test_bake(self):
+        group = RotationTweenGroup(np.array([[1.0, 0, 0, 0]] * 2), [quat_from_hpr(90, 0, 0)] * 2, 1)
+        self.assertEqual(group.bake(4).shape, (5, 2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from .. import runner
+from ..runner import AsyncRunner, ticks
+from ..tween import Tween
+from ..clock import ManualClock
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_runner -v
+
+
+real_sleep = asyncio.sleep
+
+
+class SleepTestCase(unittest.TestCase):
+    """asyncio.sleep is replaced to advance the clock instead of waiting.
+    """
+
+    def setUp(self):
+        self.clock = ManualClock(100.0)
+        self.sleeps = []
+        # the time other tasks take in every frame
+        self.work = 0.0
+        # the time the event loop is blocked in the first frame
+        self.spike = 0.0
+
+        async def sleep(delay):
+            self.sleeps.append(delay)
+            self.clock.advance(delay + self.work + self.spike)
+            self.spike = 0.0
+            await real_sleep(0)
+
+        patcher = mock.patch.object(runner.asyncio, 'sleep', sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestTicks(SleepTestCase):
+    """tests for runner.ticks
+    """
+
+    async def collect(self, fps, n):
+        times = []
+
+        async for now in ticks(fps, self.clock):
+            times.append(now)
+
+            if len(times) == n:
+                break
+
+        return times
+
+    def test_pacing(self):
+        times = asyncio.run(self.collect(10, 5))
+        self.assertEqual([round(t - 100, 9) for t in times], [0.0, 0.1, 0.2, 0.3, 0.4])
+
+    def test_drift_correction(self):
+        # each sleep oversleeps by 0.01 seconds, which is subtracted from the next sleep.
+        self.work = 0.01
+        times = asyncio.run(self.collect(10, 5))
+        self.assertEqual([round(t - 100, 9) for t in times], [0.0, 0.11, 0.21, 0.31, 0.41])
+        self.assertAlmostEqual(self.sleeps[1], 0.09)
+
+    def test_late(self):
+        # the frames missed while the loop was blocked are not yielded one after another.
+        self.spike = 0.35
+        times = asyncio.run(self.collect(10, 4))
+        self.assertEqual([round(t - 100, 9) for t in times], [0.0, 0.45, 0.55, 0.65])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.collect(0, 1))
+
+
+class TestTweenStream(SleepTestCase):
+    """tests for Tween.stream and Tween.play
+    """
+
+    def test_stream(self):
+        async def main():
+            tween = Tween(0, 100, 1, delay=0.5, clock=self.clock)
+            return [pos async for pos in tween.stream(fps=4)]
+
+        self.assertEqual(asyncio.run(main()), [0, 0, 0, 25.0, 50.0, 75.0, 100.0])
+
+    def test_play(self):
+        async def main():
+            tween = Tween(0, 100, 1, yoyo=True, clock=self.clock)
+            self.assertIs(await tween.play(fps=8, loop=True, repeat=2), tween)
+            return tween
+
+        tween = asyncio.run(main())
+        self.assertFalse(tween.is_playing)
+        self.assertAlmostEqual(self.clock(), 104.0)
+
+
+class TestAsyncRunner(SleepTestCase):
+    """tests for AsyncRunner
+    """
+
+    def test_play(self):
+        async def main():
+            tween_runner = AsyncRunner(fps=8, clock=self.clock)
+            tweens = [Tween(0, 100, 1), Tween(0, 100, 2, delay=1)]
+            results = await asyncio.gather(*(tween_runner.play(t) for t in tweens))
+            self.assertEqual(results, tweens)
+            self.assertEqual(len(tween_runner), 0)
+            return tweens
+
+        tweens = asyncio.run(main())
+        self.assertEqual([t.next_pos for t in tweens], [100, 100])
+        self.assertAlmostEqual(self.clock(), 103.0)
+
+    def test_tween_play(self):
+        async def main():
+            tween_runner = AsyncRunner(fps=10, clock=self.clock)
+            on_complete = mock.MagicMock()
+            tween = Tween(0, 100, 1)
+            await tween.play(runner=tween_runner)
+            self.assertTrue(tween_runner.task.done())
+
+            # the task is started again when a tween is added.
+            tween_runner.add(Tween(0, 1, 1), on_complete=on_complete)
+            await tween_runner.task
+            on_complete.assert_called_once()
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
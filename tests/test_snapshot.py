@@ -0,0 +1,218 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from panda3d.core import Point3
+
+from .. import registry, snapshot
+from ..clock import ManualClock
+from ..group import TweenGroup
+from ..tween import Tween
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_snapshot -v
+
+
+class TestTweens(unittest.TestCase):
+    """tests for snapshot.dump_tweens, restore_tweens and load_tweens
+    """
+
+    def setUp(self):
+        self.clock = ManualClock(10.0)
+        self.tweens = [
+            Tween(0, 100, 1, yoyo=True, easing_type='out_back(2.5)', clock=self.clock),
+            Tween(Point3(0, 0, 0), Point3(1, 2, 3), 2, easing_type='in_quad', clock=self.clock),
+            Tween(np.zeros(2), np.ones(2), 1, delay=0.5, clock=self.clock),
+            Tween(0, 1, 1, clock=self.clock),
+        ]
+
+        for tween in self.tweens[:3]:
+            tween.loop(3)
+
+        self.clock.advance(1.25)
+
+        for tween in self.tweens:
+            tween.update()
+
+        self.tweens[2].pause()
+
+    def test_dump(self):
+        records = snapshot.dump_tweens(self.tweens)
+        self.assertEqual(records.dtype, snapshot.STATE_DTYPE)
+        self.assertEqual(records['dim'].tolist(), [0, 3, 2, 0])
+        self.assertEqual(records['easing'].tolist(), [b'out_back(2.5)', b'in_quad', b'linear', b'linear'])
+        np.testing.assert_array_equal(records['end'][:2], [[0, 0, 0, 0], [1, 2, 3, 0]])
+        np.testing.assert_array_equal(records['start_time'][:3], [0, -1.25, 0])
+        np.testing.assert_array_equal(records['pause_start_time'][2], 0)
+        self.assertTrue(np.isnan(records['start_time'][3]))
+        self.assertTrue(np.isnan(records['pause_start_time'][0]))
+        self.assertEqual(records['is_turning_back'].tolist(), [True, False, False, False])
+        self.assertEqual(records['repeat'].tolist(), [3, 3, 3, 0])
+
+    def test_load(self):
+        records = snapshot.dump_tweens(self.tweens)
+        clock = ManualClock(500.0)
+        tweens = snapshot.load_tweens(records, clock=clock)
+        self.assertEqual(tweens[0].ease.__name__, 'out_back(2.5)')
+        self.assertEqual(tweens[0].next_pos, self.tweens[0].next_pos)
+        self.assertIsNone(tweens[3].start_time)
+        self.assertIsNone(tweens[3].repeat)
+
+        # the steps do not hit the ends of the passes, where the rounding errors of the times could change the pass.
+        for _ in range(100):
+            self.clock.advance(0.07)
+            clock.advance(0.07)
+
+            for expect, tween in zip(self.tweens, tweens):
+                expect.update()
+                tween.update()
+                np.testing.assert_allclose(np.ravel(tween.next_pos), np.ravel(expect.next_pos), atol=1e-9)
+                self.assertEqual(tween.is_playing, expect.is_playing)
+
+        self.assertFalse(tweens[0].is_playing)
+        tweens[2].resume()
+        self.tweens[2].resume()
+        self.clock.advance(0.3)
+        clock.advance(0.3)
+        tweens[2].update()
+        self.tweens[2].update()
+        np.testing.assert_allclose(tweens[2].next_pos, self.tweens[2].next_pos, atol=1e-9)
+
+    def test_parametric_names(self):
+        # the names keep the parameters exact, so the same functions are built again.
+        tweens = [
+            Tween(0, 1, 1, easing_type='out_back(2.123456789)', clock=self.clock),
+            Tween(0, 1, 1, easing_type=registry.piecewise('in_quad', 'linear', 'out_quad'), clock=self.clock),
+            Tween(0, 1, 1, easing_type=registry.blend('linear', 'in_quad', 1 / 3), clock=self.clock),
+        ]
+        loaded = snapshot.load_tweens(snapshot.dump_tweens(tweens), clock=self.clock)
+
+        for expect, tween in zip(tweens, loaded):
+            with self.subTest(expect.ease.__name__):
+                self.assertIs(tween.ease, expect.ease)
+
+    def test_restore(self):
+        records = snapshot.dump_tweens(self.tweens)
+        tweens = [
+            Tween(0, 1, 1, easing_type='out_back(2.5)'),
+            Tween(Point3(), Point3(), 1, easing_type='in_quad'),
+            Tween(np.zeros(2), np.zeros(2), 1),
+            Tween(0, 1, 1),
+        ]
+        snapshot.restore_tweens(records, tweens, epoch=10.0 + 1.25)
+
+        # the types of the endpoints are kept.
+        self.assertIsInstance(tweens[1].start_pt, Point3)
+        self.assertEqual(tweens[1].end_pt, Point3(1, 2, 3))
+        self.assertEqual((tweens[0].start_pt, tweens[0].end_pt), (100, 0))
+        self.assertEqual((tweens[0]._start_pt, tweens[0]._end_pt), (0, 100))
+
+        for expect, tween in zip(self.tweens, tweens):
+            for attr in ('start_time', 'pause_start_time', 'step', 'repeat', 'repeat_cnt', 'is_playing', 'is_paused'):
+                self.assertEqual(getattr(tween, attr), getattr(expect, attr))
+
+        with self.assertRaises(ValueError):
+            snapshot.restore_tweens(records, tweens[:2])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            snapshot.dump_tweens([Tween(np.zeros(5), np.ones(5), 1)])
+
+        self.assertEqual(len(snapshot.dump_tweens([])), 0)
+
+
+class TestGroup(unittest.TestCase):
+    """tests for snapshot.dump_group, restore_group and load_group
+    """
+
+    def setUp(self):
+        self.clock = ManualClock(10.0)
+        self.group = TweenGroup(
+            np.zeros((4, 3)), np.arange(12, dtype=np.float64).reshape(4, 3), [1, 2, 0.5, 1],
+            delay=[0, 0.5, 0, 0.25], yoyo=[False, True, True, False],
+            easing_type=['in_quad', 'out_bounce', 'steps(4)', 'in_quad'], clock=self.clock
+        )
+        self.group.loop(2)
+        self.clock.advance(1.6)
+        self.group.update()
+        self.group.pause(index=[3])
+
+    def test_dump(self):
+        records = snapshot.dump_group(self.group)
+        self.assertEqual(records['dim'].tolist(), [3] * 4)
+        self.assertEqual(records['easing'].tolist(), [b'in_quad', b'out_bounce', b'steps(4)', b'in_quad'])
+        np.testing.assert_array_equal(records['start'][:, :3], self.group.start_pt)
+        np.testing.assert_array_equal(records['start'][:, 3], 0)
+        np.testing.assert_array_equal(records['start_time'], self.group.start_time - self.clock())
+        self.assertEqual(np.isnan(records['pause_start_time']).tolist(), [True, True, True, False])
+
+    def test_load(self):
+        records = snapshot.dump_group(self.group)
+        clock = ManualClock(500.0)
+        group = snapshot.load_group(records, clock=clock, backend='numpy')
+        np.testing.assert_array_equal(group.next_pos, self.group.next_pos)
+        np.testing.assert_array_equal(group.duration, self.group.duration)
+
+        for _ in range(100):
+            self.clock.advance(0.07)
+            clock.advance(0.07)
+            np.testing.assert_allclose(group.update(), self.group.update(), atol=1e-9)
+            np.testing.assert_array_equal(group.is_playing, self.group.is_playing)
+
+        group.resume()
+        self.group.resume()
+        self.clock.advance(0.3)
+        clock.advance(0.3)
+        np.testing.assert_allclose(group.update(), self.group.update(), atol=1e-9)
+
+    def test_parametric_names(self):
+        easings = ['out_back(2.123456789)', registry.piecewise('in_quad', 'linear', 'out_quad'), 'linear']
+        group = TweenGroup(np.zeros(3), np.ones(3), 1, easing_type=easings, clock=self.clock)
+        group.start()
+        self.clock.advance(0.4)
+        group.update()
+
+        loaded = snapshot.load_group(snapshot.dump_group(group), clock=self.clock)
+        self.assertEqual(loaded.ease_names, [registry.get_ease(e).__name__ for e in easings])
+        self.clock.advance(0.3)
+        np.testing.assert_array_equal(loaded.update(), group.update())
+
+    def test_restore(self):
+        records = snapshot.dump_group(self.group, epoch=0.0)
+        group = TweenGroup(np.zeros((4, 3)), np.zeros((4, 3)), 1, easing_type=['in_quad', 'out_bounce', 'steps(4)', 'in_quad'])
+        snapshot.restore_group(records, group, epoch=0.0)
+
+        for attr in ('start_pt', 'end_pt', 'delta', 'start_time', 'step', 'repeat', 'repeat_cnt',
+                     'is_playing', 'is_turning_back', 'is_paused'):
+            np.testing.assert_array_equal(getattr(group, attr), getattr(self.group, attr))
+
+        with self.assertRaises(ValueError):
+            snapshot.restore_group(records, TweenGroup(np.zeros((4, 2)), np.ones((4, 2)), 1))
+
+        with self.assertRaises(ValueError):
+            snapshot.restore_group(records[:2], group)
+
+    def test_save(self):
+        records = snapshot.dump_group(self.group)
+
+        with tempfile.TemporaryDirectory() as dir_name:
+            path = os.path.join(dir_name, 'state.npy')
+            snapshot.save(path, records)
+            loaded = snapshot.load(path, mmap_mode='r')
+            self.assertIsInstance(loaded, np.memmap)
+            self.assertEqual(loaded.tobytes(), records.tobytes())
+
+            group = snapshot.load_group(loaded, epoch=self.clock(), clock=self.clock)
+            np.testing.assert_array_equal(group.start_time, self.group.start_time)
+            del loaded
+
+            np.save(path, np.zeros(3))
+
+            with self.assertRaises(ValueError):
+                snapshot.load(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
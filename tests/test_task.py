@@ -0,0 +1,133 @@
+import unittest
+
+import numpy as np
+from direct.task.Task import TaskManager
+from panda3d.core import (ClockObject, Geom, GeomVertexArrayFormat, GeomVertexData, GeomVertexFormat,
+                          GeomVertexReader, NodePath, Point3)
+
+from ..group import TweenGroup
+from ..task import TweenTask, VertexColumnWriter
+from ..tween import Tween
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_task -v
+
+
+def read_column(vdata, column='vertex'):
+    reader = GeomVertexReader(vdata, column)
+    rows = []
+
+    while not reader.is_at_end():
+        rows.append(list(reader.get_data3()))
+
+    return np.array(rows)
+
+
+class TestVertexColumnWriter(unittest.TestCase):
+    """tests for VertexColumnWriter
+    """
+
+    def test_bulk(self):
+        vdata = GeomVertexData('points', GeomVertexFormat.get_v3c4(), Geom.UH_dynamic)
+        vdata.set_num_rows(4)
+        writer = VertexColumnWriter(vdata)
+        self.assertTrue(writer.bulk)
+
+        positions = np.arange(12, dtype=np.float64).reshape(4, 3)
+        writer.write(positions)
+        np.testing.assert_allclose(read_column(vdata), positions)
+
+    def test_rows_added(self):
+        vdata = GeomVertexData('points', GeomVertexFormat.get_v3(), Geom.UH_dynamic)
+        positions = np.arange(6, dtype=np.float64).reshape(2, 3)
+        VertexColumnWriter(vdata).write(positions)
+        np.testing.assert_allclose(read_column(vdata), positions)
+
+    def test_not_float32(self):
+        array_format = GeomVertexArrayFormat()
+        array_format.add_column('offset', 3, Geom.NT_float64, Geom.C_vector)
+        fmt = GeomVertexFormat.register_format(GeomVertexFormat(array_format))
+        vdata = GeomVertexData('points', fmt, Geom.UH_dynamic)
+        vdata.set_num_rows(2)
+
+        writer = VertexColumnWriter(vdata, 'offset')
+        self.assertFalse(writer.bulk)
+        positions = np.array([[0.1, 0.2, 0.3], [1, 2, 3]])
+        writer.write(positions)
+        np.testing.assert_allclose(read_column(vdata, 'offset'), positions)
+
+    def test_no_column(self):
+        vdata = GeomVertexData('points', GeomVertexFormat.get_v3(), Geom.UH_dynamic)
+
+        with self.assertRaises(ValueError):
+            VertexColumnWriter(vdata, 'color')
+
+
+class TestTweenTask(unittest.TestCase):
+    """tests for TweenTask
+    """
+
+    def setUp(self):
+        self.clock = ClockObject(ClockObject.M_slave)
+        self.clock.set_frame_time(10.0)
+        self.task_mgr = TaskManager()
+        self.task_mgr.setClock(self.clock)
+        self.tween_task = TweenTask(self.task_mgr, self.clock)
+        self.addCleanup(self.tween_task.stop)
+
+    def step(self, frame_time):
+        self.clock.set_frame_time(frame_time)
+        self.task_mgr.step()
+
+    def test_task(self):
+        self.tween_task.start()
+        self.assertEqual(len(self.task_mgr.getTasksNamed('pytweener')), 1)
+
+        self.tween_task.stop()
+        self.assertEqual(len(self.task_mgr.getTasksNamed('pytweener')), 0)
+
+    def test_nodes(self):
+        node = NodePath('node')
+        tween = self.tween_task.add(Tween(Point3(0, 0, 0), Point3(10, 20, 30), 2), node)
+        scaled = NodePath('scaled')
+        self.tween_task.add(Tween(Point3(1, 1, 1), Point3(3, 3, 3), 1, delay=1), scaled, 'set_scale')
+        self.tween_task.start()
+
+        self.step(11.0)
+        self.assertTrue(node.get_pos().almost_equal(Point3(5, 10, 15)))
+        self.assertTrue(scaled.get_scale().almost_equal(Point3(1, 1, 1)))
+
+        self.step(12.5)
+        self.assertTrue(node.get_pos().almost_equal(Point3(10, 20, 30)))
+        self.assertTrue(scaled.get_scale().almost_equal(Point3(3, 3, 3)))
+        self.assertNotIn(tween, self.tween_task.manager)
+        self.assertEqual(self.tween_task.setters, {})
+
+    def test_group(self):
+        nodes = [NodePath(f'node{i}') for i in range(3)]
+        vdata = GeomVertexData('points', GeomVertexFormat.get_v3(), Geom.UH_dynamic)
+        vdata.set_num_rows(3)
+        group = TweenGroup(np.zeros((3, 3)), np.array([[2, 0, 0], [0, 4, 0], [0, 0, 6]]), 2)
+
+        self.tween_task.add_group(group, nodes=nodes, vdata=vdata)
+        self.tween_task.start()
+        self.step(11.0)
+
+        expect = np.array([[1, 0, 0], [0, 2, 0], [0, 0, 3]])
+        np.testing.assert_allclose([list(node.get_pos()) for node in nodes], expect)
+        np.testing.assert_allclose(read_column(vdata), expect)
+
+        self.step(12.0)
+        self.assertEqual(self.tween_task.groups, [])
+        np.testing.assert_allclose(read_column(vdata), expect * 2)
+
+    def test_group_nodes_mismatch(self):
+        group = TweenGroup(np.zeros((3, 3)), np.ones((3, 3)), 2)
+
+        with self.assertRaises(ValueError):
+            self.tween_task.add_group(group, nodes=[NodePath('node')])
+
+
+if __name__ == '__main__':
+    unittest.main()
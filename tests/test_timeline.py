@@ -0,0 +1,102 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ..timeline import count_cycles, progress_at, frame_count, frame_times, BakedTrack
+
+
+# In the upper directory of pytweener, run the test with the following command.
+# python -m unittest pytweener.tests.test_timeline -v
+
+
+class TestCountCycles(unittest.TestCase):
+
+    def test_count_cycles(self):
+        tests = [
+            [False, None, 1],
+            [False, 3, 1],
+            [True, 3, 3],
+            [True, None, math.inf],
+            [True, 0, math.inf]
+        ]
+
+        for loop, repeat, expect in tests:
+            with self.subTest((loop, repeat)):
+                self.assertEqual(count_cycles(loop, repeat), expect)
+
+
+class TestProgressAt(unittest.TestCase):
+
+    def test_not_yoyo(self):
+        t = np.array([0, 0.5, 1, 2, 3, 4, 5, 6, 7])
+        step, backward, cycle = progress_at(t, 2, delay=1, cycles=2)
+
+        np.testing.assert_array_equal(step, [0, 0, 0, 0.5, 1, 0.5, 1, 1, 1])
+        np.testing.assert_array_equal(backward, [False] * 9)
+        np.testing.assert_array_equal(cycle, [0, 0, 0, 0, 0, 1, 1, 1, 1])
+
+    def test_yoyo(self):
+        t = np.array([0, 1, 2, 3, 4, 5, 6, 9])
+        step, backward, cycle = progress_at(t, 2, yoyo=True, cycles=math.inf)
+
+        np.testing.assert_array_equal(step, [0, 0.5, 1, 0.5, 1, 0.5, 1, 0.5])
+        np.testing.assert_array_equal(backward, [False, False, False, True, True, False, False, False])
+        np.testing.assert_array_equal(cycle, [0, 0, 0, 0, 0, 1, 1, 2])
+
+    def test_broadcast(self):
+        t = np.array([0, 1, 2])[:, None]
+        step, backward, _ = progress_at(t, np.array([1, 2]), yoyo=np.array([True, False]))
+
+        self.assertEqual(step.shape, (3, 2))
+        np.testing.assert_array_equal(step, [[0, 0], [1, 0.5], [1, 1]])
+        np.testing.assert_array_equal(backward[:, 0], [False, False, True])
+
+
+class TestFrameTimes(unittest.TestCase):
+
+    def test_frame_times(self):
+        np.testing.assert_array_equal(frame_times(4, 1), [0, 0.25, 0.5, 0.75, 1])
+        self.assertEqual(frame_times(3, 1.1)[-1], 4 / 3)
+
+    def test_frame_count(self):
+        self.assertEqual(frame_count(4, 1), 5)
+        self.assertEqual(frame_count(3, 1.1), 5)
+        self.assertEqual(frame_count(60, math.inf), math.inf)
+
+    def test_endless(self):
+        with self.assertRaises(ValueError):
+            frame_times(60, math.inf)
+
+
+class TestBakedTrack(unittest.TestCase):
+
+    def test_frame_at(self):
+        track = BakedTrack(np.arange(10).reshape(5, 2), 2)
+        self.assertEqual(track.duration, 2)
+        np.testing.assert_array_equal(track.frame_at(0.6), [2, 3])
+        np.testing.assert_array_equal(track.frame_at(-1), [0, 1])
+        np.testing.assert_array_equal(track.frame_at(10), [8, 9])
+
+    def test_save_load(self):
+        frames = np.random.default_rng(0).random((100, 3))
+        track = BakedTrack(frames, 60)
+
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, 'track.npy')
+            track.save(path)
+
+            loaded = BakedTrack.load(path, 60)
+            self.assertIsInstance(loaded.frames, np.memmap)
+            np.testing.assert_array_equal(loaded.frames, frames)
+            del loaded
+
+            loaded = BakedTrack.load(path, 60, mmap=False)
+            self.assertNotIsInstance(loaded.frames, np.memmap)
+            np.testing.assert_array_equal(loaded.frames, frames)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
+import itertools
 import sys
+import tracemalloc
 import unittest
 from unittest import mock
 from io import StringIO
@@ -8,6 +10,7 @@ from panda3d.core import Vec2, Vec3, Point2, Point3
 
 from ..tween import Tween
 from ..ease import Ease
+from ..clock import ManualClock
 
 
 # In the upper directory of pytweener, run the test with the following command.
@@ -38,6 +41,20 @@ class TestGetEaseFunc(unittest.TestCase):
         self.assertEqual(self.capture.getvalue(), '')
 
 
+class TestSlots(unittest.TestCase):
+    """tests for Tween.__slots__
+    """
+
+    def test_slots(self):
+        tween = Tween(0, 1, 2, easing_type='in_sine')
+        self.assertFalse(hasattr(tween, '__dict__'))
+
+        # all the attributes are set up front.
+        for name in Tween.__slots__:
+            with self.subTest(name):
+                self.assertTrue(hasattr(tween, name))
+
+
 class TestSetup(unittest.TestCase):
     """tests for Tween.setup
     """
@@ -47,7 +64,7 @@ class TestSetup(unittest.TestCase):
         self.assertFalse(tween.is_playing)
 
         with mock.patch('pytweener.tween.time') as mock_time:
-            mock_time.time.return_value = 1000
+            mock_time.perf_counter.return_value = 1000
             tween.setup(True, 3)
 
             self.assertTrue(tween.do_loop)
@@ -74,7 +91,7 @@ class TestStart(unittest.TestCase):
         tween.is_playing = False
 
         tween.start()
-        mock_setup.assert_called_once_with(False, None)
+        mock_setup.assert_called_once_with(False, None, None)
 
 
 @mock.patch('pytweener.tween.Tween.setup')
@@ -94,7 +111,7 @@ class TestLoop(unittest.TestCase):
         tween.is_playing = False
 
         tween.loop(3)
-        mock_setup.assert_called_once_with(True, 3)
+        mock_setup.assert_called_once_with(True, 3, None)
 
 
 class TestPause(unittest.TestCase):
@@ -114,7 +131,7 @@ class TestPause(unittest.TestCase):
         self.assertFalse(tween.is_paused)
 
         with mock.patch('pytweener.tween.time') as mock_time:
-            mock_time.time.return_value = 1000
+            mock_time.perf_counter.return_value = 1000
             tween.pause()
 
         self.assertTrue(tween.is_paused)
@@ -143,7 +160,7 @@ class TestResume(unittest.TestCase):
         tween.pause_start_time = 120
         tween.start_time = 100
 
-        mock_time.time.return_value = 160
+        mock_time.perf_counter.return_value = 160
         tween.resume()
 
         self.assertEqual(tween.start_time, 140)
@@ -189,10 +206,12 @@ class TestTurn(unittest.TestCase):
         tween = Tween(0, 1, 2, easing_type='in_sine')
         self.assertEqual(tween.start_pt, 0)
         self.assertEqual(tween.end_pt, 1)
+        self.assertEqual(tween.delta, 1)
 
         tween.turn()
         self.assertEqual(tween.start_pt, 1)
         self.assertEqual(tween.end_pt, 0)
+        self.assertEqual(tween.delta, -1)
 
 
 class TestTurnBack(unittest.TestCase):
@@ -268,7 +287,7 @@ class TestUpdate(unittest.TestCase):
 
         for start, end, expect in tests:
             with self.subTest((start, end)):
-                mock_time.time.return_value = 1001
+                mock_time.perf_counter.return_value = 1001
 
                 tween = Tween(0, 100, 2, easing_type='linear')
                 tween.is_playing = True
@@ -299,7 +318,7 @@ class TestUpdate(unittest.TestCase):
                 # the default value of is_tcurnint_back is False.
                 self.assertFalse(tween.is_turning_back)
 
-                mock_time.time.return_value = 1002
+                mock_time.perf_counter.return_value = 1002
                 tween.update()
 
                 self.assertTrue(tween.is_turning_back)
@@ -319,7 +338,7 @@ class TestUpdate(unittest.TestCase):
         tween.is_turning_back = True
         tween.do_loop = False
 
-        mock_time.time.return_value = 1002
+        mock_time.perf_counter.return_value = 1002
         tween.update()
 
         self.assertFalse(tween.is_turning_back)
@@ -336,7 +355,7 @@ class TestUpdate(unittest.TestCase):
         tween.is_turning_back = True
         tween.do_loop = True
 
-        mock_time.time.return_value = 1002
+        mock_time.perf_counter.return_value = 1002
         tween.update()
 
         self.assertFalse(tween.is_turning_back)
@@ -352,7 +371,7 @@ class TestUpdate(unittest.TestCase):
         tween.start_time = 1000
         tween.do_loop = False
 
-        mock_time.time.return_value = 1002
+        mock_time.perf_counter.return_value = 1002
         tween.update()
 
         self.assertFalse(tween.is_playing)
@@ -367,7 +386,7 @@ class TestUpdate(unittest.TestCase):
         tween.start_time = 1000
         tween.do_loop = True
 
-        mock_time.time.return_value = 1002
+        mock_time.perf_counter.return_value = 1002
         tween.update()
 
         self.assertTrue(tween.is_playing)
@@ -375,6 +394,42 @@ class TestUpdate(unittest.TestCase):
         mock_continue.assert_called_once()
 
 
+class TestUpdateOut(unittest.TestCase):
+    """tests for Tween.update with out
+    """
+
+    def test_update_out(self):
+        tests = [
+            [np.array([0, 0, 0]), np.array([100, 100, 100]), np.zeros(3), np.array([50, 50, 50])],
+            [Point3(0, 0, 0), Point3(100, 100, 100), Point3(), Point3(50, 50, 50)],
+            [Vec2(0, 0), Vec2(100, 100), Vec2(), Vec2(50, 50)]
+        ]
+
+        for start, end, out, expect in tests:
+            with self.subTest((start, end)):
+                tween = Tween(start, end, 2, easing_type='linear')
+                tween.start(now=1000)
+                tween.update(now=1001, out=out)
+
+                self.assertIs(tween.next_pos, out)
+
+                if isinstance(expect, np.ndarray):
+                    np.testing.assert_array_equal(out, expect)
+                else:
+                    self.assertEqual(out, expect)
+
+    def test_update_out_turn(self):
+        out = Point3()
+        tween = Tween(Point3(0, 0, 0), Point3(100, 100, 100), 2, yoyo=True, easing_type='linear')
+        tween.start(now=1000)
+        tween.update(now=1002, out=out)
+        self.assertEqual(out, Point3(100, 100, 100))
+
+        tween.update(now=1003, out=out)
+        self.assertEqual(out, Point3(50, 50, 50))
+        self.assertEqual(tween.start_pt, Point3(100, 100, 100))
+
+
 @mock.patch('pytweener.tween.Tween.setup')
 class TestDelayStart(unittest.TestCase):
     """tests for Tween.delay_start
@@ -385,7 +440,7 @@ class TestDelayStart(unittest.TestCase):
             with self.subTest(elapsed):
                 tween = Tween(0, 100, 2, delay=0.5, easing_type='linear')
                 tween.delay_start(elapsed)
-                mock_setup.assert_called_once_with(False, None)
+                mock_setup.assert_called_once_with(False, None, None)
                 mock_setup.reset_mock()
 
     def test_not_delay_start(self, mock_setup):
@@ -394,4 +449,220 @@ class TestDelayStart(unittest.TestCase):
                 tween = Tween(0, 100, 2, delay=0.5, easing_type='linear')
                 tween.delay_start(elapsed)
                 mock_setup.assert_not_called()
-                mock_setup.reset_mock()
\ No newline at end of file
+                mock_setup.reset_mock()
+
+
+class TestClock(unittest.TestCase):
+    """tests for the clock and the timestamp passed to Tween
+    """
+
+    def test_manual_clock(self):
+        clock = ManualClock(100, step=0.5)
+        tween = Tween(0, 100, 2, easing_type='linear', clock=clock)
+        tween.start()
+        self.assertEqual(tween.start_time, 100)
+
+        clock.tick()
+        tween.update()
+        self.assertEqual(tween.next_pos, 25)
+
+        clock.advance(0.5)
+        tween.pause()
+        clock.set(110)
+        tween.resume()
+        self.assertEqual(tween.start_time, 109)
+
+    @mock.patch('pytweener.tween.time')
+    def test_now(self, mock_time):
+        tween = Tween(0, 100, 2, easing_type='linear', clock=ManualClock(0))
+        tween.start(now=1000)
+        tween.update(now=1001)
+        tween.pause(now=1001)
+        tween.resume(now=1003)
+
+        self.assertEqual(tween.next_pos, 50)
+        self.assertEqual(tween.start_time, 1002)
+        mock_time.perf_counter.assert_not_called()
+
+    @mock.patch('pytweener.tween.time')
+    def test_default_clock(self, mock_time):
+        mock_time.perf_counter.return_value = 1000
+        tween = Tween(0, 100, 2, easing_type='linear')
+        tween.start()
+
+        self.assertEqual(tween.start_time, 1000)
+        mock_time.time.assert_not_called()
+
+
+class TestBake(unittest.TestCase):
+    """tests for Tween.bake
+    """
+
+    def simulate(self, tween, fps, n, do_loop=False, repeat=None):
+        tween.delay_start(0)
+        tween.setup(do_loop, repeat, now=tween.delay)
+        positions = [np.ravel(tween._start_pt) for _ in range(int(tween.delay * fps))]
+
+        for i in range(len(positions), n):
+            tween.update(now=i / fps)
+            positions.append(np.ravel(tween.next_pos))
+
+        return np.array(positions, dtype=np.float64)
+
+    def test_bake(self):
+        tests = [
+            [0, 100, dict(), dict()],
+            [np.array([0, 0]), np.array([10, 20]), dict(yoyo=True), dict()],
+            [Point3(0, 0, 0), Point3(1, 2, 3), dict(delay=0.5), dict(loop=True, repeat=3)],
+            [Point3(0, 0, 0), Point3(1, 2, 3), dict(delay=1, yoyo=True), dict(loop=True, repeat=2)],
+        ]
+
+        for start, end, kwargs, bake_kwargs in tests:
+            with self.subTest((kwargs, bake_kwargs)):
+                tween = Tween(start, end, 2, easing_type='in_out_back', **kwargs)
+                baked = tween.bake(4, **bake_kwargs)
+
+                tween = Tween(start, end, 2, easing_type='in_out_back', **kwargs)
+                expect = self.simulate(tween, 4, len(baked), bake_kwargs.get('loop', False), bake_kwargs.get('repeat'))
+
+                self.assertEqual(baked.shape, (len(expect), np.size(start)))
+                # Panda3D vectors are computed in single precision.
+                np.testing.assert_allclose(baked, expect, rtol=0, atol=1e-6)
+                self.assertFalse(tween.is_playing)
+
+    def test_bake_endless(self):
+        tween = Tween(0, 100, 2)
+
+        with self.assertRaises(ValueError):
+            tween.bake(60, loop=True)
+
+
+class TestSeek(unittest.TestCase):
+    """tests for Tween.seek and Tween.sample_at
+    """
+
+    def play(self, kwargs, do_loop, repeat):
+        tween = Tween(np.array([0.0, 0.0]), np.array([10.0, 20.0]), 1, easing_type='in_out_quad', **kwargs)
+        tween.setup(do_loop, repeat, now=0.0)
+        return tween
+
+    def test_seek(self):
+        tests = [
+            [dict(), False, None],
+            [dict(yoyo=True), False, None],
+            [dict(), True, 3],
+            [dict(yoyo=True), True, 2],
+            [dict(yoyo=True), True, None],
+        ]
+        fps = 8
+
+        for kwargs, do_loop, repeat in tests:
+            for frame in [0, 3, 8, 12, 16, 21, 40, 100]:
+                with self.subTest((kwargs, do_loop, repeat, frame)):
+                    expect = self.play(kwargs, do_loop, repeat)
+
+                    for i in range(1, frame + 1):
+                        expect.update(now=i / fps)
+
+                    tween = self.play(kwargs, do_loop, repeat)
+                    tween.seek(frame / fps, now=frame / fps)
+
+                    self.assertEqual(tween.is_playing, expect.is_playing)
+                    self.assertEqual(tween.is_turning_back, expect.is_turning_back)
+                    self.assertEqual(tween.repeat_cnt, expect.repeat_cnt)
+                    np.testing.assert_allclose(tween.start_pt, expect.start_pt)
+
+                    if frame:
+                        np.testing.assert_allclose(tween.next_pos, expect.next_pos, atol=1e-12)
+
+                    # both continue in the same way after seek
+                    for i in range(frame + 1, frame + 13):
+                        tween.update(now=i / fps)
+                        expect.update(now=i / fps)
+                        np.testing.assert_allclose(tween.next_pos, expect.next_pos, atol=1e-12)
+                        self.assertEqual(tween.is_playing, expect.is_playing)
+
+    def test_seek_far(self):
+        tween = Tween(0.0, 100.0, 2, yoyo=True)
+        tween.loop(now=0.0)
+        # 10 minutes of an endless loop
+        self.assertAlmostEqual(tween.seek(603.0, now=603.0), 50.0)
+        self.assertTrue(tween.is_turning_back)
+        self.assertTrue(tween.is_playing)
+
+    def test_seek_backward(self):
+        tween = Tween(0.0, 100.0, 2)
+        tween.start(now=0.0)
+        tween.update(now=3.0)
+        self.assertFalse(tween.is_playing)
+
+        self.assertEqual(tween.seek(1.0, now=10.0), 50.0)
+        self.assertTrue(tween.is_playing)
+        tween.update(now=10.5)
+        self.assertEqual(tween.next_pos, 75.0)
+
+    def test_seek_paused(self):
+        tween = Tween(0.0, 100.0, 2)
+        tween.start(now=0.0)
+        tween.pause(now=0.5)
+        self.assertEqual(tween.seek(1.0, now=5.0), 50.0)
+
+        tween.resume(now=7.0)
+        tween.update(now=7.5)
+        self.assertEqual(tween.next_pos, 75.0)
+
+    def test_seek_out(self):
+        tween = Tween(Point3(0, 0, 0), Point3(2, 4, 6), 2)
+        out = Point3()
+        self.assertIs(tween.seek(1.0, now=0.0, out=out), out)
+        self.assertTrue(out.almost_equal(Point3(1, 2, 3)))
+
+    def test_sample_at(self):
+        tween = Tween(0, 100, 2, delay=0.5, yoyo=True, easing_type='out_quad')
+        baked = tween.bake(4, loop=True, repeat=2)
+        times = np.arange(len(baked)) / 4
+
+        np.testing.assert_array_equal(tween.sample_at(times, loop=True, repeat=2), baked)
+        np.testing.assert_array_equal(tween.sample_at(times[5], loop=True, repeat=2), baked[5])
+        self.assertFalse(tween.is_playing)
+
+
+class TestIterFrames(unittest.TestCase):
+    """tests for Tween.iter_chunks and Tween.iter_frames
+    """
+
+    def test_same_as_bake(self):
+        tween = Tween(Point3(0, 0, 0), Point3(1, 2, 3), 2, delay=0.5, yoyo=True, easing_type='in_out_back')
+        baked = tween.bake(30, loop=True, repeat=3)
+        chunks = list(tween.iter_chunks(30, 100, loop=True, repeat=3))
+
+        self.assertEqual([len(c) for c in chunks], [100, 100, 100, 76])
+        self.assertEqual(chunks[0].shape, (100, 3))
+        np.testing.assert_array_equal(np.concatenate(chunks), baked)
+        np.testing.assert_array_equal(list(tween.iter_frames(30, loop=True, repeat=3, chunk_size=7)), baked)
+        self.assertFalse(tween.is_playing)
+
+    def test_endless(self):
+        tween = Tween(0, 100, 1, yoyo=True)
+        frames = list(itertools.islice(tween.iter_frames(4, loop=True), 20))
+        np.testing.assert_array_equal(np.ravel(frames[:9]), [0, 25, 50, 75, 100, 75, 50, 25, 0])
+        np.testing.assert_array_equal(frames[8:17], frames[:9])
+
+    def test_constant_memory(self):
+        tween = Tween(np.zeros(3), np.ones(3), 1, yoyo=True)
+        tracemalloc.start()
+
+        try:
+            # 100000 frames of 3 values would take 2.4 MB if baked.
+            for _ in tween.iter_chunks(60, 1000, loop=True, repeat=1000):
+                pass
+
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak, 500000)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(Tween(0, 100, 1).iter_chunks(60, 0))
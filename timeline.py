@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+
+
+def count_cycles(loop, repeat):
+    """Return the number of passes that an animation plays;
+       a pass is going to the end point, or going and coming back if yoyo is true.
+    """
+    if not loop:
+        return 1
+
+    if repeat:
+        return repeat
+
+    return math.inf
+
+
+def progress_at(t, duration, delay=0, yoyo=False, cycles=1):
+    """Map times since the start of animations to their progress.
+       All the arguments are broadcast against each other.
+        Args:
+            t (float or numpy.ndarray): the time since start() was called; specify in seconds.
+            duration (float or numpy.ndarray): the time that a pass takes to go to the end point; specify in seconds.
+            delay (float or numpy.ndarray): start delay time.
+            yoyo (bool or numpy.ndarray): If true, a pass goes to the end point and comes back.
+            cycles (int or float): the number of passes; math.inf for an endless loop.
+        Returns:
+            step (numpy.ndarray): the absolute progress in the bounds of 0 to 1.
+            backward (numpy.ndarray): True where the animation is coming back from the end point.
+            cycle (numpy.ndarray): the index of the current pass.
+    """
+    duration = np.asarray(duration, dtype=np.float64)
+    yoyo = np.asarray(yoyo, dtype=bool)
+    cycle_len = np.where(yoyo, 2 * duration, duration)
+
+    t = np.clip(np.asarray(t, dtype=np.float64) - delay, 0.0, cycle_len * cycles)
+    cycle = np.maximum(np.ceil(t / cycle_len) - 1, 0.0)
+    u = t - cycle * cycle_len
+    backward = yoyo & (u > duration)
+
+    step = np.minimum(np.where(backward, u - duration, u) / duration, 1.0)
+    return step, backward, cycle.astype(np.int64)
+
+
+def interpolate(start, end, v, backward):
+    """Return the positions at the eased progress v; start and end are swapped where backward is true,
+       in the same way as Tween.turn.
+    """
+    v = np.asarray(v)[..., None]
+    delta = end - start
+    return np.where(np.asarray(backward)[..., None], -delta * v + end, delta * v + start)
+
+
+def frame_count(fps, total):
+    """Return the number of frames sampled at fps from 0 to total seconds, or math.inf for an endless loop;
+       the last frame is at or after total so that the final state is included.
+    """
+    if math.isinf(total):
+        return math.inf
+
+    return math.ceil(total * fps - 1e-9) + 1
+
+
+def frame_times(fps, total):
+    """Return the times of frames sampled at fps from 0 to total seconds, counted by frame_count.
+    """
+    if math.isinf(n := frame_count(fps, total)):
+        raise ValueError('an endless loop cannot be sampled; specify repeat.')
+
+    return np.arange(n) / fps
+
+
+class BakedTrack:
+    """A class to play back positions precomputed at a fixed frame rate.
+        Args:
+            frames (numpy.ndarray): the positions; shape (frames, ...).
+            fps (float): the frame rate at which frames were sampled.
+    """
+
+    def __init__(self, frames, fps):
+        self.frames = frames
+        self.fps = fps
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duration(self):
+        return (len(self.frames) - 1) / self.fps
+
+    def frame_at(self, t):
+        """Return the position at t seconds; after the last frame, the last position is returned.
+        """
+        i = min(max(int(t * self.fps), 0), len(self.frames) - 1)
+        return self.frames[i]
+
+    def save(self, path):
+        np.save(path, self.frames)
+
+    @classmethod
+    def load(cls, path, fps, mmap=True):
+        """Load the frames saved by save; if mmap is true, the file is memory-mapped read-only,
+           so that a long track is not read into memory at once.
+        """
+        frames = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(frames, fps)
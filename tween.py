@@ -1,5 +1,13 @@
+import math
 import time
+
+import numpy as np
+
+from . import registry
 from .ease import Ease
+from .lut import EaseLUT
+from .runner import ticks
+from .timeline import count_cycles, frame_count, frame_times, interpolate, progress_at
 
 
 class Tween:
@@ -14,13 +22,25 @@ class Tween:
             duration (int): The time that an animation takes to complete; specify in seconds.
             delay (float): start delay time
             yoyo (bool): If true, go to the end point and come back, if false, just go to the end point; default is false.
-            easing_type (string): the function name defined in the Ease class; default is linear.
+            easing_type (string or callable):
+                the function name defined in the Ease class, a name registered in registry,
+                a parametric easing such as 'cubic-bezier(0.25, 0.1, 0.25, 1)', or a function; default is linear.
+            lut (int): If specified, the easing function is evaluated by a lookup table with this number of samples.
+            clock (callable): returns the current time in seconds; default is time.perf_counter.
     """
 
-    def __init__(self, start, end, duration, delay=0, yoyo=False, easing_type='linear'):
+    __slots__ = (
+        'start_pt', 'end_pt', '_start_pt', '_end_pt', 'delta', 'duration', 'delay', 'yoyo',
+        'is_playing', 'is_turning_back', 'is_paused', 'pause_start_time', 'do_finish',
+        'do_loop', 'repeat', 'repeat_cnt', 'start_time', 'step', 'next_pos', 'ease', 'clock'
+    )
+
+    def __init__(self, start, end, duration, delay=0, yoyo=False, easing_type='linear', lut=None, clock=None):
         self.start_pt = start
         self.end_pt = end
         self._start_pt = start
+        self._end_pt = end
+        self.delta = end - start
         self.duration = duration * 1000
         self.delay = delay
         self.yoyo = yoyo
@@ -30,45 +50,75 @@ class Tween:
         self.is_paused = False
         self.pause_start_time = None
         self.do_finish = False
+        self.do_loop = False
+        self.repeat = None
+        self.repeat_cnt = 0
+        self.start_time = None
+        self.step = 0.0
+        self.next_pos = start
+        self.clock = clock
 
         self.ease = self.get_ease_func(easing_type)
 
+        if lut:
+            self.ease = EaseLUT(self.ease, lut)
+
     def get_ease_func(self, easing_type):
         try:
-            ease_func = getattr(Ease, easing_type)
-        except AttributeError:
+            ease_func = registry.get_ease(easing_type)
+        except (AttributeError, TypeError, ValueError):
             print(f'not applicable: {easing_type}')
             ease_func = Ease.linear
 
         return ease_func
 
-    def setup(self, do_loop, repeat):
+    def get_time(self, now=None):
+        """Return now if specified, otherwise read the current time from the clock.
+           Pass the same now to every tween to update them with one timestamp per frame.
+        """
+        if now is not None:
+            return now
+
+        if self.clock is None:
+            return time.perf_counter()
+
+        return self.clock()
+
+    def get_vec_ease(self):
+        """Return the easing function for numpy.ndarray corresponding to self.ease.
+        """
+        if isinstance(self.ease, EaseLUT):
+            return self.ease
+
+        return registry.get_vec_ease(self.ease)
+
+    def setup(self, do_loop, repeat, now=None):
         self.do_loop = do_loop
         self.repeat = repeat
         self.repeat_cnt = 0
-        self.start_time = time.time()
+        self.start_time = self.get_time(now)
         self.is_playing = True
 
-    def start(self):
+    def start(self, now=None):
         if not self.is_playing:
-            self.setup(False, None)
+            self.setup(False, None, now)
 
-    def delay_start(self, elapsed):
+    def delay_start(self, elapsed, now=None):
         if elapsed >= self.delay:
-            self.start()
+            self.start(now)
 
-    def loop(self, repeat=None):
+    def loop(self, repeat=None, now=None):
         if not self.is_playing:
-            self.setup(True, repeat)
+            self.setup(True, repeat, now)
 
-    def pause(self):
+    def pause(self, now=None):
         if not self.is_paused:
             self.is_paused = True
-            self.pause_start_time = time.time()
+            self.pause_start_time = self.get_time(now)
 
-    def resume(self):
+    def resume(self, now=None):
         if self.is_paused:
-            pause_duration = time.time() - self.pause_start_time
+            pause_duration = self.get_time(now) - self.pause_start_time
             self.start_time += pause_duration
             self.is_paused = False
 
@@ -78,20 +128,43 @@ class Tween:
 
     def turn(self):
         self.start_pt, self.end_pt = self.end_pt, self.start_pt
+        self.delta = self.end_pt - self.start_pt
 
-    def turn_back(self):
+    def turn_back(self, now=None):
         self.turn()
-        self.start()
+        self.start(now)
+
+    def interpolate(self, v, out=None):
+        """Return the position at the eased progress v.
+           If out is specified, the position is written into out without creating new objects;
+           out must be numpy.ndarray or a Panda3D vector such as Point3.
+        """
+        if out is None:
+            return self.delta * v + self.start_pt
+
+        if isinstance(out, np.ndarray):
+            np.multiply(self.delta, v, out=out)
+            np.add(out, self.start_pt, out=out)
+        else:
+            out.assign(self.delta)
+            out *= v
+            out += self.start_pt
 
-    def update(self):
+        return out
+
+    def update(self, now=None, out=None):
+        """Args:
+            now (float): the current time in seconds; if not specified, read from the clock.
+            out (numpy.ndarray or Point3 etc.): If specified, the next position is written into it in place,
+                and next_pos refers to it.
+        """
         if self.is_playing and not self.is_paused:
-            current_time = time.time()
+            current_time = self.get_time(now)
             elapsed = (current_time - self.start_time) * 1000  # ms
             self.step = min(elapsed / self.duration, 1.0)
 
-            delta = self.end_pt - self.start_pt
             v = self.ease(self.step)
-            self.next_pos = delta * v + self.start_pt
+            self.next_pos = self.interpolate(v, out)
 
             if self.step == 1.0:
                 if self.yoyo:
@@ -122,4 +195,148 @@ class Tween:
             if self.repeat_cnt < self.repeat - 1:
                 self.repeat_cnt += 1
             else:
-                self.is_playing = False
\ No newline at end of file
+                self.is_playing = False
+
+    def seek(self, t, now=None, out=None):
+        """Jump to t seconds after start() was called and return the position there, in O(1) time
+           regardless of how many passes of yoyo and loop are skipped; the state becomes the same as
+           if update had been called every frame until then, and the animation continues from there.
+           If the animation is not playing, it is started with the loop and repeat set last.
+            Args:
+                t (float): the time since start() was called; specify in seconds.
+                now (float): the current time in seconds; if not specified, read from the clock.
+                out (numpy.ndarray or Point3 etc.): If specified, the position is written into it in place.
+        """
+        now = self.get_time(now)
+
+        if not self.is_playing:
+            self.setup(self.do_loop, self.repeat, now)
+
+        duration = self.duration / 1000
+        pass_len = duration * 2 if self.yoyo else duration
+        cycles = count_cycles(self.do_loop, self.repeat)
+        t = max(t, 0.0)
+        finished = t >= pass_len * cycles
+
+        if finished:
+            # the end of the last pass
+            cycle, backward, step = cycles - 1, self.yoyo, 1.0
+        else:
+            cycle = math.floor(t / pass_len)
+            u = t - cycle * pass_len
+            backward = self.yoyo and u >= duration
+            step = min((u - duration if backward else u) / duration, 1.0)
+
+        if self.repeat:
+            self.repeat_cnt = cycle
+
+        self.start_pt, self.end_pt = (self._end_pt, self._start_pt) if backward else (self._start_pt, self._end_pt)
+        self.delta = self.end_pt - self.start_pt
+        self.is_turning_back = backward
+        self.start_time = now - step * duration
+        v = self.ease(step)
+
+        if 0 < t and not finished and step == 0.0:
+            # just at the end of a pass, update returns the end position of the pass.
+            step = 1.0
+
+            if not self.yoyo:
+                v = self.ease(step)
+
+        self.next_pos = self.interpolate(v, out)
+        self.step = step
+
+        if self.is_paused:
+            self.pause_start_time = now
+
+        if finished:
+            if self.yoyo:
+                self.turn()
+                self.is_turning_back = False
+
+            self.is_playing = False
+
+        return self.next_pos
+
+    async def stream(self, fps=60, loop=False, repeat=None):
+        """Start the animation after its delay, and yield next_pos at fps until the animation is finished.
+           Frames are paced by asyncio.sleep, so the event loop can run other tasks in between.
+           The loop and repeat are specified in the same way as loop().
+        """
+        begin = None
+        started = False
+
+        async for now in ticks(fps, self.clock):
+            if begin is None:
+                begin = now
+
+            if not started and now - begin >= self.delay:
+                self.setup(loop, repeat, begin + self.delay)
+                started = True
+
+            if started:
+                self.update(now)
+
+            yield self.next_pos
+
+            if started and not self.is_playing:
+                break
+
+    async def play(self, fps=60, loop=False, repeat=None, runner=None):
+        """Play the animation to the end without blocking the event loop.
+           If runner, an AsyncRunner, is specified, the tween is updated by it with the other tweens.
+        """
+        if runner is not None:
+            return await runner.play(self, loop, repeat)
+
+        async for _ in self.stream(fps, loop, repeat):
+            pass
+
+        return self
+
+    def sample_at(self, t, loop=False, repeat=None):
+        """Return the positions at the times t without changing the state, as numpy.ndarray of shape
+           t.shape + (dim,); t is the time from the start including the delay, in the same way as bake.
+           Each time is computed in O(1) time. The loop and repeat are specified in the same way as loop().
+        """
+        start = np.array(self._start_pt, dtype=np.float64).reshape(-1)
+        end = np.array(self._end_pt, dtype=np.float64).reshape(-1)
+        step, backward, _ = progress_at(t, self.duration / 1000, self.delay, self.yoyo, count_cycles(loop, repeat))
+        v = self.get_vec_ease()(step)
+
+        return interpolate(start, end, v, backward)
+
+    def total_time(self, loop=False, repeat=None):
+        """Return the seconds from the start including the delay to the end; math.inf for an endless loop.
+        """
+        return self.delay + self.duration / 1000 * (2 if self.yoyo else 1) * count_cycles(loop, repeat)
+
+    def bake(self, fps, loop=False, repeat=None):
+        """Return all the positions of the animation sampled at fps as an array of shape (frames, dim),
+           from the start including the delay to the end.
+           The loop and repeat are specified in the same way as loop(); an endless loop cannot be baked.
+        """
+        return self.sample_at(frame_times(fps, self.total_time(loop, repeat)), loop, repeat)
+
+    def iter_chunks(self, fps, chunk_size=1024, loop=False, repeat=None):
+        """Yield the positions sampled at fps in the same way as bake, but lazily as arrays of shape
+           (chunk_size, dim), the last of which may be shorter, so that memory does not grow with the
+           length of the animation; an endless loop yields chunks endlessly.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be 1 or more: {chunk_size}')
+
+        n = frame_count(fps, self.total_time(loop, repeat))
+        begin = 0
+
+        while begin < n:
+            end = min(begin + chunk_size, n)
+            yield self.sample_at(np.arange(begin, end) / fps, loop, repeat)
+            begin = end
+
+    def iter_frames(self, fps, loop=False, repeat=None, chunk_size=1024):
+        """Yield the positions sampled at fps one by one as arrays of shape (dim,);
+           they are computed chunk by chunk by iter_chunks.
+        """
+        for chunk in self.iter_chunks(fps, chunk_size, loop, repeat):
+            yield from chunk